@@ -0,0 +1,3 @@
+"""
+ベンチマーク - ゲームエンジンの処理時間の計測
+"""
@@ -0,0 +1,311 @@
+"""
+Engine Benchmarks - 盤面処理のホットパスの計測と基準値との比較
+
+使い方:
+    python -m benchmarks.engine_benchmarks --output results.json
+    python -m benchmarks.engine_benchmarks --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from time import perf_counter_ns
+
+from benchmarks.fixtures import FIXTURES, build_playfield
+from src.bitboard_playfield import BitboardPlayField
+from src.playfield import PlayField
+from src.puyo import Puyo
+from src.puyo_manager import PuyoManager
+from src.puyo_pair import PuyoPair
+from src.score_manager import ScoreManager
+
+
+RESULT_SCHEMA = 1
+DEFAULT_THRESHOLD = 0.2  # 基準値からこの割合以上遅くなったら劣化とみなす
+
+
+class BenchmarkCase:
+    """
+    ベンチマークケース - 準備・計測対象・計測前のリセット処理の組
+    """
+    
+    def __init__(self, name, setup, run, reset=None):
+        """
+        ベンチマークケースの初期化
+        
+        Args:
+            name (str): ケース名
+            setup (callable): setup() -> state 計測前に1回だけ呼ばれる
+            run (callable): run(state) 計測対象の処理
+            reset (callable, optional): reset(state) 毎回の計測前に呼ばれる（計測時間に含めない）
+        """
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.reset = reset
+
+
+def _invalidate_groups(playfield):
+    """
+    連結グループのキャッシュを破棄する（毎回ラベル付けからやり直す計測用）
+    """
+    playfield._groups = None
+
+
+def _undo_to_mark(state):
+    # state は (playfield, mark, ...) の形
+    state[0].undo(state[1])
+
+
+def _undo_to_mark_cold(state):
+    # 盤面を戻した上で連結グループのキャッシュも破棄する
+    _undo_to_mark(state)
+    _invalidate_groups(state[0])
+
+
+def _with_undo(playfield):
+    return playfield, playfield.mark_undo()
+
+
+def _floating_playfield(rows, playfield_class=PlayField):
+    """
+    最初に消えるグループを消去した直後（浮いたぷよがある）の盤面を作成
+    """
+    playfield = build_playfield(rows, playfield_class)
+    groups = playfield.find_erasable_groups()
+    if not groups:
+        # 消えるグループがない盤面は下から2段目を抜いて浮かせる
+        groups = [[(x, playfield.height - 2) for x in range(playfield.width)]]
+    playfield.erase_puyo_groups(groups)
+    return playfield
+
+
+def _groups_to_erase(playfield):
+    """
+    消去処理の計測用に消去するグループ（消えるグループがなければ大きい順に3つ）
+    """
+    groups = playfield.find_erasable_groups()
+    if groups:
+        return groups
+    return sorted(playfield.find_connected_groups(), key=len, reverse=True)[:3]
+
+
+def build_cases():
+    """
+    全てのベンチマークケースを作成
+    
+    Returns:
+        list: [BenchmarkCase, ...]
+    """
+    cases = []
+    for fixture_name, fixture in FIXTURES.items():
+        rows = fixture()
+        for label, playfield_class in (('', PlayField), ('bitboard.', BitboardPlayField)):
+            cases.append(BenchmarkCase(
+                f"{label}find_connected_groups[{fixture_name}]",
+                lambda rows=rows, cls=playfield_class: build_playfield(rows, cls),
+                lambda playfield: playfield.find_connected_groups(),
+                _invalidate_groups,
+            ))
+            cases.append(BenchmarkCase(
+                f"{label}find_erasable_groups[{fixture_name}]",
+                lambda rows=rows, cls=playfield_class: build_playfield(rows, cls),
+                lambda playfield: playfield.find_erasable_groups(),
+                _invalidate_groups,
+            ))
+            cases.append(BenchmarkCase(
+                f"{label}resolve_chain[{fixture_name}]",
+                lambda rows=rows, cls=playfield_class: _with_undo(build_playfield(rows, cls)) + (ScoreManager(),),
+                lambda state: state[0].resolve_chain(state[2]),
+                _undo_to_mark_cold,
+            ))
+        
+        cases.append(BenchmarkCase(
+            f"apply_gravity[{fixture_name}]",
+            lambda rows=rows: _with_undo(_floating_playfield(rows)),
+            lambda state: state[0].apply_gravity(),
+            _undo_to_mark,
+        ))
+        cases.append(BenchmarkCase(
+            f"erase_puyo_groups[{fixture_name}]",
+            lambda rows=rows: _erase_setup(rows),
+            lambda state: state[0].erase_puyo_groups(state[2]),
+            _undo_to_mark,
+        ))
+        cases.append(BenchmarkCase(
+            f"try_rotate_with_kick[{fixture_name}]",
+            lambda rows=rows: (build_playfield(rows), PuyoPair(Puyo(1), Puyo(2), 0, 0)),
+            lambda state: state[0].try_rotate_with_kick(state[1], True),
+            _reset_pair,
+        ))
+    
+    cases.append(BenchmarkCase(
+        "generate_random_color",
+        lambda: PuyoManager(seed=1),
+        lambda manager: manager.generate_random_color(),
+    ))
+    cases.append(BenchmarkCase(
+        "draw_colors[1000]",
+        lambda: PuyoManager(seed=1),
+        lambda manager: manager.draw_colors(1000),
+    ))
+    return cases
+
+
+def _erase_setup(rows):
+    playfield = build_playfield(rows)
+    groups = _groups_to_erase(playfield)
+    return playfield, playfield.mark_undo(), groups
+
+
+def _reset_pair(state):
+    # 左壁際で下向きのペアを時計回りに回すと右へのキックが必要になる
+    pair = state[1]
+    pair.rotation = 2
+    pair.set_position(0, 0)
+
+
+def measure(case, repeat=5, min_time_ns=50000000):
+    """
+    ケースの1回あたりの処理時間を計測する
+    
+    Args:
+        case (BenchmarkCase): 計測するケース
+        repeat (int): 計測の繰り返し回数
+        min_time_ns (int): 1回の計測でかける最低時間（ナノ秒）
+    
+    Returns:
+        dict: {'min_ns', 'median_ns', 'loops', 'repeat'}
+    """
+    state = case.setup()
+    run = case.run
+    reset = case.reset
+    
+    def timed(loops):
+        if reset is None:
+            start = perf_counter_ns()
+            for _ in range(loops):
+                run(state)
+            return perf_counter_ns() - start
+        total = 0
+        for _ in range(loops):
+            reset(state)
+            start = perf_counter_ns()
+            run(state)
+            total += perf_counter_ns() - start
+        return total
+    
+    # 1回の計測がmin_time_ns以上になるまでループ回数を増やす
+    loops = 1
+    while True:
+        elapsed = timed(loops)
+        if elapsed >= min_time_ns or loops >= 1000000:
+            break
+        loops *= 10 if elapsed * 10 < min_time_ns else 2
+    
+    samples = [timed(loops) / loops for _ in range(repeat)]
+    return {
+        'min_ns': min(samples),
+        'median_ns': statistics.median(samples),
+        'loops': loops,
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(name_filter=None, repeat=5, min_time_ns=50000000, verbose=True):
+    """
+    ベンチマークを実行する
+    
+    Args:
+        name_filter (str, optional): ケース名にこの文字列を含むものだけを実行
+        repeat (int): 計測の繰り返し回数
+        min_time_ns (int): 1回の計測でかける最低時間（ナノ秒）
+        verbose (bool): 計測結果を表示する場合True
+    
+    Returns:
+        dict: 結果（JSONとして保存できる形式）
+    """
+    results = {}
+    for case in build_cases():
+        if name_filter and name_filter not in case.name:
+            continue
+        results[case.name] = measure(case, repeat, min_time_ns)
+        if verbose:
+            print(f"{case.name:<48}{results[case.name]['min_ns'] / 1000:12.2f} us")
+    return {
+        'schema': RESULT_SCHEMA,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    基準値と計測結果を比較する（最小値同士で比較）
+    
+    Args:
+        baseline (dict): 基準となる結果
+        current (dict): 今回の結果
+        threshold (float): 劣化とみなす遅くなった割合
+    
+    Returns:
+        list: [(ケース名, 基準値ns, 今回ns, 変化率, 劣化ならTrue), ...]（両方にあるケースのみ）
+    """
+    rows = []
+    baseline_results = baseline['results']
+    for name, result in current['results'].items():
+        if name not in baseline_results:
+            continue
+        before = baseline_results[name]['min_ns']
+        after = result['min_ns']
+        change = after / before - 1.0 if before else 0.0
+        rows.append((name, before, after, change, change > threshold))
+    return rows
+
+
+def main(argv=None):
+    """
+    コマンドラインから実行する
+    
+    Returns:
+        int: 終了コード（劣化があった場合は1）
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the puyo engine hot paths")
+    parser.add_argument('--output', help="write results as JSON to this path")
+    parser.add_argument('--compare', help="baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio flagged as a regression (default: %(default)s)")
+    parser.add_argument('--filter', help="only run cases whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="minimum seconds per measurement (default: %(default)s)")
+    args = parser.parse_args(argv)
+    
+    current = run_benchmarks(args.filter, args.repeat, int(args.min_time * 1e9))
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+    
+    if not args.compare:
+        return 0
+    
+    with open(args.compare, encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows = compare_results(baseline, current, args.threshold)
+    print(f"\n{'case':<48}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<48}{before / 1000:10.2f}us{after / 1000:10.2f}us{change:+9.1%}{flag}")
+    regressions = [row for row in rows if row[4]]
+    print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} in {len(rows)} compared case(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Benchmark Fixtures - シード固定で生成するベンチマーク用の盤面
+"""
+
+import random
+
+from src.playfield import PlayField
+from src.puyo import Puyo
+
+
+FIXTURE_SEED = 20240601
+COLORS = (1, 2, 3, 4)
+
+# 17連鎖する盤面（上の行から、'.'は空き）
+# 6×12（隠し段なし）では4個消しの連鎖は最大18連鎖で、19連鎖は作れないため、
+# 逆算による連鎖生成で得られた最も長い連鎖を使う
+DEEP_CHAIN_ROWS = (
+    '.2..3.',
+    '424332',
+    '121421',
+    '331121',
+    '314232',
+    '234211',
+    '341141',
+    '321242',
+    '121342',
+    '124332',
+    '314211',
+    '321432',
+)
+DEEP_CHAIN_LENGTH = 17
+
+
+def empty_rows(width=6, height=12):
+    """
+    空の盤面
+    
+    Returns:
+        tuple: 行ごとの文字列
+    """
+    return tuple('.' * width for _ in range(height))
+
+
+def half_full_rows(seed=FIXTURE_SEED, width=6, height=12):
+    """
+    下半分が埋まった消去可能なグループのない盤面
+    
+    Returns:
+        tuple: 行ごとの文字列
+    """
+    return _stable_rows([height // 2] * width, random.Random(seed), height)
+
+
+def near_death_rows(seed=FIXTURE_SEED, width=6, height=12):
+    """
+    上端まで残り2段の消去可能なグループのない盤面
+    
+    Returns:
+        tuple: 行ごとの文字列
+    """
+    return _stable_rows([height - 2] * width, random.Random(seed + 1), height)
+
+
+def deep_chain_rows():
+    """
+    連鎖の長い盤面（DEEP_CHAIN_LENGTH連鎖）
+    
+    Returns:
+        tuple: 行ごとの文字列
+    """
+    return DEEP_CHAIN_ROWS
+
+
+FIXTURES = {
+    'empty': empty_rows,
+    'half_full': half_full_rows,
+    'near_death': near_death_rows,
+    'deep_chain': deep_chain_rows,
+}
+
+
+def build_playfield(rows, playfield_class=PlayField):
+    """
+    行ごとの文字列からプレイフィールドを作成
+    
+    Args:
+        rows (sequence): 上の行からの文字列（数字が色コード、'.'は空き）
+        playfield_class (type): 作成するプレイフィールドのクラス
+    
+    Returns:
+        PlayField: 作成したプレイフィールド
+    """
+    playfield = playfield_class()
+    for y, row in enumerate(rows):
+        for x, cell in enumerate(row):
+            if cell != '.':
+                playfield.place_puyo(x, y, Puyo(int(cell)))
+    return playfield
+
+
+def playfield_to_rows(playfield):
+    """
+    プレイフィールドを行ごとの文字列に変換
+    
+    Args:
+        playfield (PlayField): 対象のプレイフィールド
+    
+    Returns:
+        tuple: 行ごとの文字列
+    """
+    return tuple(
+        ''.join(str(puyo.get_color()) if puyo is not None else '.' for puyo in row)
+        for row in playfield.grid
+    )
+
+
+def _stable_rows(heights, rng, height):
+    """
+    列ごとの高さまで、4つ以上つながらないように色を選んで積んだ盤面を作成
+    
+    Args:
+        heights (list): 列ごとの高さ
+        rng (random.Random): 乱数生成器
+        height (int): フィールドの高さ
+    
+    Returns:
+        tuple: 行ごとの文字列
+    """
+    width = len(heights)
+    grid = [[0] * width for _ in range(height)]
+    for x in range(width):
+        for y in range(height - 1, height - 1 - heights[x], -1):
+            colors = list(COLORS)
+            rng.shuffle(colors)
+            for color in colors:
+                grid[y][x] = color
+                if _group_size(grid, x, y) < 4:
+                    break
+            else:
+                raise ValueError("no color keeps the board stable")
+    return tuple(''.join(str(color) if color else '.' for color in row) for row in grid)
+
+
+def _group_size(grid, x, y):
+    """
+    指定位置の同色グループの大きさを数える
+    """
+    color = grid[y][x]
+    seen = {(x, y)}
+    stack = [(x, y)]
+    while stack:
+        cx, cy = stack.pop()
+        for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if (0 <= ny < len(grid) and 0 <= nx < len(grid[0]) and
+                    (nx, ny) not in seen and grid[ny][nx] == color):
+                seen.add((nx, ny))
+                stack.append((nx, ny))
+    return len(seen)
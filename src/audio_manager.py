@@ -3,7 +3,6 @@
 Requirements: 12.1 - AudioManagerクラスの実装
 """
 
-import pyxel
 from enum import Enum
 
 
@@ -0,0 +1,270 @@
+"""
+BatchPuyoEnv - NumPy配列で複数ゲームを同時に進めるバッチ環境
+Requirements: 2.5, 3.1, 3.2, 3.3, 3.4 - 配置・連結判定・消去・重力・スコア計算の一括処理
+"""
+
+import numpy as np
+
+from src.score_manager import ScoreManager
+
+
+class BatchPuyoEnv:
+    """
+    バッチ環境クラス - N個の盤面を (N, height, width) のuint8配列として保持する
+    
+    セルの値は色コード（0は空、1-4は通常ぷよ、5はお邪魔ぷよ）。
+    配置・連鎖解決はPlayField.resolve_chainと同じ順序（消去判定→重力→消去判定）で
+    全盤面に対する配列演算として行うため、Pythonのループ回数は盤面数に依存しない。
+    """
+    
+    OBSTACLE_COLOR = 5  # お邪魔ぷよの色コード
+    MIN_GROUP_SIZE = 4  # 消去に必要な連結数
+    
+    # 回転状態ごとのサブぷよのオフセット（PuyoPairと同じ 0: 上, 1: 右, 2: 下, 3: 左）
+    ROTATION_DX = np.array([0, 1, 0, -1])
+    ROTATION_DY = np.array([-1, 0, 1, 0])
+    
+    def __init__(self, batch_size, width=6, height=12, score_manager=None):
+        """
+        バッチ環境の初期化
+        
+        Args:
+            batch_size (int): 同時に進める盤面の数
+            width (int): フィールドの幅
+            height (int): フィールドの高さ
+            score_manager (ScoreManager, optional): スコア計算ルール（省略時は既定のルール）
+        """
+        self.batch_size = batch_size
+        self.width = width
+        self.height = height
+        self.score_manager = score_manager if score_manager is not None else ScoreManager()
+        
+        self.boards = np.zeros((batch_size, height, width), dtype=np.uint8)
+        self.scores = np.zeros(batch_size, dtype=np.int64)
+        self.done = np.zeros(batch_size, dtype=bool)
+        
+        # セルごとの識別番号（連結ラベルの初期値、0は空セル用）
+        self._cell_ids = np.arange(1, height * width + 1, dtype=np.int32).reshape(height, width)
+    
+    def reset(self, indices=None):
+        """
+        盤面・スコア・終了フラグをリセットする
+        
+        Args:
+            indices (array-like, optional): リセットする盤面の番号またはブールマスク（省略時は全盤面）
+        """
+        if indices is None:
+            indices = slice(None)
+        self.boards[indices] = 0
+        self.scores[indices] = 0
+        self.done[indices] = False
+    
+    def load_playfield(self, index, playfield):
+        """
+        PlayFieldの盤面を指定番号の盤面に読み込む
+        
+        Args:
+            index (int): 盤面の番号
+            playfield (PlayField): 読み込むプレイフィールド
+        """
+        for y in range(self.height):
+            for x in range(self.width):
+                puyo = playfield.get_puyo(x, y)
+                self.boards[index, y, x] = puyo.get_color() if puyo is not None else 0
+    
+    def get_column_tops(self, boards=None):
+        """
+        各列の最上段のぷよの行番号を取得（空の列はheight）
+        
+        Args:
+            boards (ndarray, optional): 対象の盤面（省略時は全盤面）
+        
+        Returns:
+            ndarray: (N, width) の行番号
+        """
+        if boards is None:
+            boards = self.boards
+        filled = boards != 0
+        return np.where(filled.any(axis=1), filled.argmax(axis=1), self.height)
+    
+    def place_pairs(self, columns, rotations, main_colors, sub_colors):
+        """
+        ぷよペアを各盤面に落下させて配置する
+        
+        ペアは回転状態を保ったまま、どちらかのぷよが接地するまで落下する
+        （横向きのペアは片方が浮いた状態で配置され、連鎖解決時の重力で落ちる）。
+        
+        Args:
+            columns (array-like): 各盤面のメインぷよの列
+            rotations (array-like): 各盤面の回転状態（0-3: 上、右、下、左）
+            main_colors (array-like): メインぷよの色
+            sub_colors (array-like): サブぷよの色
+        
+        Returns:
+            ndarray: 配置できた盤面のブールマスク（終了済み・範囲外・列が満杯の場合False）
+        """
+        columns = np.asarray(columns, dtype=np.int64)
+        rotations = np.asarray(rotations, dtype=np.int64) % 4
+        main_colors = np.asarray(main_colors, dtype=np.uint8)
+        sub_colors = np.asarray(sub_colors, dtype=np.uint8)
+        
+        sub_columns = columns + self.ROTATION_DX[rotations]
+        dy = self.ROTATION_DY[rotations]
+        
+        valid = ~self.done & (columns >= 0) & (columns < self.width)
+        valid &= (sub_columns >= 0) & (sub_columns < self.width)
+        
+        # 範囲外の列は参照用にクリップし、validで除外する
+        safe_columns = np.clip(columns, 0, self.width - 1)
+        safe_sub_columns = np.clip(sub_columns, 0, self.width - 1)
+        rows = np.arange(self.batch_size)
+        tops = self.get_column_tops()
+        
+        # メインぷよ・サブぷよの両方が空きセルに収まる最も低い位置
+        main_y = np.minimum(tops[rows, safe_columns] - 1, tops[rows, safe_sub_columns] - 1 - dy)
+        sub_y = main_y + dy
+        valid &= (main_y >= 0) & (sub_y >= 0)
+        
+        placed = np.flatnonzero(valid)
+        self.boards[placed, main_y[placed], safe_columns[placed]] = main_colors[placed]
+        self.boards[placed, sub_y[placed], safe_sub_columns[placed]] = sub_colors[placed]
+        return valid
+    
+    def find_erasable(self, boards):
+        """
+        消去されるセルと消去グループ数を計算する
+        
+        Args:
+            boards (ndarray): (M, height, width) の盤面
+        
+        Returns:
+            tuple: (erase_mask, cleared_counts, group_counts)
+                erase_mask (ndarray): 消去されるセル（隣接するお邪魔ぷよを含む）
+                cleared_counts (ndarray): 盤面ごとのグループ内のぷよ数の合計（スコア計算対象）
+                group_counts (ndarray): 盤面ごとの消去グループ数
+        """
+        count = boards.shape[0]
+        colored = (boards != 0) & (boards != self.OBSTACLE_COLOR)
+        
+        # 同色で隣接しているかどうか（下方向・右方向）
+        same_down = colored[:, :-1, :] & (boards[:, :-1, :] == boards[:, 1:, :])
+        same_right = colored[:, :, :-1] & (boards[:, :, :-1] == boards[:, :, 1:])
+        
+        # 同色の隣接セル間でラベルの最大値を伝播させ、収束したラベルをグループIDとする
+        labels = np.where(colored, self._cell_ids, 0)
+        while True:
+            propagated = labels.copy()
+            np.maximum(propagated[:, :-1, :], np.where(same_down, labels[:, 1:, :], 0), out=propagated[:, :-1, :])
+            np.maximum(propagated[:, 1:, :], np.where(same_down, labels[:, :-1, :], 0), out=propagated[:, 1:, :])
+            np.maximum(propagated[:, :, :-1], np.where(same_right, labels[:, :, 1:], 0), out=propagated[:, :, :-1])
+            np.maximum(propagated[:, :, 1:], np.where(same_right, labels[:, :, :-1], 0), out=propagated[:, :, 1:])
+            if np.array_equal(propagated, labels):
+                break
+            labels = propagated
+        
+        # 盤面ごとにラベルの出現数を数えてグループサイズを求める
+        cells = self.height * self.width + 1
+        keys = labels + (np.arange(count, dtype=np.int64) * cells)[:, None, None]
+        sizes = np.bincount(keys.ravel(), minlength=count * cells)
+        group_erase = colored & (sizes[keys] >= self.MIN_GROUP_SIZE)
+        
+        cleared_counts = group_erase.sum(axis=(1, 2))
+        # グループ内でラベルと自身の識別番号が一致するセルは1グループに1つだけ
+        group_counts = (group_erase & (labels == self._cell_ids)).sum(axis=(1, 2))
+        
+        # 消去するぷよに隣接するお邪魔ぷよも消去対象にする
+        adjacent = np.zeros_like(group_erase)
+        adjacent[:, :-1, :] |= group_erase[:, 1:, :]
+        adjacent[:, 1:, :] |= group_erase[:, :-1, :]
+        adjacent[:, :, :-1] |= group_erase[:, :, 1:]
+        adjacent[:, :, 1:] |= group_erase[:, :, :-1]
+        erase_mask = group_erase | (adjacent & (boards == self.OBSTACLE_COLOR))
+        
+        return erase_mask, cleared_counts, group_counts
+    
+    def apply_gravity(self, boards):
+        """
+        重力を適用して各列のぷよを下に詰める（PlayField.apply_gravityと同じ詰め方）
+        
+        Args:
+            boards (ndarray): (M, height, width) の盤面
+        
+        Returns:
+            tuple: (重力適用後の盤面, 盤面ごとにぷよが移動したかどうか)
+        """
+        # 空セルを上、ぷよを下に並べる安定ソートで列内の順序を保ったまま詰める
+        order = np.argsort(boards != 0, axis=1, kind='stable')
+        settled = np.take_along_axis(boards, order, axis=1)
+        moved = (settled != boards).any(axis=(1, 2))
+        return settled, moved
+    
+    def calculate_scores(self, cleared_counts, chain_levels, group_counts):
+        """
+        ScoreManager.calculate_chain_scoreと同じルールでスコアを計算する
+        
+        Args:
+            cleared_counts (ndarray): 消去されたぷよの数
+            chain_levels (ndarray): 連鎖レベル（1から開始）
+            group_counts (ndarray): 消去されたグループ数（色数としても使用）
+        
+        Returns:
+            ndarray: 盤面ごとのスコア
+        """
+        return self.score_manager.score_batch(cleared_counts, chain_levels, group_counts)
+    
+    def resolve_chains(self, mask=None):
+        """
+        連鎖を最後まで解決する（PlayField.resolve_chainのバッチ版）
+        
+        Args:
+            mask (ndarray, optional): 解決する盤面のブールマスク（省略時は全盤面）
+        
+        Returns:
+            tuple: (chain_counts, chain_scores)
+                chain_counts (ndarray): 盤面ごとの連鎖数
+                chain_scores (ndarray): 盤面ごとの獲得スコア
+        """
+        chain_counts = np.zeros(self.batch_size, dtype=np.int64)
+        chain_scores = np.zeros(self.batch_size, dtype=np.int64)
+        active = np.flatnonzero(mask) if mask is not None else np.arange(self.batch_size)
+        
+        while active.size:
+            boards = self.boards[active]
+            erase_mask, cleared_counts, group_counts = self.find_erasable(boards)
+            erased = cleared_counts > 0
+            
+            # 消去がある盤面は連鎖レベルを進めてスコアを加算
+            chain_counts[active] += erased
+            chain_scores[active] += self.calculate_scores(cleared_counts, chain_counts[active], group_counts)
+            boards[erase_mask] = 0
+            
+            # 消去の有無にかかわらず重力を適用し、何も変化しなければ安定
+            boards, moved = self.apply_gravity(boards)
+            self.boards[active] = boards
+            active = active[erased | moved]
+        
+        return chain_counts, chain_scores
+    
+    def step(self, columns, rotations, main_colors, sub_colors):
+        """
+        全盤面でぷよペアを配置し、連鎖を解決する
+        
+        Args:
+            columns (array-like): 各盤面のメインぷよの列
+            rotations (array-like): 各盤面の回転状態（0-3: 上、右、下、左）
+            main_colors (array-like): メインぷよの色
+            sub_colors (array-like): サブぷよの色
+        
+        Returns:
+            tuple: (rewards, chain_counts, done)
+                rewards (ndarray): このステップで獲得したスコア
+                chain_counts (ndarray): このステップの連鎖数
+                done (ndarray): ゲームオーバーになった盤面（終了済みを含む）
+        """
+        placed = self.place_pairs(columns, rotations, main_colors, sub_colors)
+        chain_counts, rewards = self.resolve_chains(placed)
+        self.scores += rewards
+        
+        # 配置できない、または上端にぷよが残った盤面はゲームオーバー
+        self.done |= ~placed | (self.boards[:, 0, :] != 0).any(axis=1)
+        return rewards, chain_counts, self.done.copy()
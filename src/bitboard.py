@@ -0,0 +1,235 @@
+"""
+BitBoard - 色ごとのビットマスクによるフィールド表現
+Requirements: 2.5, 3.1, 3.3 - 空き判定・連結判定・重力処理のビット演算化
+"""
+
+
+class BitBoard:
+    """
+    ビットボードクラス - 色（1-4）とお邪魔ぷよ（5）ごとに整数ビットマスクを持つ
+    
+    ビット配置は列優先で、セル(x, y)のビット番号は x * height + y（y=0が最上段）。
+    上下の隣接はビットシフト1、左右の隣接はビットシフトheightで表現できる。
+    """
+    
+    OBSTACLE_COLOR = 5  # お邪魔ぷよの色コード
+    MAX_COLOR = 5  # 扱う色コードの最大値
+    
+    def __init__(self, width=6, height=12):
+        """
+        ビットボードの初期化
+        
+        Args:
+            width (int): フィールドの幅
+            height (int): フィールドの高さ
+        """
+        self.width = width
+        self.height = height
+        
+        # 盤面全体と1列分のマスク
+        self.full_mask = (1 << (width * height)) - 1
+        self.column_mask = (1 << height) - 1
+        
+        # 上下シフトで列をまたがないためのマスク
+        top_row = 0
+        bottom_row = 0
+        for x in range(width):
+            top_row |= 1 << (x * height)
+            bottom_row |= 1 << (x * height + height - 1)
+        self.not_top_row = self.full_mask & ~top_row
+        self.not_bottom_row = self.full_mask & ~bottom_row
+        
+        # 色ごとのマスク（インデックス0は未使用）と占有マスク
+        self.masks = [0] * (self.MAX_COLOR + 1)
+        self.occupied = 0
+    
+    def bit(self, x, y):
+        """
+        指定セルのビットを取得
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+        
+        Returns:
+            int: セルに対応するビット
+        """
+        return 1 << (x * self.height + y)
+    
+    def is_empty(self, x, y):
+        """
+        指定セルが空かどうかをチェック
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+        
+        Returns:
+            bool: 空の場合True、範囲外または占有されている場合False
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return not (self.occupied >> (x * self.height + y)) & 1
+    
+    def get_color(self, x, y):
+        """
+        指定セルの色コードを取得
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+        
+        Returns:
+            int: 色コード（空の場合0）
+        """
+        bit = self.bit(x, y)
+        if not self.occupied & bit:
+            return 0
+        for color in range(1, self.MAX_COLOR + 1):
+            if self.masks[color] & bit:
+                return color
+        return 0
+    
+    def set_cell(self, x, y, color):
+        """
+        指定セルの色を設定する（0で空にする）
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+            color (int): 色コード（0は空）
+        """
+        bit = self.bit(x, y)
+        if self.occupied & bit:
+            for c in range(1, self.MAX_COLOR + 1):
+                self.masks[c] &= ~bit
+            self.occupied &= ~bit
+        if color:
+            self.masks[color] |= bit
+            self.occupied |= bit
+    
+    def clear(self):
+        """
+        全てのセルを空にする
+        """
+        self.masks = [0] * (self.MAX_COLOR + 1)
+        self.occupied = 0
+    
+    def neighbors(self, mask):
+        """
+        マスクの上下左右に隣接するセルのマスクを計算
+        
+        Args:
+            mask (int): 元のマスク
+        
+        Returns:
+            int: 隣接セルのマスク（元のマスクは含まない）
+        """
+        height = self.height
+        up = (mask & self.not_top_row) >> 1
+        down = (mask & self.not_bottom_row) << 1
+        left = mask >> height
+        right = (mask << height) & self.full_mask
+        return (up | down | left | right) & ~mask
+    
+    def flood(self, seed, region):
+        """
+        シードから領域内で連結しているセルを展開する
+        
+        Args:
+            seed (int): 開始セルのマスク
+            region (int): 展開可能な領域のマスク
+        
+        Returns:
+            int: 連結したセルのマスク
+        """
+        height = self.height
+        not_top_row = self.not_top_row
+        not_bottom_row = self.not_bottom_row
+        group = seed & region
+        while True:
+            # neighborsを展開したもの（領域でマスクするため盤面外へのはみ出しは落ちる）
+            grown = (group | ((group & not_top_row) >> 1) | ((group & not_bottom_row) << 1)
+                     | (group >> height) | (group << height)) & region
+            if grown == group:
+                return group
+            group = grown
+    
+    def find_groups(self, min_size=1, seeds=None):
+        """
+        同色連結グループを検出する（お邪魔ぷよは対象外）
+        
+        Args:
+            min_size (int): 返すグループの最小サイズ
+            seeds (int, optional): 指定した場合はこのマスクのセルを含むグループだけを返す
+        
+        Returns:
+            list: [(color, group_mask), ...] のリスト
+        """
+        groups = []
+        for color in range(1, self.OBSTACLE_COLOR):
+            remaining = self.masks[color]
+            # 同色の隣接セルを持つセルだけが2つ以上のグループに属する
+            paired = remaining & (((remaining & self.not_top_row) >> 1)
+                                  | ((remaining & self.not_bottom_row) << 1)
+                                  | (remaining >> self.height) | (remaining << self.height))
+            if min_size > 1:
+                remaining = paired
+            if seeds is not None:
+                # 前回から変化したセルを含むグループだけを探す
+                remaining &= seeds
+            while remaining:
+                seed = remaining & -remaining
+                group = self.flood(seed, paired) if seed & paired else seed
+                remaining &= ~group
+                if min_size <= 2 or self.popcount(group) >= min_size:
+                    groups.append((color, group))
+        return groups
+    
+    def mask_to_positions(self, mask):
+        """
+        マスクを座標リストに変換する
+        
+        Args:
+            mask (int): 変換するマスク
+        
+        Returns:
+            list: [(x, y), ...] 座標リスト
+        """
+        positions = []
+        height = self.height
+        while mask:
+            low = mask & -mask
+            x, y = divmod(low.bit_length() - 1, height)
+            positions.append((x, y))
+            mask ^= low
+        return positions
+    
+    def positions_to_mask(self, positions):
+        """
+        座標リストをマスクに変換する（範囲外の座標は無視）
+        
+        Args:
+            positions (iterable): [(x, y), ...] 座標
+        
+        Returns:
+            int: マスク
+        """
+        mask = 0
+        for x, y in positions:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                mask |= 1 << (x * self.height + y)
+        return mask
+    
+    @staticmethod
+    def popcount(mask):
+        """
+        立っているビット数を数える
+        
+        Args:
+            mask (int): マスク
+        
+        Returns:
+            int: ビット数
+        """
+        return bin(mask).count("1")
@@ -0,0 +1,419 @@
+"""
+BitboardPlayField - ビットボードをバックエンドに持つプレイフィールド
+Requirements: 2.5, 3.1, 3.3 - PlayFieldと同じAPIでの高速な盤面処理
+"""
+
+from src.bitboard import BitBoard
+from src.playfield import PlayField
+from src.zobrist import COLOR_SLOTS
+
+
+class BitboardPlayField(PlayField):
+    """
+    ビットボード版プレイフィールド - 公開メソッドはPlayFieldと同一
+    
+    ぷよオブジェクトはgridにも保持するため、get_puyoや描画はそのまま動作する。
+    盤面の索引はビットボードだけで、PlayFieldがセルの書き込みごとに更新する索引
+    （Zobristハッシュ・色コード列・列の占有ビット・連結グループ）は持たない。
+    それらを使うメソッドはビットボードから求める形で置き換える。
+    """
+    
+    def __init__(self, flyweight=False):
+        """
+        ビットボード版プレイフィールドの初期化
+        
+        Args:
+            flyweight (bool): PlayFieldと同じ（色ごとの共有ぷよを格納する）
+        """
+        super().__init__(flyweight)
+        self.bitboard = BitBoard(self.width, self.height)
+        
+        # PlayFieldの書き込みごとの索引は使わない（置き換え漏れがあれば例外になるようにする）
+        self.zobrist_hash = None
+        self._cells = None
+        self._column_bits = None
+        
+        # ビット番号 -> 行優先のセル番号（snapshotとハッシュの計算用）
+        self._bit_cells = [(bit % self.height) * self.width + bit // self.height
+                           for bit in range(self.width * self.height)]
+        self._hash_cache = (None, 0)  # (計算した時の色マスク, ハッシュ値)
+    
+    def _set_cell(self, x, y, puyo):
+        """
+        グリッドとビットボードのセルを書き換える（フィールドへの書き込みは全てここを通す）
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+            puyo (Puyo or None): 書き込むぷよ、または空にする場合None
+        """
+        row = self.grid[y]
+        old_puyo = row[x]
+        bitboard = self.bitboard
+        masks = bitboard.masks
+        bit = 1 << (x * self.height + y)
+        if old_puyo is not None:
+            masks[old_puyo.get_color()] &= ~bit
+        if puyo is not None:
+            masks[puyo.get_color()] |= bit
+            bitboard.occupied |= bit
+        else:
+            bitboard.occupied &= ~bit
+        if self._undo_log is not None:
+            self._undo_log.append((x, y, old_puyo))
+        row[x] = puyo
+    
+    def _column(self, x):
+        """
+        指定列の占有ビットを取得（ビットyが行yに対応）
+        
+        Args:
+            x (int): 列番号
+        
+        Returns:
+            int: 列の占有ビット
+        """
+        return (self.bitboard.occupied >> (x * self.height)) & self.bitboard.column_mask
+    
+    def snapshot(self):
+        """
+        盤面の色配置を不変なバイト列として取得（探索の分岐用）
+        
+        Returns:
+            bytes: 行優先の色コード列（0は空）
+        """
+        cells = bytearray(self.width * self.height)
+        bit_cells = self._bit_cells
+        masks = self.bitboard.masks
+        for color in range(1, BitBoard.MAX_COLOR + 1):
+            mask = masks[color]
+            while mask:
+                low = mask & -mask
+                cells[bit_cells[low.bit_length() - 1]] = color
+                mask ^= low
+        return bytes(cells)
+    
+    def get_hash(self):
+        """
+        盤面の64ビットZobristハッシュを取得（同じ配置なら手順によらず同じ値）
+        色マスクから計算し、盤面が変わるまでは前回の値を使う
+        
+        Returns:
+            int: 盤面のハッシュ値
+        """
+        masks = tuple(self.bitboard.masks)
+        cached_masks, value = self._hash_cache
+        if masks == cached_masks:
+            return value
+        
+        value = 0
+        table = self._zobrist_table
+        bit_cells = self._bit_cells
+        for color in range(1, BitBoard.MAX_COLOR + 1):
+            mask = masks[color]
+            while mask:
+                low = mask & -mask
+                value ^= table[bit_cells[low.bit_length() - 1] * COLOR_SLOTS + color]
+                mask ^= low
+        self._hash_cache = (masks, value)
+        return value
+    
+    def is_empty(self, x, y):
+        """
+        指定された位置が空かどうかをチェック
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+        
+        Returns:
+            bool: 空の場合True、範囲外または占有されている場合False
+        """
+        return self.bitboard.is_empty(x, y)
+    
+    def get_column_height(self, x):
+        """
+        指定列の高さ（最上段のぷよから底までの段数）を取得
+        
+        Args:
+            x (int): 列番号
+        
+        Returns:
+            int: 列の高さ（空の列は0）
+        """
+        bits = self._column(x)
+        return self.height - (bits & -bits).bit_length() + 1 if bits else 0
+    
+    def find_column_reaching_top(self):
+        """
+        上端（y=0）にぷよがある列を探す
+        
+        Returns:
+            int: 最初に見つかった列番号、ない場合-1
+        """
+        bitboard = self.bitboard
+        top = bitboard.occupied & ~bitboard.not_top_row
+        if not top:
+            return -1
+        return ((top & -top).bit_length() - 1) // self.height
+    
+    def count_puyos_in_top_rows(self, rows):
+        """
+        上から指定した行数以内にあるぷよの数を数える
+        
+        Args:
+            rows (int): 対象の行数
+        
+        Returns:
+            int: ぷよの数
+        """
+        rows_mask = 0
+        for x in range(self.width):
+            rows_mask |= ((1 << rows) - 1) << (x * self.height)
+        return BitBoard.popcount(self.bitboard.occupied & rows_mask & self.bitboard.full_mask)
+    
+    def drop_to_rest(self, column, y=0):
+        """
+        指定列の指定行から落としたぷよが止まる行を求める
+        
+        Args:
+            column (int): 列番号
+            y (int): 落下を開始する行
+        
+        Returns:
+            int: 停止する行（開始行より下で最初にぷよがある行の1つ上、なければ最下段）
+        """
+        below = self._column(column) >> (y + 1)
+        if not below:
+            return self.height - 1
+        return y + (below & -below).bit_length() - 1
+    
+    def _is_puyo_floating(self, x, y):
+        """
+        指定位置のぷよが浮いているかどうかをチェック
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+        
+        Returns:
+            bool: 浮いている場合True
+        """
+        if y == self.height - 1:
+            return False
+        return not self._column(x) >> (y + 1)
+    
+    def find_connected_groups(self):
+        """
+        同色で連結されたぷよのグループを検出する
+        
+        Returns:
+            list: [[(x, y), ...], ...] 連結グループのリスト
+        
+        Requirements: 3.1 - 同色ぷよの隣接判定と連結グループの検出
+        """
+        bitboard = self.bitboard
+        return [bitboard.mask_to_positions(group) for _, group in bitboard.find_groups()]
+    
+    def find_erasable_groups(self):
+        """
+        消去可能な連結グループ（4つ以上）を検出する
+        
+        Returns:
+            list: [[(x, y), ...], ...] 消去可能な連結グループのリスト
+        
+        Requirements: 3.1 - 4つ以上の連結グループの検出
+        """
+        bitboard = self.bitboard
+        return [bitboard.mask_to_positions(group) for _, group in bitboard.find_groups(min_size=4)]
+    
+    def count_connected_puyos(self, x, y):
+        """
+        指定位置から連結している同色ぷよの数を数える
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+        
+        Returns:
+            int: 連結している同色ぷよの数（自分を含む）
+        """
+        if not self.is_valid_position(x, y):
+            return 0
+        color = self.bitboard.get_color(x, y)
+        if color == 0 or color == BitBoard.OBSTACLE_COLOR:
+            return 0
+        group = self.bitboard.flood(self.bitboard.bit(x, y), self.bitboard.masks[color])
+        return BitBoard.popcount(group)
+    
+    def erase_puyo_groups(self, groups_to_erase):
+        """
+        指定された連結グループのぷよを消去する
+        お邪魔ぷよは隣接していれば一緒に消去される
+        
+        Args:
+            groups_to_erase (list): 消去するグループのリスト [[(x, y), ...], ...]
+        
+        Returns:
+            int: 消去されたぷよの総数
+        
+        Requirements: 3.1 - 連結グループの消去処理
+        """
+        bitboard = self.bitboard
+        erase_mask = 0
+        for group in groups_to_erase:
+            erase_mask |= bitboard.positions_to_mask(group)
+        erase_mask &= bitboard.occupied
+        
+        # 消去するぷよに隣接するお邪魔ぷよも消去対象にする
+        obstacle_mask = bitboard.masks[BitBoard.OBSTACLE_COLOR] & bitboard.neighbors(erase_mask)
+        erase_mask |= obstacle_mask
+        
+        for x, y in bitboard.mask_to_positions(erase_mask):
+            self._set_cell(x, y, None)
+        
+        return BitBoard.popcount(erase_mask)
+    
+    def apply_gravity_moves(self):
+        """
+        1回の走査で全ての列を下に詰め、ぷよの移動を返す
+        下に詰まっている列は占有マスクだけで判定して走査しない
+        
+        Returns:
+            list: [(x, from_y, to_y), ...] 各列の下のぷよから順の移動リスト（移動なしは空）
+        
+        Requirements: 3.3 - ぷよ消去後の重力処理
+        """
+        moves = []
+        height = self.height
+        grid = self.grid
+        
+        for x in range(self.width):
+            bits = self._column(x)
+            # 下詰め済みの列（空か、最下段から隙間なく積まれている）は移動なし
+            if not bits or bits + (bits & -bits) == 1 << height:
+                continue
+            
+            write_y = height - 1
+            for read_y in range(height - 1, -1, -1):
+                if (bits >> read_y) & 1:
+                    if write_y != read_y:
+                        puyo = grid[read_y][x]
+                        self._set_cell(x, read_y, None)
+                        self._set_cell(x, write_y, puyo)
+                        if not self.flyweight:
+                            puyo.set_position(x, write_y)
+                        moves.append((x, read_y, write_y))
+                    write_y -= 1
+        
+        return moves
+    
+    def resolve_chain(self, score_manager=None):
+        """
+        フレームタイマーを使わずに連鎖を最後まで解決する（PlayField.resolve_chainと同じ結果）
+        連鎖の途中はビットボードと列ごとのぷよのリストだけを書き換え、
+        gridとUndoログへは変化したセルを最後に1回だけ書き戻す
+        
+        Args:
+            score_manager (ScoreManager, optional): 指定した場合は各ステップのスコアも計算する
+        
+        Returns:
+            list: 連鎖ステップごとの記録のリスト（キーはPlayField.resolve_chainと同じ）
+        
+        Requirements: 3.1, 3.3, 3.4 - 消去・重力・連鎖判定の一括処理
+        """
+        bitboard = self.bitboard
+        masks = bitboard.masks
+        width = self.width
+        height = self.height
+        column_mask = bitboard.column_mask
+        grid = self.grid
+        columns = [None] * width  # 書き換えた列のぷよ（y=0が最上段）、未変更の列はNone
+        steps = []
+        moved_mask = None  # 前回の重力で動いたぷよ（新しいグループは必ずこれを含む）
+        
+        while True:
+            found = bitboard.find_groups(min_size=4, seeds=moved_mask)
+            erase_mask = 0
+            
+            if found:
+                groups = []
+                colors = []
+                for color, group in found:
+                    erase_mask |= group
+                    groups.append(bitboard.mask_to_positions(group))
+                    colors.append(color)
+                step = {
+                    'chain_level': len(steps) + 1,
+                    'groups': groups,
+                    'colors': colors,
+                    'cleared_count': sum(len(group) for group in groups),
+                }
+                if score_manager is not None:
+                    step['score'] = score_manager.calculate_chain_score(groups, step['chain_level'])
+                
+                # 消去するぷよに隣接するお邪魔ぷよも消去対象にする
+                erase_mask |= masks[BitBoard.OBSTACLE_COLOR] & bitboard.neighbors(erase_mask)
+                for color in range(1, BitBoard.MAX_COLOR + 1):
+                    masks[color] &= ~erase_mask
+                bitboard.occupied &= ~erase_mask
+                step['erased_count'] = BitBoard.popcount(erase_mask)
+                steps.append(step)
+            
+            # 重力: 下詰めされていない列だけを、一番下の空きより上の部分だけ詰め直す
+            moved_mask = 0
+            occupied = bitboard.occupied
+            for x in range(width):
+                shift = x * height
+                erased = (erase_mask >> shift) & column_mask
+                bits = (occupied >> shift) & column_mask
+                settled = not bits or bits + (bits & -bits) == 1 << height
+                if settled and not erased:
+                    continue
+                
+                column = columns[x]
+                if column is None:
+                    column = columns[x] = [row[x] for row in grid]
+                while erased:
+                    low = erased & -erased
+                    column[low.bit_length() - 1] = None
+                    erased ^= low
+                if settled:
+                    continue
+                
+                # 一番下の空きより上のぷよは全て動く
+                lowest_hole = (~bits & column_mask).bit_length()
+                falling = [puyo for puyo in column[:lowest_hole] if puyo is not None]
+                top = lowest_hole - len(falling)
+                column[:lowest_hole] = [None] * top + falling
+                clear = ~(((1 << lowest_hole) - 1) << shift)
+                for color in range(1, BitBoard.MAX_COLOR + 1):
+                    masks[color] &= clear
+                bit = 1 << (shift + top)
+                for puyo in falling:
+                    masks[puyo.get_color()] |= bit
+                    bit <<= 1
+                fallen = ((1 << len(falling)) - 1) << (shift + top)
+                bitboard.occupied = (bitboard.occupied & clear) | fallen
+                moved_mask |= fallen
+            
+            if not found and not moved_mask:
+                break
+        
+        # 変化したセルだけをgridに書き戻す（Undoログにも記録する）
+        undo_log = self._undo_log
+        for x, column in enumerate(columns):
+            if column is None:
+                continue
+            for y in range(height):
+                puyo = column[y]
+                row = grid[y]
+                old_puyo = row[x]
+                if puyo is not old_puyo:
+                    if undo_log is not None:
+                        undo_log.append((x, y, old_puyo))
+                    row[x] = puyo
+                    if puyo is not None and not self.flyweight:
+                        puyo.set_position(x, y)
+        
+        return steps
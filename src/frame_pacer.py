@@ -0,0 +1,150 @@
+"""
+FramePacer - 描画が間に合わない時に描画を飛ばしてゲームの速さを保つフレームペーシング
+Requirements: 1.1 - メインゲームループの時間管理
+"""
+
+from time import perf_counter
+
+from src.graphics import get_backend
+
+
+class FramePacer:
+    """
+    フレームペーシングクラス - 描画だけを飛ばし、更新（ゲームロジック）は毎フレーム行う
+    
+    ゲームのタイマーはすべて更新の回数で数えるため、描画が遅くて更新の間隔が延びると
+    ゲーム自体が遅くなる。updateごとに次の更新の予定時刻を1フレーム分進め、
+    描画の前に「現在時刻 + 直近の描画時間」から描画を終える時刻を見積もる。
+    次の更新が予定より1フレーム以上遅れる場合は描画を飛ばし、それ以内の遅れは
+    以降のフレームで描画を飛ばして取り戻す。
+    連続して飛ばすのはmax_skipフレームまでとし、遅れがそれ以上溜まった場合は
+    予定時刻を現在に合わせる（取り戻せない遅れはゲームの速さの低下として受け入れる）。
+    """
+    
+    def __init__(self, fps=30, max_skip=4, enabled=True, stats_interval=1.0, timer=perf_counter):
+        """
+        フレームペーシングの初期化
+        
+        Args:
+            fps (int): 1秒あたりの更新回数の目標
+            max_skip (int): 連続して飛ばす描画の最大数（0の場合は飛ばさない）
+            enabled (bool): Falseの場合は描画を飛ばさない（統計は計測する）
+            stats_interval (float): 実測のUPS/FPSを計算する間隔（秒）
+            timer (callable): 現在時刻（秒）を返す関数
+        """
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        if max_skip < 0:
+            raise ValueError("max_skip must not be negative")
+        self.fps = fps
+        self.frame_time = 1.0 / fps
+        self.max_skip = max_skip
+        self.enabled = enabled
+        self.stats_interval = stats_interval
+        self.timer = timer
+        
+        self._deadline = None  # 次の更新の予定時刻
+        self._draw_start = None  # 描画の開始時刻
+        self._skipped_in_row = 0  # 連続して飛ばした描画の数
+        self.draw_cost = 0.0  # 描画時間の移動平均（秒）
+        self.draw_cost_smoothing = 0.25  # 移動平均で新しい計測値に掛ける重み
+        
+        # 統計（累計と、stats_intervalごとの実測値）
+        self.update_count = 0
+        self.draw_count = 0
+        self.skipped_draws = 0
+        self.achieved_ups = 0.0
+        self.achieved_fps = 0.0
+        self._stats_start = None
+        self._stats_updates = 0
+        self._stats_draws = 0
+    
+    def begin_update(self):
+        """
+        更新の開始時に呼び出す（次の更新の予定時刻を1フレーム分進める）
+        """
+        now = self.timer()
+        if self._deadline is None:
+            self._deadline = now
+            self._stats_start = now
+        self._deadline += self.frame_time
+        if now - self._deadline > self.frame_time * self.max_skip:
+            # 描画を飛ばしても取り戻せない遅れは捨てる（遅れを取り戻すための描画の停止が続かないように）
+            self._deadline = now + self.frame_time
+        
+        self.update_count += 1
+        self._stats_updates += 1
+        self._update_stats(now)
+    
+    def should_draw(self):
+        """
+        このフレームを描画するか判定する（Falseの場合は描画を飛ばし、画面は前のフレームのまま）
+        
+        Returns:
+            bool: 描画する場合True
+        """
+        if not self.enabled or self._deadline is None or self._skipped_in_row >= self.max_skip:
+            return True
+        if self.timer() + self.draw_cost <= self._deadline + self.frame_time:
+            return True
+        self._skipped_in_row += 1
+        self.skipped_draws += 1
+        return False
+    
+    def begin_draw(self):
+        """
+        描画の開始時に呼び出す
+        """
+        self._draw_start = self.timer()
+    
+    def end_draw(self):
+        """
+        描画の終了時に呼び出す（描画時間を計測する）
+        """
+        if self._draw_start is not None:
+            elapsed = self.timer() - self._draw_start
+            self.draw_cost += (elapsed - self.draw_cost) * self.draw_cost_smoothing
+            self._draw_start = None
+        self._skipped_in_row = 0
+        self.draw_count += 1
+        self._stats_draws += 1
+    
+    def get_stats(self):
+        """
+        実測の更新・描画の頻度を取得
+        
+        Returns:
+            dict: {'ups': 1秒あたりの更新回数, 'fps': 1秒あたりの描画回数,
+                   'skipped_draws': 飛ばした描画の累計, 'draw_ms': 描画時間の移動平均（ミリ秒）}
+        """
+        return {
+            'ups': self.achieved_ups,
+            'fps': self.achieved_fps,
+            'skipped_draws': self.skipped_draws,
+            'draw_ms': self.draw_cost * 1000,
+        }
+    
+    def draw_overlay(self, x=2, y=None):
+        """
+        実測のUPS/FPSをデバッグ表示する（省略時は画面の左下）
+        """
+        gfx = get_backend()
+        if y is None:
+            y = gfx.height - 8
+        text = f"UPS {self.achieved_ups:4.1f} FPS {self.achieved_fps:4.1f}"
+        gfx.rect(x, y - 1, len(text) * 4 + 1, 7, 0)
+        gfx.text(x + 1, y, text, 7 if self.achieved_ups >= self.fps * 0.95 else 8)
+    
+    def _update_stats(self, now):
+        """
+        stats_intervalごとに実測のUPS/FPSを計算する
+        """
+        elapsed = now - self._stats_start
+        if elapsed < self.stats_interval or elapsed <= 0:
+            return
+        # 区間の最初の更新は前の区間の終わりに数えている
+        self.achieved_ups = (self._stats_updates - 1) / elapsed
+        self.achieved_fps = self._stats_draws / elapsed
+        self._stats_start = now
+        self._stats_updates = 1
+        self._stats_draws = 0
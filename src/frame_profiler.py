@@ -0,0 +1,291 @@
+"""
+FrameProfiler - サブシステムごとのフレーム処理時間の計測
+Requirements: 5.2 - デバッグ機能（処理時間の可視化と記録）
+"""
+
+import csv
+import json
+import math
+import os
+from collections import deque
+from time import perf_counter_ns
+
+from src.graphics import get_backend
+
+
+class _Section:
+    """
+    with文で使う計測区間
+    """
+    
+    __slots__ = ('profiler', 'name', 'start')
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+    
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, perf_counter_ns() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """
+    フレームプロファイラークラス - サブシステムの呼び出し時間をフレーム単位で集計する
+    
+    区間ごとの1フレームあたりの合計時間を直近windowフレーム分保持し、
+    p50/p95/p99をデバッグ表示やファイル（CSV/JSONL）に出力する。
+    """
+    
+    FRAME_SECTION = 'frame'  # フレーム全体（begin_frameからend_frameまで）の区間名
+    PERCENTILES = (50, 95, 99)
+    
+    def __init__(self, window=300, enabled=True):
+        """
+        フレームプロファイラーの初期化
+        
+        Args:
+            window (int): パーセンタイルの計算に使う直近のフレーム数
+            enabled (bool): Falseの場合は計測しない（instrumentも何もしない）
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.enabled = enabled
+        
+        self.frame_index = 0  # 集計済みのフレーム数
+        self._frame_start = None  # 現在のフレームの開始時刻（ns）
+        self._current = {}  # 区間名 -> 現在のフレームでの合計時間（ns）
+        self._samples = {}  # 区間名 -> 直近のフレームごとの合計時間（ns）
+        self._patched = []  # (オブジェクト, メソッド名, 差し替え前のインスタンス属性) instrumentで差し替えたメソッド
+        
+        # ファイル出力
+        self._output = None
+        self._output_format = None
+        self._csv_writer = None
+        
+        # デバッグ表示（パーセンタイルの計算はoverlay_intervalフレームごとに行う）
+        self.overlay_x = 2
+        self.overlay_y = 2
+        self.overlay_rows = 12
+        self.overlay_interval = 15
+        self._overlay_report = []
+        self._overlay_frame = None
+    
+    def begin_frame(self):
+        """
+        フレームの計測を開始する
+        """
+        if self.enabled:
+            self._frame_start = perf_counter_ns()
+    
+    def end_frame(self):
+        """
+        フレームの計測を終了し、区間ごとの合計時間を記録・出力する
+        """
+        if not self.enabled:
+            return
+        current = self._current
+        if self._frame_start is not None:
+            current[self.FRAME_SECTION] = perf_counter_ns() - self._frame_start
+            self._frame_start = None
+        
+        samples = self._samples
+        for name, duration in current.items():
+            history = samples.get(name)
+            if history is None:
+                history = samples[name] = deque(maxlen=self.window)
+            history.append(duration)
+        
+        if self._output is not None:
+            self._write_frame(current)
+        self._current = {}
+        self.frame_index += 1
+    
+    def record(self, name, duration_ns):
+        """
+        区間の処理時間を現在のフレームに加算する
+        
+        Args:
+            name (str): 区間名
+            duration_ns (int): 処理時間（ナノ秒）
+        """
+        current = self._current
+        current[name] = current.get(name, 0) + duration_ns
+    
+    def section(self, name):
+        """
+        with文で囲んだ処理の時間を計測する区間を作成
+        
+        Args:
+            name (str): 区間名
+        
+        Returns:
+            _Section: コンテキストマネージャー
+        """
+        return _Section(self, name)
+    
+    def wrap(self, name, function):
+        """
+        呼び出しごとに処理時間を計測する関数を作成
+        
+        Args:
+            name (str): 区間名
+            function (callable): 計測する関数
+        
+        Returns:
+            callable: functionと同じ引数・戻り値の関数
+        """
+        record = self.record
+        
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, perf_counter_ns() - start)
+        
+        timed.__wrapped__ = function
+        return timed
+    
+    def instrument(self, target, method_names, prefix=None):
+        """
+        オブジェクトのメソッドを計測付きのものに差し替える
+        
+        Args:
+            target: 対象のオブジェクト
+            method_names (iterable): 差し替えるメソッド名
+            prefix (str, optional): 区間名の接頭辞（省略時はクラス名）
+        """
+        if not self.enabled:
+            return
+        if prefix is None:
+            prefix = type(target).__name__
+        for method_name in method_names:
+            method = getattr(target, method_name)
+            original = vars(target).get(method_name)
+            setattr(target, method_name, self.wrap(f"{prefix}.{method_name}", method))
+            self._patched.append((target, method_name, original))
+    
+    def uninstrument(self):
+        """
+        instrumentで差し替えた全てのメソッドを元に戻す
+        """
+        for target, method_name, original in reversed(self._patched):
+            if original is not None:
+                setattr(target, method_name, original)
+            else:
+                # インスタンス属性を削除すればクラスのメソッドが見えるようになる
+                delattr(target, method_name)
+        self._patched = []
+    
+    def get_percentiles(self, name):
+        """
+        区間の1フレームあたりの処理時間のパーセンタイルを取得
+        
+        Args:
+            name (str): 区間名
+        
+        Returns:
+            dict: {'p50': µs, 'p95': µs, 'p99': µs}（記録がない場合はNone）
+        """
+        history = self._samples.get(name)
+        if not history:
+            return None
+        ordered = sorted(history)
+        count = len(ordered)
+        result = {}
+        for percentile in self.PERCENTILES:
+            # 最近順位法
+            rank = max(1, math.ceil(percentile / 100 * count))
+            result[f"p{percentile}"] = ordered[rank - 1] / 1000
+        return result
+    
+    def get_report(self):
+        """
+        全区間のパーセンタイルをp95の大きい順に取得
+        
+        Returns:
+            list: [(区間名, p50, p95, p99), ...]（単位はµs）
+        """
+        report = []
+        for name in self._samples:
+            stats = self.get_percentiles(name)
+            report.append((name, stats['p50'], stats['p95'], stats['p99']))
+        report.sort(key=lambda row: row[2], reverse=True)
+        return report
+    
+    def open_output(self, path, output_format=None):
+        """
+        フレームごとの計測結果の出力先ファイルを開く
+        
+        Args:
+            path (str): 出力先のパス
+            output_format (str, optional): 'csv' または 'jsonl'（省略時は拡張子から判定）
+        """
+        if output_format is None:
+            output_format = 'jsonl' if os.path.splitext(path)[1].lower() in ('.jsonl', '.json') else 'csv'
+        if output_format not in ('csv', 'jsonl'):
+            raise ValueError(f"unsupported output format: {output_format}")
+        
+        self.close_output()
+        # 行単位でバッファを書き出す（終了処理を経ずに終了しても記録が残るように）
+        self._output = open(path, 'w', newline='' if output_format == 'csv' else None,
+                            encoding='utf-8', buffering=1)
+        self._output_format = output_format
+        if output_format == 'csv':
+            self._csv_writer = csv.writer(self._output)
+            self._csv_writer.writerow(['frame', 'section', 'duration_us'])
+    
+    def close_output(self):
+        """
+        出力先ファイルを閉じる
+        """
+        if self._output is not None:
+            self._output.close()
+        self._output = None
+        self._output_format = None
+        self._csv_writer = None
+    
+    def draw_overlay(self):
+        """
+        区間ごとのパーセンタイルをデバッグ表示する
+        """
+        if not self.enabled:
+            return
+        if self._overlay_frame is None or self.frame_index - self._overlay_frame >= self.overlay_interval:
+            self._overlay_report = self.get_report()[:self.overlay_rows]
+            self._overlay_frame = self.frame_index
+        
+        gfx = get_backend()
+        x = self.overlay_x
+        y = self.overlay_y
+        gfx.rect(x, y, 156, 10 + len(self._overlay_report) * 8, 0)
+        gfx.text(x + 2, y + 2, "SECTION            P50   P95   P99 us", 10)
+        for row, (name, p50, p95, p99) in enumerate(self._overlay_report):
+            line = f"{name[-18:]:<18}{p50:6.0f}{p95:6.0f}{p99:6.0f}"
+            gfx.text(x + 2, y + 10 + row * 8, line, 8 if row == 0 else 7)
+    
+    def _write_frame(self, durations):
+        """
+        1フレーム分の計測結果をファイルに書き出す
+        
+        Args:
+            durations (dict): 区間名 -> 処理時間（ns）
+        """
+        if self._output_format == 'csv':
+            frame = self.frame_index
+            self._csv_writer.writerows(
+                (frame, name, duration / 1000) for name, duration in durations.items()
+            )
+        else:
+            record = {
+                'frame': self.frame_index,
+                'sections': {name: duration / 1000 for name, duration in durations.items()},
+            }
+            self._output.write(json.dumps(record) + "\n")
@@ -8,12 +8,20 @@ from src.playfield import PlayField
 from src.input_handler import InputHandler
 from src.puyo_manager import PuyoManager
 from src.score_manager import ScoreManager
-from src.game_state import GameStateManager
+from src.game_state import GameStateManager, GameState
 from src.audio_manager import AudioManager, BGMType
 from src.game_systems import GameSystems
 from src.ui_renderer import UIRenderer
 from src.game_controller import GameController
 from src.debug_tools import DebugTools
+from src.input_source import TickInputLatch
+from src.sim_clock import SimulationClock
+from src.frame_profiler import FrameProfiler
+from src.frame_pacer import FramePacer
+from src.replay import ReplayRecorder
+from src.replay_archive import ARCHIVE_EXTENSION, append_replays
+from src.retained_renderer import RetainedRenderer
+from src.sprite_atlas import build_sprite_atlas
 
 
 class KiroKiroGame:
@@ -29,6 +37,9 @@ class KiroKiroGame:
         # 画面サイズの設定（320x380ピクセル - レイアウト最適化）
         pyxel.init(320, 380, title="Kiro Kiro Puzzle Game")
         
+        # ぷよの画像をイメージバンクに描き込む（以降のぷよの描画は1回のbltになる）
+        build_sprite_atlas()
+        
         # ゲーム状態の初期化
         self.initialize_game()
         
@@ -40,25 +51,47 @@ class KiroKiroGame:
         ゲームの初期化処理
         各システムの初期化と連携設定
         """
-        # フレームカウンター
+        # フレームカウンター（ゲームロジックのティック数）
         self.frame_count = 0
         
+        # シミュレーション時計（1描画フレームあたりのティック数と待ち時間の早送りを管理）
+        self.clock = SimulationClock()
+        
         # デバッグモード設定
         self.debug_mode = False
         self.test_puyos = []  # テスト用ぷよ（デバッグモード時のみ使用）
         
+        # フレームプロファイラー（デバッグモード時のみ計測、出力先を指定するとCSV/JSONLに記録）
+        self.profile_output = None
+        self.profiler = FrameProfiler(enabled=self.debug_mode)
+        if self.profile_output is not None:
+            self.profiler.open_output(self.profile_output)
+        
+        # フレームペーシング（描画が間に合わない時は最大max_skipフレームまで描画を飛ばし、更新の回数を保つ）
+        self.frame_pacer = FramePacer(fps=self.clock.fps, max_skip=4)
+        
+        # リプレイ記録（保存先を指定するとゲームごとに入力を記録、{index}はゲームの通し番号）
+        # 保存先の拡張子が .krpa の場合は1つのアーカイブに追加していく
+        # 記録したフレームをそのままティックとして再生するため、時間倍率は等倍で記録すること
+        self.replay_output = None
+        self.replay_recorder = None
+        self.replay_count = 0
+        
         # 基本システムの初期化
         self.playfield = PlayField()
         self.input_handler = InputHandler()
+        # ゲームシステムにはティック単位の入力を渡す（フレームの入力を実行されたティックに配る）
+        self.tick_input = TickInputLatch(self.input_handler)
         self.puyo_manager = PuyoManager()
         self.score_manager = ScoreManager()
         self.game_state_manager = GameStateManager()
         self.audio_manager = AudioManager()
+        self.start_replay_recording()
         
         # 統合システムの初期化
         self.game_systems = GameSystems(
             self.playfield, self.puyo_manager, self.score_manager, 
-            self.audio_manager, self.input_handler
+            self.audio_manager, self.tick_input
         )
         
         self.ui_renderer = UIRenderer(
@@ -68,14 +101,22 @@ class KiroKiroGame:
         
         self.game_controller = GameController(
             self.game_state_manager, self.playfield, self.game_systems,
-            self.score_manager, self.audio_manager, self.input_handler
+            self.score_manager, self.audio_manager, self.tick_input
         )
+        # Rキーによる再開始もゲーム全体を作り直し、リプレイの記録をやり直す
+        self.game_controller.restart_handler = self.restart_game
         
         self.debug_tools = DebugTools(self.playfield, self.game_systems)
         
-        # デバッグモードの同期
+        # 差分描画（Trueの場合は変化した領域だけを描き直す、デバッグモード時は毎フレーム全体を描画）
+        self.retained_rendering = True
+        self.renderer = RetainedRenderer(self)
+        
+        # デバッグモードと早送り設定の同期
         self.game_systems.debug_mode = self.debug_mode
+        self.game_systems.skip_waits = self.clock.skip_waits
         self.debug_tools.debug_mode = self.debug_mode
+        self.instrument_systems()
         
         # 最初の落下ペアを設定
         self.game_systems.initialize_first_pair()
@@ -94,13 +135,19 @@ class KiroKiroGame:
     def update(self):
         """
         ゲーム状態の更新処理（毎フレーム呼び出される）
+        シミュレーション時計の倍率に応じて1フレームに0回以上のティックを進める
         Requirements: 1.1 - システムは対応するゲーム操作を実行する
         """
-        # フレームカウンターの更新
-        self.frame_count += 1
+        self.profiler.begin_frame()
+        self.frame_pacer.begin_update()
+        
+        # 再開始するゲームのリプレイは前のフレームまでで保存する
+        if self.replay_recorder is not None and self.input_handler.should_restart_game():
+            self.save_replay()
         
-        # 入力処理の更新
+        # 入力処理の更新（押した操作は実際にティックが実行されるまで保持する）
         self.input_handler.update()
+        self.tick_input.latch()
         
         # 音響システムの更新
         self.audio_manager.update()
@@ -113,27 +160,78 @@ class KiroKiroGame:
         if self.debug_mode:
             self.handle_debug_input()
         
+        self.clock.run_frame(self.update_tick)
+        
+        # ゲームオーバーになったらリプレイを保存する
+        if (self.replay_recorder is not None and
+                self.game_state_manager.get_current_state() == GameState.GAME_OVER):
+            self.save_replay()
+    
+    def start_replay_recording(self):
+        """
+        リプレイの記録を開始する（保存先が指定されている場合のみ、ぷよペア生成前に呼び出す）
+        """
+        self.stop_replay_recording()
+        if self.replay_output is None:
+            return
+        self.replay_recorder = ReplayRecorder(self.input_handler, self.puyo_manager)
+        self.input_handler = self.replay_recorder
+        self.tick_input.source = self.input_handler
+    
+    def stop_replay_recording(self):
+        """
+        リプレイの記録を終了し、元の入力処理に戻す
+        """
+        if self.replay_recorder is not None:
+            self.input_handler = self.replay_recorder.input_source
+            self.tick_input.source = self.input_handler
+            self.replay_recorder = None
+    
+    def save_replay(self):
+        """
+        記録中のリプレイを保存して記録を終了する
+        """
+        recorder = self.replay_recorder
+        if recorder is None:
+            return
+        replay = recorder.finish(self.score_manager.get_score(), self.playfield.get_hash())
+        path = self.replay_output.format(index=self.replay_count)
+        if path.endswith(ARCHIVE_EXTENSION):
+            append_replays(path, [replay])
+        else:
+            replay.save(path)
+        self.replay_count += 1
+        self.stop_replay_recording()
+    
+    def update_tick(self, tick_index=0):
+        """
+        ゲームロジックを1ティック進める
+        
+        Args:
+            tick_index (int): フレーム内のティック番号
+        """
+        # フレームカウンターの更新
+        self.frame_count += 1
+        
         # ゲーム状態管理システムの更新
         self.game_state_manager.update()
         
         # ゲーム状態に応じた処理分岐
-        self.game_controller.update_state_specific_logic()
+        game_controller = self.game_controller
+        game_controller.update_state_specific_logic()
+        if self.game_controller is not game_controller:
+            # 再開始したティックはここまで（新しいゲームはリプレイの1フレーム目と同じく次のティックから進める）
+            self.tick_input.end_tick()
+            return
         
         # スコア表示システムの更新
         self.game_controller.update_score_display_system()
         
-        # ゲームシステムの更新（消去・重力・連鎖）
-        self.game_systems.update_elimination_system()
-        self.game_systems.update_gravity_system()
-        self.game_systems.update_chain_display_system()
-        
-        # 通常のゲームプレイ処理（システムが非アクティブ時のみ）
-        if not self.game_systems.is_systems_active():
-            # 落下システムの更新
-            self.game_systems.update_fall_system()
-            
-            # 現在のぷよペアに対する入力処理
-            self.game_systems.handle_puyo_pair_input()
+        # ゲームシステムの更新（消去・重力・連鎖・落下・ぷよペア操作）
+        self.game_systems.update()
+        
+        # 押した瞬間の操作はこのティックで反映済み（同じ押下を次のティックで繰り返さない）
+        self.tick_input.end_tick()
     
     def handle_debug_input(self):
         """
@@ -161,20 +259,42 @@ class KiroKiroGame:
         Requirements: 1.1 - システムはゲーム画面を表示する
         Requirements: 1.2 - システムはプレイフィールドとぷよを表示する
         """
+        # 描画が間に合わない場合は飛ばす（画面は前のフレームのまま、差分描画の変化は次の描画でまとめて描く）
+        if not self.frame_pacer.should_draw():
+            self.profiler.end_frame()
+            return
+        self.frame_pacer.begin_draw()
+        
+        if self.retained_rendering and not self.debug_mode:
+            # 前のフレームから変化した領域だけを描き直す
+            self.renderer.draw()
+        else:
+            self.draw_all()
+            # 差分描画に戻った時は画面全体から描き直す
+            self.renderer.invalidate()
+        
+        # 処理時間と実測のUPS/FPSのデバッグ表示
+        if self.debug_mode:
+            self.profiler.draw_overlay()
+            self.frame_pacer.draw_overlay()
+        self.frame_pacer.end_draw()
+        self.profiler.end_frame()
+    
+    def draw_all(self):
+        """
+        画面全体を描画する（デバッグモード時、または差分描画を使わない場合）
+        """
         # 危険レベルを取得
         danger_level = self.game_controller.get_danger_level()
         
-        # 背景の描画
-        self.ui_renderer.draw_background(self.frame_count, danger_level)
+        # 変化しない部分（背景・タイトル・枠・ラベル・操作説明）をまとめて描画
+        self.ui_renderer.draw_static_layer(self.debug_mode, self.playfield)
         
-        # タイトルの描画
-        self.ui_renderer.draw_title()
+        # 危険レベルに応じた画面上部の警告帯
+        self.ui_renderer.draw_danger_band(self.frame_count, danger_level)
         
-        # プレイフィールドの枠線描画
-        self.ui_renderer.draw_playfield_frame()
-        
-        # プレイフィールドの描画
-        self.playfield.draw(self.ui_renderer.playfield_x, self.ui_renderer.playfield_y)
+        # プレイフィールド内のぷよの描画
+        self.playfield.draw_cells(self.ui_renderer.playfield_x, self.ui_renderer.playfield_y)
         
         # 危険レベルの視覚的警告表示
         self.ui_renderer.draw_danger_warnings(danger_level, self.frame_count)
@@ -197,39 +317,63 @@ class KiroKiroGame:
             )
         
         # 次のぷよペアのプレビュー表示
-        self.ui_renderer.draw_next_preview()
+        self.ui_renderer.draw_next_preview_puyos()
         
         # 次の次のぷよペアのプレビュー表示
-        self.ui_renderer.draw_next_next_preview()
+        self.ui_renderer.draw_next_next_preview_puyos()
         
-        # スコア表示エリア
+        # スコア表示
         score_info = self.game_controller.get_score_display_info()
-        self.ui_renderer.draw_score_area(*score_info)
+        self.ui_renderer.draw_score_value(*score_info)
         
         # 連鎖アニメーション表示
         chain_info = self.game_systems.get_chain_display_info()
         self.ui_renderer.draw_chain_animation(*chain_info)
         
-        # 操作説明パネルの表示
-        self.ui_renderer.draw_controls_panel(self.debug_mode)
-        
         # 最終スコア表示
         self.ui_renderer.draw_final_score_display(self.game_controller.show_final_score)
     
+    def instrument_systems(self):
+        """
+        各サブシステムの呼び出しをフレームプロファイラーで計測する
+        （システムを作り直した場合は再度呼び出す）
+        """
+        profiler = self.profiler
+        if not profiler.enabled:
+            return
+        profiler.uninstrument()
+        profiler.instrument(self.input_handler, ['update'])
+        profiler.instrument(self.audio_manager, ['update'])
+        profiler.instrument(self.game_state_manager, ['update'])
+        profiler.instrument(self.game_controller, [
+            'update_state_specific_logic', 'update_score_display_system', 'get_danger_level'
+        ])
+        profiler.instrument(self.game_systems, [
+            'update_elimination_system', 'update_gravity_system', 'update_chain_display_system',
+            'update_fall_system', 'handle_puyo_pair_input'
+        ])
+        profiler.instrument(self.playfield, ['draw_cells', 'draw_background'])
+        profiler.instrument(self.ui_renderer, [
+            name for name in dir(self.ui_renderer) if name.startswith('draw_')
+        ])
+    
     def restart_game(self):
         """
         ゲームを再開始する
         Requirements: 4.3 - ゲーム再開始機能
         """
+        self.save_replay()
+        
         # 各システムの状態をリセット
         self.playfield = PlayField()
         self.puyo_manager = PuyoManager()
         self.score_manager = ScoreManager()
+        self.start_replay_recording()
         
         # ゲームシステムを再初期化
         self.game_systems = GameSystems(
             self.playfield, self.puyo_manager, self.score_manager, 
-            self.audio_manager, self.input_handler
+            self.audio_manager, self.tick_input
         )
         
         # UIレンダラーを更新
@@ -241,18 +385,29 @@ class KiroKiroGame:
         # ゲームコントローラーを更新
         self.game_controller = GameController(
             self.game_state_manager, self.playfield, self.game_systems,
-            self.score_manager, self.audio_manager, self.input_handler
+            self.score_manager, self.audio_manager, self.tick_input
         )
+        # Rキーによる再開始もゲーム全体を作り直し、リプレイの記録をやり直す
+        self.game_controller.restart_handler = self.restart_game
         
         # デバッグツールを更新
         self.debug_tools = DebugTools(self.playfield, self.game_systems)
         
-        # デバッグモードの同期
+        # 画面全体を描き直す
+        self.renderer.invalidate()
+        
+        # デバッグモードと早送り設定の同期
         self.game_systems.debug_mode = self.debug_mode
+        self.game_systems.skip_waits = self.clock.skip_waits
         self.debug_tools.debug_mode = self.debug_mode
+        self.instrument_systems()
         
         # 最初の落下ペアを設定
         self.game_systems.initialize_first_pair()
+        self.game_systems.is_initializing = False
+        
+        # ゲームオーバー画面からの再開始ではプレイ状態に戻す
+        self.game_state_manager.start_game()
         
         # ゲーム開始時のBGM再生
         self.audio_manager.play_bgm(BGMType.GAME)
@@ -42,6 +42,9 @@ class GameController:
         self.score_animation_phase = 0.0
         self.last_displayed_score = 0
         self.score_increment_amount = 0
+        
+        # 再開始処理（設定した場合は再開始をこの関数に任せ、ゲーム全体を作り直す）
+        self.restart_handler = None
     
     def update_state_specific_logic(self):
         """
@@ -120,8 +123,8 @@ class GameController:
         if self.audio_manager.is_bgm_playing():
             self.audio_manager.stop_bgm()
         
-        # リスタート処理
-        if self.input_handler.should_restart_game():
+        # リスタート処理（ゲームオーバーへの遷移中はプレイ状態に戻れないため受け付けない）
+        if self.input_handler.should_restart_game() and not self.game_state_manager.is_in_transition():
             self.restart_game()
         
         # メニューに戻る処理
@@ -137,10 +140,7 @@ class GameController:
             bool: ゲームオーバーの場合True
         """
         # プレイフィールドの上端（y=0）にぷよがある場合はゲームオーバー
-        for x in range(6):
-            if not self.playfield.is_empty(x, 0):
-                return True
-        return False
+        return self.playfield.find_column_reaching_top() >= 0
     
     def check_game_over_advanced(self):
         """
@@ -152,32 +152,13 @@ class GameController:
         """
         from src.debug_utils import print_playfield_state, analyze_game_over_state
         
-        # 基本的な上端到達判定
-        for x in range(6):
-            if not self.playfield.is_empty(x, 0):
-                print("\n*** ゲームオーバー検出: 上端到達 ***")
-                analyze_game_over_state(self)
-                print_playfield_state(self.playfield, self.game_systems.current_falling_pair)
-                return True, f"プレイフィールド上端到達 (列 {x})"
-        
-        # 新しいぷよペアが配置できない場合の判定
-        if self.game_systems.current_falling_pair is not None:
-            # 現在のぷよペアの位置を取得
-            main_pos, sub_pos = self.game_systems.current_falling_pair.get_puyo_positions()
-            
-            # 初期位置（メインぷよのY座標が0）の場合のみチェック
-            if main_pos[1] == 0:
-                # 現在の位置に既にぷよがあるかチェック
-                main_empty = self.playfield.is_empty(main_pos[0], main_pos[1])
-                sub_empty = self.playfield.is_empty(sub_pos[0], sub_pos[1])
-                
-                if not main_empty or not sub_empty:
-                    print("\n*** ゲームオーバー検出: 新しいぷよペアが配置不可能 ***")
-                    print(f"メインぷよ位置 {main_pos} は空か: {main_empty}")
-                    print(f"サブぷよ位置 {sub_pos} は空か: {sub_empty}")
-                    analyze_game_over_state(self)
-                    print_playfield_state(self.playfield, self.game_systems.current_falling_pair)
-                    return True, "新しいぷよペアが配置不可能"
+        # 上端到達・新しいぷよペアが配置不可能の判定
+        is_game_over, reason = self.game_systems.check_board_game_over()
+        if is_game_over:
+            print(f"\n*** ゲームオーバー検出: {reason} ***")
+            analyze_game_over_state(self)
+            print_playfield_state(self.playfield, self.game_systems.current_falling_pair)
+            return True, reason
         
         # 危険レベルの判定（上から3行以内にぷよがある場合）
         danger_level = self.get_danger_level()
@@ -196,12 +177,7 @@ class GameController:
         Returns:
             int: 危険レベル（0-6、上から3行以内のぷよの数）
         """
-        danger_count = 0
-        for y in range(3):  # 上から3行をチェック
-            for x in range(6):
-                if not self.playfield.is_empty(x, y):
-                    danger_count += 1
-        return danger_count
+        return self.playfield.count_puyos_in_top_rows(3)  # 上から3行をチェック
     
     def handle_game_over(self, reason="ゲームオーバー"):
         """
@@ -242,6 +218,10 @@ class GameController:
         ゲームを再開始する
         Requirements: 4.3 - ゲーム再開始機能
         """
+        if self.restart_handler is not None:
+            self.restart_handler()
+            return
+        
         # プレイフィールドをクリア
         self.playfield.clear()
         
@@ -3,7 +3,6 @@ Game Systems - ゲームロジックシステムの管理
 Requirements: 2.1, 2.4, 2.5, 3.1, 3.3, 3.4 - 落下、消去、重力、連鎖システム
 """
 
-import pyxel
 from src.audio_manager import SoundType
 
 
@@ -21,7 +20,7 @@ class GameSystems:
             puyo_manager: ぷよ管理システム
             score_manager: スコア管理システム
             audio_manager: 音響管理システム
-            input_handler: 入力処理システム
+            input_handler: 入力ソース（InputSourceのインターフェースを持つもの）
         """
         self.playfield = playfield
         self.puyo_manager = puyo_manager
@@ -41,6 +40,7 @@ class GameSystems:
         self.gravity_active = False
         self.gravity_timer = 0
         self.gravity_interval = 5
+        self.gravity_moves = None  # 適用済みの重力移動 [(x, from_y, to_y), ...]（Noneは未適用）
         
         # 消去システムの設定
         self.elimination_active = False
@@ -68,6 +68,9 @@ class GameSystems:
         
         # 初期化フラグ
         self.is_initializing = True
+        
+        # 消去・重力・連鎖表示の待ち時間を飛ばすかどうか（SimulationClockの早送り用）
+        self.skip_waits = False
     
     def debug_print(self, message):
         """
@@ -85,6 +88,38 @@ class GameSystems:
         """
         self.current_falling_pair = self.puyo_manager.get_current_pair()
     
+    def update(self):
+        """
+        1フレーム分のゲームシステム更新（消去・重力・連鎖表示・落下・入力）
+        """
+        if self.skip_waits:
+            self.fast_forward_waits()
+        
+        # ゲームシステムの更新（消去・重力・連鎖）
+        self.update_elimination_system()
+        self.update_gravity_system()
+        self.update_chain_display_system()
+        
+        # 通常のゲームプレイ処理（システムが非アクティブ時のみ）
+        if not self.is_systems_active():
+            # 落下システムの更新
+            self.update_fall_system()
+            
+            # 現在のぷよペアに対する入力処理
+            self.handle_puyo_pair_input()
+    
+    def fast_forward_waits(self):
+        """
+        演出用の待ち時間を飛ばし、次の更新で各処理が実行されるようにする
+        待ち時間中は入力も落下も行われないため、盤面とスコアの結果は変わらない
+        """
+        if self.elimination_active:
+            self.elimination_timer = max(self.elimination_timer, self.elimination_interval - 1)
+        if self.gravity_active:
+            self.gravity_timer = max(self.gravity_timer, self.gravity_interval - 1)
+        if self.show_chain_text:
+            self.chain_display_timer = max(self.chain_display_timer, self.chain_display_duration - 1)
+    
     def update_fall_system(self):
         """
         落下システムの更新処理
@@ -97,7 +132,7 @@ class GameSystems:
         self.fall_timer += 1
         
         # 高速落下中かどうかをチェック
-        is_fast_dropping = pyxel.btn(pyxel.KEY_DOWN)
+        is_fast_dropping = self.input_handler.is_fast_drop_held()
         
         # 落下間隔の決定
         current_fall_interval = self.fast_fall_interval if is_fast_dropping else self.fall_interval
@@ -115,6 +150,20 @@ class GameSystems:
                 # 移動できない場合はぷよペアを固定
                 self.fix_puyo_pair()
     
+    def hard_drop(self):
+        """
+        現在のぷよペアを着地位置まで一度に落下させて固定する
+        （1フレームずつ下に移動させずに、列の高さから落下段数を求める）
+        Requirements: 2.4, 2.5 - 高速落下とぷよ固定
+        """
+        if self.current_falling_pair is None:
+            return
+        
+        distance = self.playfield.get_pair_drop_distance(self.current_falling_pair)
+        if distance > 0:
+            self.current_falling_pair.move(0, distance)
+        self.fix_puyo_pair()
+    
     def fix_puyo_pair(self):
         """
         現在のぷよペアをプレイフィールドに固定する
@@ -247,6 +296,7 @@ class GameSystems:
         # 重力処理を開始
         self.gravity_active = True
         self.gravity_timer = 0
+        self.gravity_moves = None
     
     def update_gravity_system(self):
         """
@@ -261,19 +311,22 @@ class GameSystems:
         
         # 重力処理の実行タイミングかチェック
         if self.gravity_timer >= self.gravity_interval:
-            # 重力を適用
-            gravity_applied = self.playfield.apply_gravity()
-            
-            if gravity_applied:
-                # ぷよが移動した場合、タイマーをリセットして継続
-                self.gravity_timer = 0
-            else:
-                # ぷよが移動しなかった場合、重力処理を終了
-                self.gravity_active = False
-                self.gravity_timer = 0
+            if self.gravity_moves is None:
+                # 1回の適用で全ての列を詰め、移動リストを保持する
+                self.gravity_moves = self.playfield.apply_gravity_moves()
                 
-                # 重力処理完了後、再度消去判定を行う（連鎖のため）
-                self.check_for_chain_elimination()
+                if self.gravity_moves:
+                    # ぷよが移動した場合、タイマーをリセットして落下演出の時間を取る
+                    self.gravity_timer = 0
+                    return
+            
+            # 全ての列は詰め終わっているため、再走査せずに重力処理を終了
+            self.gravity_active = False
+            self.gravity_timer = 0
+            self.gravity_moves = None
+            
+            # 重力処理完了後、再度消去判定を行う（連鎖のため）
+            self.check_for_chain_elimination()
     
     def check_for_chain_elimination(self):
         """
@@ -404,6 +457,17 @@ class GameSystems:
         """
         return self.elimination_active, self.elimination_timer, self.elimination_groups
     
+    def get_gravity_info(self):
+        """
+        重力処理情報を取得（落下演出の補間用）
+        
+        Returns:
+            tuple: (gravity_active, 進行度0.0-1.0, 移動リスト [(x, from_y, to_y), ...])
+        """
+        moves = self.gravity_moves or []
+        progress = min(1.0, self.gravity_timer / self.gravity_interval) if moves else 0.0
+        return self.gravity_active, progress, moves
+    
     def can_place_new_pair(self):
         """
         新しいぷよペアが配置できるかチェック
@@ -434,6 +498,29 @@ class GameSystems:
         
         return True
     
+    def check_board_game_over(self):
+        """
+        盤面だけによるゲームオーバー判定（上端到達、初期位置のぷよペアが配置不可能）
+        GameControllerとHeadlessGameの共通の判定
+        
+        Returns:
+            tuple: (is_game_over: bool, reason: str)
+        """
+        # 上端到達判定
+        x = self.playfield.find_column_reaching_top()
+        if x >= 0:
+            return True, f"プレイフィールド上端到達 (列 {x})"
+        
+        # 初期位置（メインぷよのY座標が0）のぷよペアの位置に既にぷよがある場合
+        if self.current_falling_pair is not None:
+            main_pos, sub_pos = self.current_falling_pair.get_puyo_positions()
+            if main_pos[1] == 0:
+                if (not self.playfield.is_empty(main_pos[0], main_pos[1]) or
+                        not self.playfield.is_empty(sub_pos[0], sub_pos[1])):
+                    return True, "新しいぷよペアが配置不可能"
+        
+        return False, "正常"
+    
     def get_game_over_status(self):
         """
         ゲームオーバー状態を取得
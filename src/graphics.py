@@ -0,0 +1,31 @@
+"""
+描画バックエンド - pyxel互換の描画APIへの遅延アクセス
+Requirements: 5.1 - ゲームロジックと描画処理の分離
+"""
+
+_backend = None
+
+
+def get_backend():
+    """
+    描画バックエンドを取得する（未設定の場合はここで初めてpyxelを読み込む）
+    
+    Returns:
+        module: pyxel互換の描画API
+    """
+    global _backend
+    if _backend is None:
+        import pyxel
+        _backend = pyxel
+    return _backend
+
+
+def set_backend(backend):
+    """
+    描画バックエンドを差し替える
+    
+    Args:
+        backend: pyxel互換の描画API（Noneの場合は次回取得時にpyxelへ戻す）
+    """
+    global _backend
+    _backend = backend
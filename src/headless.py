@@ -0,0 +1,149 @@
+"""
+ヘッドレス実行 - pyxelを読み込まずにゲームルールだけを進める
+Requirements: 2.1, 3.1, 3.2, 3.3, 3.4, 4.3 - 描画なしでのゲーム進行
+"""
+
+from src.puyo import Puyo
+from src.puyo_pair import PuyoPair
+from src.playfield import PlayField
+from src.puyo_manager import PuyoManager
+from src.score_manager import ScoreManager
+from src.game_systems import GameSystems
+from src.input_source import InputSource, ScriptedInputSource
+from src.sim_clock import SimulationClock
+
+__all__ = [
+    'Puyo',
+    'PuyoPair',
+    'PlayField',
+    'PuyoManager',
+    'ScoreManager',
+    'GameSystems',
+    'InputSource',
+    'ScriptedInputSource',
+    'SimulationClock',
+    'NullAudioManager',
+    'HeadlessGame',
+]
+
+
+class NullAudioManager:
+    """
+    何も再生しない音響管理 - AudioManagerと同じ呼び出しを受け付ける
+    """
+    
+    def play_sound(self, sound_type, chain_level=1):
+        """効果音を再生しない"""
+        pass
+    
+    def play_bgm(self, bgm_type):
+        """BGMを再生しない"""
+        pass
+    
+    def stop_bgm(self):
+        """BGMを停止しない"""
+        pass
+    
+    def is_bgm_playing(self):
+        """BGMは常に停止中"""
+        return False
+    
+    def update(self):
+        """更新処理なし"""
+        pass
+
+
+class HeadlessGame:
+    """
+    ヘッドレスゲーム - KiroKiroGame.updateのゲームロジック部分だけを実行する
+    """
+    
+    def __init__(self, input_source=None, playfield=None, puyo_manager=None, score_manager=None,
+                 clock=None):
+        """
+        HeadlessGameの初期化
+        
+        Args:
+            input_source (InputSource, optional): 入力ソース（省略時は入力なし）
+            playfield (PlayField, optional): プレイフィールド（BitboardPlayFieldなども指定可能）
+            puyo_manager (PuyoManager, optional): ぷよ管理システム
+            score_manager (ScoreManager, optional): スコア管理システム
+            clock (SimulationClock, optional): シミュレーション時計（skip_waitsで演出の待ち時間を飛ばす）
+        """
+        self.input_source = input_source if input_source is not None else InputSource()
+        self.playfield = playfield if playfield is not None else PlayField()
+        self.puyo_manager = puyo_manager if puyo_manager is not None else PuyoManager()
+        self.score_manager = score_manager if score_manager is not None else ScoreManager()
+        self.audio_manager = NullAudioManager()
+        self.clock = clock if clock is not None else SimulationClock()
+        
+        self.game_systems = GameSystems(
+            self.playfield, self.puyo_manager, self.score_manager,
+            self.audio_manager, self.input_source
+        )
+        self.game_systems.initialize_first_pair()
+        self.game_systems.is_initializing = False
+        self.game_systems.skip_waits = self.clock.skip_waits
+        
+        self.frame_count = 0
+        self.game_over = False
+        self.game_over_reason = ""
+    
+    def step(self):
+        """
+        1フレーム分ゲームを進める
+        
+        Returns:
+            bool: ゲームが継続中の場合True、ゲームオーバーの場合False
+        """
+        if self.game_over:
+            return False
+        
+        self.frame_count += 1
+        self.input_source.update()
+        
+        # GameControllerと同じくシステム更新の前にゲームオーバーを判定する
+        is_game_over, reason = self.check_game_over()
+        if is_game_over:
+            self.game_over = True
+            self.game_over_reason = reason
+            return False
+        
+        self.game_systems.update()
+        return True
+    
+    def run(self, max_frames):
+        """
+        ゲームオーバーまたは指定フレーム数まで進める
+        
+        Args:
+            max_frames (int): 最大フレーム数
+        
+        Returns:
+            int: 実行したフレーム数
+        """
+        start_frame = self.frame_count
+        self.clock.run(lambda tick_index: self.step(), max_frames)
+        return self.frame_count - start_frame
+    
+    def check_game_over(self):
+        """
+        ゲームオーバー判定（GameSystemsのフラグと、GameControllerと共通の盤面の判定）
+        
+        Returns:
+            tuple: (is_game_over: bool, reason: str)
+        """
+        trigger_game_over, reason = self.game_systems.get_game_over_status()
+        if trigger_game_over:
+            return True, reason
+        
+        return self.game_systems.check_board_game_over()
+    
+    def get_score(self):
+        """
+        現在のスコアを取得
+        
+        Returns:
+            int: 現在のスコア
+        """
+        return self.score_manager.get_score()
@@ -1,9 +1,10 @@
 import pyxel
+from src.input_source import InputSource
 
 
-class InputHandler:
+class InputHandler(InputSource):
     """
-    入力処理クラス - キーボード入力の検出と処理
+    入力処理クラス - キーボード入力の検出と処理（pyxel版の入力ソース）
     Requirements: 1.3, 2.1, 2.2, 2.3, 2.4 - 入力処理システム
     """
     
@@ -114,6 +115,15 @@ class InputHandler:
         
         return False
     
+    def is_fast_drop_held(self):
+        """
+        高速落下キーが押され続けているかチェック
+        
+        Returns:
+            bool: 下キーが押されている場合True
+        """
+        return pyxel.btn(pyxel.KEY_DOWN)
+    
     def should_quit_game(self):
         """
         ゲーム終了を実行すべきかチェック
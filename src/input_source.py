@@ -0,0 +1,208 @@
+"""
+InputSource - ゲームシステムが参照する入力の抽象インターフェース
+Requirements: 2.1, 2.2, 2.3, 2.4 - 入力処理とゲームロジックの分離
+"""
+
+# 入力ソースが扱う操作の一覧（ScriptedInputSourceの操作名）
+ACTIONS = (
+    'move_left',
+    'move_right',
+    'rotate_clockwise',
+    'rotate_counterclockwise',
+    'fast_drop',
+    'fast_drop_held',
+)
+
+
+class InputSource:
+    """
+    入力ソースの基底クラス - 何も入力されていない状態を返す
+    GameSystemsはこのインターフェースだけを通して入力を参照する
+    """
+    
+    def update(self):
+        """
+        入力状態の更新（毎フレーム呼び出し）
+        """
+        pass
+    
+    def should_move_left(self):
+        """左移動を実行すべきかチェック"""
+        return False
+    
+    def should_move_right(self):
+        """右移動を実行すべきかチェック"""
+        return False
+    
+    def should_rotate_clockwise(self):
+        """時計回り回転を実行すべきかチェック"""
+        return False
+    
+    def should_rotate_counterclockwise(self):
+        """反時計回り回転を実行すべきかチェック"""
+        return False
+    
+    def should_fast_drop(self):
+        """高速落下（1段移動）を実行すべきかチェック"""
+        return False
+    
+    def is_fast_drop_held(self):
+        """高速落下キーが押され続けているかチェック"""
+        return False
+    
+    def should_start_game(self):
+        """ゲーム開始を実行すべきかチェック"""
+        return False
+    
+    def should_restart_game(self):
+        """ゲーム再開始を実行すべきかチェック"""
+        return False
+    
+    def should_quit_game(self):
+        """ゲーム終了を実行すべきかチェック"""
+        return False
+
+
+class TickInputLatch(InputSource):
+    """
+    ティック単位の入力ソース - 描画フレームごとに読み取った入力をティックに配る
+    
+    1フレームに0回や複数回のティックを進める場合（時間倍率が1以外）でも、
+    押した瞬間の操作は実際に実行されたティックで1回だけ反映し、
+    押し続けている操作（高速落下キー）は全てのティックに反映する。
+    """
+    
+    # 押した瞬間の操作: 次に実行されるティックまで保持し、そのティックの終わりに消す
+    PRESS_QUERIES = (
+        'should_move_left',
+        'should_move_right',
+        'should_rotate_clockwise',
+        'should_rotate_counterclockwise',
+        'should_fast_drop',
+        'should_start_game',
+        'should_restart_game',
+        'should_quit_game',
+    )
+    
+    # 押し続けている操作: フレームごとの状態を全てのティックで返す
+    HELD_QUERIES = (
+        'is_fast_drop_held',
+    )
+    
+    def __init__(self, source):
+        """
+        TickInputLatchの初期化
+        
+        Args:
+            source (InputSource): フレームごとに読み取る入力ソース（差し替え可能）
+        """
+        self.source = source
+        self._pressed = set()
+        self._held = set()
+    
+    def latch(self):
+        """
+        入力ソースの現在のフレームの状態を読み取る（入力ソースのupdate後に毎フレーム呼び出し）
+        押した瞬間の操作はまだ実行されていないものに追加する
+        """
+        source = self.source
+        for query in self.PRESS_QUERIES:
+            if getattr(source, query)():
+                self._pressed.add(query)
+        self._held = {query for query in self.HELD_QUERIES if getattr(source, query)()}
+    
+    def end_tick(self):
+        """
+        ティックの終了時に呼び出す（反映した押した瞬間の操作を消す）
+        """
+        self._pressed.clear()
+    
+    def should_move_left(self):
+        """左移動を実行すべきかチェック"""
+        return 'should_move_left' in self._pressed
+    
+    def should_move_right(self):
+        """右移動を実行すべきかチェック"""
+        return 'should_move_right' in self._pressed
+    
+    def should_rotate_clockwise(self):
+        """時計回り回転を実行すべきかチェック"""
+        return 'should_rotate_clockwise' in self._pressed
+    
+    def should_rotate_counterclockwise(self):
+        """反時計回り回転を実行すべきかチェック"""
+        return 'should_rotate_counterclockwise' in self._pressed
+    
+    def should_fast_drop(self):
+        """高速落下（1段移動）を実行すべきかチェック"""
+        return 'should_fast_drop' in self._pressed
+    
+    def is_fast_drop_held(self):
+        """高速落下キーが押され続けているかチェック"""
+        return 'is_fast_drop_held' in self._held
+    
+    def should_start_game(self):
+        """ゲーム開始を実行すべきかチェック"""
+        return 'should_start_game' in self._pressed
+    
+    def should_restart_game(self):
+        """ゲーム再開始を実行すべきかチェック"""
+        return 'should_restart_game' in self._pressed
+    
+    def should_quit_game(self):
+        """ゲーム終了を実行すべきかチェック"""
+        return 'should_quit_game' in self._pressed
+
+
+class ScriptedInputSource(InputSource):
+    """
+    プログラムから操作を指定する入力ソース - ヘッドレス実行やボット用
+    """
+    
+    def __init__(self):
+        """
+        ScriptedInputSourceの初期化
+        """
+        self.actions = set()
+    
+    def set_actions(self, *actions):
+        """
+        現在のフレームで有効な操作を設定する
+        
+        Args:
+            *actions (str): ACTIONSに含まれる操作名
+        """
+        for action in actions:
+            if action not in ACTIONS:
+                raise ValueError(f"Unknown input action: {action}")
+        self.actions = set(actions)
+    
+    def clear_actions(self):
+        """
+        全ての操作を解除する
+        """
+        self.actions = set()
+    
+    def should_move_left(self):
+        """左移動を実行すべきかチェック"""
+        return 'move_left' in self.actions
+    
+    def should_move_right(self):
+        """右移動を実行すべきかチェック"""
+        return 'move_right' in self.actions
+    
+    def should_rotate_clockwise(self):
+        """時計回り回転を実行すべきかチェック"""
+        return 'rotate_clockwise' in self.actions
+    
+    def should_rotate_counterclockwise(self):
+        """反時計回り回転を実行すべきかチェック"""
+        return 'rotate_counterclockwise' in self.actions
+    
+    def should_fast_drop(self):
+        """高速落下（1段移動）を実行すべきかチェック"""
+        return 'fast_drop' in self.actions
+    
+    def is_fast_drop_held(self):
+        """高速落下キーが押され続けているかチェック"""
+        return 'fast_drop_held' in self.actions
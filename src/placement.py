@@ -0,0 +1,194 @@
+"""
+PlacementEnumerator - ぷよペアの到達可能な最終配置の列挙
+Requirements: 2.2, 2.3, 2.5 - 移動・回転（キック付き）で到達できる配置の一括取得
+"""
+
+
+class PlacementEnumerator:
+    """
+    配置列挙クラス - 列の高さから到達可能な（列, 回転状態）を返す
+    
+    重力処理後の盤面は各列が下に詰まっているため、空きセルは列の高さだけで決まる。
+    また上の段ほど空きセルが多いので、到達可能性は上端付近の数段だけに依存する。
+    そこで上端付近に切り詰めた高さの組をキーとして、PlayFieldと同じ移動・回転・
+    キック規則による探索結果を表に保持し、2回目以降は表引きだけで結果を返す。
+    """
+    
+    SPAWN_X = 2  # 出現位置X（PuyoPairの初期値）
+    SPAWN_Y = 0  # 出現位置Y
+    SPAWN_ROTATION = 2  # 出現時の回転状態（下向き）
+    
+    # 回転状態ごとのサブぷよのオフセット（0: 上, 1: 右, 2: 下, 3: 左）
+    ROTATION_OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+    
+    # キックの試行順序（PlayField.try_rotate_with_kickと同じ）
+    KICK_OFFSETS = ((0, 0), (1, 0), (-1, 0), (0, -1))
+    
+    # 到達可能性に影響する上端からの段数
+    REACH_ROWS = 3
+    
+    def __init__(self, width=6, height=12):
+        """
+        配置列挙の初期化
+        
+        Args:
+            width (int): フィールドの幅
+            height (int): フィールドの高さ
+        """
+        self.width = width
+        self.height = height
+        # 高さ -> 切り詰めた高さ（上端からREACH_ROWS段に入っている段数）
+        clip = height - self.REACH_ROWS
+        self._clipped_heights = [h - clip if h > clip else 0 for h in range(height + 1)]
+        
+        # 切り詰めた高さの組 -> (全配置, 同色ペア用の重複除去済み配置)
+        self._table = {}
+    
+    def get_profile_key(self, heights):
+        """
+        列の高さから表のキー（上端付近に切り詰めた高さの組）を作成
+        
+        Args:
+            heights (sequence): 列ごとの高さ
+        
+        Returns:
+            tuple: 切り詰めた高さの組
+        """
+        return tuple(map(self._clipped_heights.__getitem__, heights))
+    
+    def get_reachable(self, heights, same_color=False):
+        """
+        到達可能な（列, 回転状態）の組を取得
+        
+        Args:
+            heights (sequence): 列ごとの高さ
+            same_color (bool): 同色ペアの場合True（同じ盤面になる配置を1つにまとめる）
+        
+        Returns:
+            tuple: ((x, rotation), ...) メインぷよの列と回転状態の組
+        """
+        key = tuple(map(self._clipped_heights.__getitem__, heights))
+        entry = self._table.get(key)
+        if entry is None:
+            entry = self._build_entry(key)
+            self._table[key] = entry
+        return entry[1] if same_color else entry[0]
+    
+    def precompute(self):
+        """
+        全ての切り詰めた高さの組について表を作成する
+        
+        Returns:
+            int: 表のエントリ数
+        """
+        profiles = [()]
+        for _ in range(self.width):
+            profiles = [profile + (h,) for profile in profiles for h in range(self.REACH_ROWS + 1)]
+        for key in profiles:
+            if key not in self._table:
+                self._table[key] = self._build_entry(key)
+        return len(self._table)
+    
+    def get_landing_positions(self, heights, x, rotation):
+        """
+        指定した列・回転状態のペアを真下に落とした時の着地位置を計算
+        
+        Args:
+            heights (sequence): 列ごとの高さ
+            x (int): メインぷよの列
+            rotation (int): 回転状態
+        
+        Returns:
+            tuple: ((main_x, main_y), (sub_x, sub_y))
+        """
+        dx, dy = self.ROTATION_OFFSETS[rotation]
+        sub_x = x + dx
+        # 両方のぷよが空きセルに収まる最も低い位置
+        main_y = min(self.height - heights[x] - 1, self.height - heights[sub_x] - 1 - dy)
+        return (x, main_y), (sub_x, main_y + dy)
+    
+    def enumerate_placements(self, playfield, puyo_pair=None):
+        """
+        現在の盤面で到達可能な全ての最終配置を取得
+        
+        Args:
+            playfield (PlayField): 対象のプレイフィールド（重力処理済みであること）
+            puyo_pair (PuyoPair, optional): 配置するぷよペア（同色の場合は重複を除去）
+        
+        Returns:
+            list: [(x, rotation, (main_x, main_y), (sub_x, sub_y)), ...]
+        """
+        heights = playfield.get_column_heights()
+        same_color = (puyo_pair is not None and
+                      puyo_pair.get_main_puyo().get_color() == puyo_pair.get_sub_puyo().get_color())
+        placements = []
+        for x, rotation in self.get_reachable(heights, same_color):
+            main_pos, sub_pos = self.get_landing_positions(heights, x, rotation)
+            placements.append((x, rotation, main_pos, sub_pos))
+        return placements
+    
+    def _build_entry(self, key):
+        """
+        切り詰めた高さの組について到達可能な配置を探索する
+        
+        Args:
+            key (tuple): 切り詰めた高さの組
+        
+        Returns:
+            tuple: (全配置, 同色ペア用の重複除去済み配置)
+        """
+        reachable = self._search(key)
+        placements = tuple(sorted(reachable))
+        
+        # 同色ペアでは上向きと下向き、右向きと1列右の左向きが同じ盤面になる
+        unique = []
+        for x, rotation in placements:
+            if rotation == 0 and (x, 2) in reachable:
+                continue
+            if rotation == 3 and (x - 1, 1) in reachable:
+                continue
+            unique.append((x, rotation))
+        return placements, tuple(unique)
+    
+    def _search(self, key):
+        """
+        出現位置から移動・回転（キック付き）で到達できる（列, 回転状態）を幅優先探索する
+        
+        Args:
+            key (tuple): 切り詰めた高さの組
+        
+        Returns:
+            set: {(x, rotation), ...}
+        """
+        width = self.width
+        height = self.height
+        # 切り詰めた高さを上端からの段数に戻す（0の列は底まで空きとみなす）
+        tops = [self.REACH_ROWS - h if h else height for h in key]
+        offsets = self.ROTATION_OFFSETS
+        
+        def can_place(x, y, rotation):
+            dx, dy = offsets[rotation]
+            sub_x = x + dx
+            sub_y = y + dy
+            return (0 <= x < width and 0 <= y < tops[x] and
+                    0 <= sub_x < width and 0 <= sub_y < tops[sub_x])
+        
+        start = (self.SPAWN_X, self.SPAWN_Y, self.SPAWN_ROTATION)
+        if not can_place(*start):
+            return set()
+        
+        visited = {start}
+        queue = [start]
+        for x, y, rotation in queue:
+            candidates = [(x - 1, y, rotation), (x + 1, y, rotation), (x, y + 1, rotation)]
+            for new_rotation in ((rotation + 1) % 4, (rotation - 1) % 4):
+                for kick_x, kick_y in self.KICK_OFFSETS:
+                    if can_place(x + kick_x, y + kick_y, new_rotation):
+                        candidates.append((x + kick_x, y + kick_y, new_rotation))
+                        break
+            for state in candidates:
+                if state not in visited and can_place(*state):
+                    visited.add(state)
+                    queue.append(state)
+        
+        return {(x, rotation) for x, _, rotation in visited}
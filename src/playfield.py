@@ -1,5 +1,7 @@
-import pyxel
+from src.graphics import get_backend
 from src.puyo import Puyo
+from src.sprite_atlas import get_sprite_atlas
+from src.zobrist import get_zobrist_table, COLOR_SLOTS
 
 
 class PlayField:
@@ -8,16 +10,39 @@ class PlayField:
     Requirements: 2.5 - プレイフィールドでのぷよ配置と管理
     """
     
-    def __init__(self):
+    def __init__(self, flyweight=False):
         """
         プレイフィールドの初期化
         6列x12行のグリッドを作成
+        
+        Args:
+            flyweight (bool): Trueの場合、セルには色ごとの共有ぷよ（Puyo.shared）を格納し、
+                ぷよの位置を更新しない（大量の盤面を保持する解析用）
         """
         self.width = 6   # プレイフィールドの幅
         self.height = 12  # プレイフィールドの高さ
+        self.flyweight = flyweight
         
         # 2次元配列でプレイフィールドを初期化（None = 空のセル）
         self.grid = [[None for _ in range(self.width)] for _ in range(self.height)]
+        
+        # 連結グループの追跡（書き込まれたセルの周辺だけを差分更新する）
+        self._groups = None  # グループ番号 -> [(x, y), ...]（Noneは未構築）
+        self._cell_groups = None  # セルごとのグループ番号（グループ外は-1）
+        self._erasable_groups = {}  # 4つ以上のグループ番号 -> [(x, y), ...]
+        self._next_group_id = 0
+        self._dirty_cells = set()  # 前回の更新以降に書き込まれたセル
+        
+        # 盤面のZobristハッシュ（セルの書き込みごとに差分更新する）
+        self._zobrist_table = get_zobrist_table(self.width, self.height)
+        self.zobrist_hash = 0
+        
+        # 色コードのみの盤面表現（行優先、0は空）とUndoログ
+        self._cells = bytearray(self.width * self.height)
+        self._undo_log = None  # [(x, y, 書き換え前のぷよ), ...]（Noneは記録しない）
+        
+        # 列ごとの占有ビット（ビットyが行yに対応）。列の高さや落下距離をビット演算で求める
+        self._column_bits = [0] * self.width
     
     def is_valid_position(self, x, y):
         """
@@ -65,9 +90,12 @@ class PlayField:
         if not self.is_empty(x, y):
             return False
         
-        # ぷよを配置し、位置を更新
-        self.grid[y][x] = puyo
-        puyo.set_position(x, y)
+        # ぷよを配置し、位置を更新（フライウェイト時は色だけを共有ぷよとして格納）
+        if self.flyweight:
+            self._set_cell(x, y, Puyo.shared(puyo.get_color()))
+        else:
+            self._set_cell(x, y, puyo)
+            puyo.set_position(x, y)
         return True
     
     def get_puyo(self, x, y):
@@ -100,7 +128,8 @@ class PlayField:
             return None
         
         puyo = self.grid[y][x]
-        self.grid[y][x] = None
+        if puyo is not None:
+            self._set_cell(x, y, None)
         return puyo
     
     def clear(self):
@@ -109,7 +138,129 @@ class PlayField:
         """
         for y in range(self.height):
             for x in range(self.width):
-                self.grid[y][x] = None
+                if self.grid[y][x] is not None:
+                    self._set_cell(x, y, None)
+    
+    def _set_cell(self, x, y, puyo):
+        """
+        グリッドのセルを書き換える（フィールドへの書き込みは全てここを通す）
+        
+        Args:
+            x (int): X座標
+            y (int): Y座標
+            puyo (Puyo or None): 書き込むぷよ、または空にする場合None
+        """
+        row = self.grid[y]
+        cell = y * self.width + x
+        index = cell * COLOR_SLOTS
+        old_puyo = row[x]
+        if old_puyo is not None:
+            self.zobrist_hash ^= self._zobrist_table[index + old_puyo.get_color()]
+        if puyo is not None:
+            color = puyo.get_color()
+            self.zobrist_hash ^= self._zobrist_table[index + color]
+            self._cells[cell] = color
+            self._column_bits[x] |= 1 << y
+        else:
+            self._cells[cell] = 0
+            self._column_bits[x] &= ~(1 << y)
+        if self._undo_log is not None:
+            self._undo_log.append((x, y, old_puyo))
+        row[x] = puyo
+        # 追跡情報が未構築の間は初回参照時に全体をラベル付けするため記録不要
+        if self._groups is not None:
+            self._dirty_cells.add((x, y))
+    
+    def snapshot(self):
+        """
+        盤面の色配置を不変なバイト列として取得（探索の分岐用）
+        
+        Returns:
+            bytes: 行優先の色コード列（0は空）
+        """
+        return bytes(self._cells)
+    
+    def restore(self, snapshot):
+        """
+        snapshotで取得した盤面に戻す（色が異なるセルだけを書き換える）
+        
+        Args:
+            snapshot (bytes): snapshotの戻り値
+        """
+        cells = self.snapshot()
+        width = self.width
+        for cell, color in enumerate(snapshot):
+            if cells[cell] != color:
+                y, x = divmod(cell, width)
+                if self.flyweight:
+                    self._set_cell(x, y, Puyo.shared(color) if color else None)
+                elif color:
+                    puyo = Puyo(color)
+                    self._set_cell(x, y, puyo)
+                    puyo.set_position(x, y)
+                else:
+                    self._set_cell(x, y, None)
+    
+    def mark_undo(self):
+        """
+        Undoログの記録を開始し、現在の位置を返す
+        
+        Returns:
+            int: undoに渡す記録位置
+        """
+        if self._undo_log is None:
+            self._undo_log = []
+        return len(self._undo_log)
+    
+    def undo(self, mark):
+        """
+        記録位置以降のセルの書き換えを取り消す（place_puyo・erase_puyo_groups・apply_gravityなど）
+        
+        Args:
+            mark (int): mark_undoの戻り値
+        """
+        undo_log = self._undo_log
+        if undo_log is None:
+            return
+        
+        # 取り消し中の書き換えは記録しない
+        self._undo_log = None
+        while len(undo_log) > mark:
+            x, y, puyo = undo_log.pop()
+            self._set_cell(x, y, puyo)
+            if puyo is not None and not self.flyweight:
+                puyo.set_position(x, y)
+        self._undo_log = undo_log
+    
+    def clear_undo_log(self):
+        """
+        Undoログを破棄して記録を停止する
+        """
+        self._undo_log = None
+    
+    def get_hash(self):
+        """
+        盤面の64ビットZobristハッシュを取得（同じ配置なら手順によらず同じ値）
+        
+        Returns:
+            int: 盤面のハッシュ値
+        """
+        return self.zobrist_hash
+    
+    def compute_hash(self):
+        """
+        盤面全体からZobristハッシュを計算し直す（差分更新の検証用）
+        
+        Returns:
+            int: 盤面のハッシュ値
+        """
+        value = 0
+        for y in range(self.height):
+            for x in range(self.width):
+                puyo = self.grid[y][x]
+                if puyo is not None:
+                    value ^= self._zobrist_table[(y * self.width + x) * COLOR_SLOTS + puyo.get_color()]
+        return value
     
     def draw(self, screen_offset_x, screen_offset_y):
         """
@@ -119,26 +270,67 @@ class PlayField:
             screen_offset_x (int): 画面オフセットX
             screen_offset_y (int): 画面オフセットY
         """
-        # プレイフィールドの枠を描画
+        self.draw_background(screen_offset_x, screen_offset_y)
+        self.draw_cells(screen_offset_x, screen_offset_y)
+    
+    def draw_background(self, screen_offset_x, screen_offset_y):
+        """
+        プレイフィールドの枠と内部背景を描画
+        
+        Args:
+            screen_offset_x (int): 画面オフセットX
+            screen_offset_y (int): 画面オフセットY
+        """
         field_width = self.width * 24
         field_height = self.height * 24
+        gfx = get_backend()
         
         # 外枠
-        pyxel.rectb(screen_offset_x - 2, screen_offset_y - 2, 
-                   field_width + 4, field_height + 4, 7)
+        gfx.rectb(screen_offset_x - 2, screen_offset_y - 2, 
+                 field_width + 4, field_height + 4, 7)
         
         # 内部背景
-        pyxel.rect(screen_offset_x, screen_offset_y, 
-                  field_width, field_height, 1)
+        gfx.rect(screen_offset_x, screen_offset_y, 
+                field_width, field_height, 1)
+    
+    def draw_cells(self, screen_offset_x, screen_offset_y, left=0, top=0, right=None, bottom=None):
+        """
+        グリッド内のぷよを描画（範囲を指定した場合はその範囲のセルだけ）
         
-        # グリッド内のぷよを描画
-        for y in range(self.height):
-            for x in range(self.width):
-                puyo = self.grid[y][x]
+        Args:
+            screen_offset_x (int): 画面オフセットX
+            screen_offset_y (int): 画面オフセットY
+            left (int): 描画するセルの左端X
+            top (int): 描画するセルの上端Y
+            right (int, optional): 描画するセルの右端X+1（省略時は盤面の幅）
+            bottom (int, optional): 描画するセルの下端Y+1（省略時は盤面の高さ）
+        """
+        width = self.width
+        if right is None:
+            right = width
+        if bottom is None:
+            bottom = self.height
+        
+        # スプライトアトラスがあれば色コード列から直接bltする
+        atlas = get_sprite_atlas()
+        if atlas is not None:
+            draw = atlas.draw
+            cells = self.snapshot()
+            for y in range(top, bottom):
+                row_start = y * width
+                screen_y = screen_offset_y + y * 24
+                for x in range(left, right):
+                    color = cells[row_start + x]
+                    if color:
+                        draw(screen_offset_x + x * 24, screen_y, color)
+            return
+        
+        for y in range(top, bottom):
+            row = self.grid[y]
+            for x in range(left, right):
+                puyo = row[x]
                 if puyo is not None:
-                    screen_x = screen_offset_x + x * 24
-                    screen_y = screen_offset_y + y * 24
-                    puyo.draw(screen_x, screen_y)
+                    puyo.draw(screen_offset_x + x * 24, screen_offset_y + y * 24)
     
     def get_width(self):
         """プレイフィールドの幅を取得"""
@@ -148,6 +340,89 @@ class PlayField:
         """プレイフィールドの高さを取得"""
         return self.height
     
+    def get_column_heights(self):
+        """
+        各列の高さ（最上段のぷよから底までの段数）を取得
+        
+        Returns:
+            tuple: 列ごとの高さ（空の列は0）
+        """
+        return tuple(self.get_column_height(x) for x in range(self.width))
+    
+    def get_column_height(self, x):
+        """
+        指定列の高さ（最上段のぷよから底までの段数）を取得
+        
+        Args:
+            x (int): 列番号
+        
+        Returns:
+            int: 列の高さ（空の列は0）
+        """
+        bits = self._column_bits[x]
+        # 最下位ビットが最上段のぷよに対応する
+        return self.height - (bits & -bits).bit_length() + 1 if bits else 0
+    
+    def find_column_reaching_top(self):
+        """
+        上端（y=0）にぷよがある列を探す
+        
+        Returns:
+            int: 最初に見つかった列番号、ない場合-1
+        """
+        for x, bits in enumerate(self._column_bits):
+            if bits & 1:
+                return x
+        return -1
+    
+    def count_puyos_in_top_rows(self, rows):
+        """
+        上から指定した行数以内にあるぷよの数を数える
+        
+        Args:
+            rows (int): 対象の行数
+        
+        Returns:
+            int: ぷよの数
+        """
+        mask = (1 << rows) - 1
+        return sum(bin(bits & mask).count("1") for bits in self._column_bits)
+    
+    def drop_to_rest(self, column, y=0):
+        """
+        指定列の指定行から落としたぷよが止まる行を求める
+        
+        Args:
+            column (int): 列番号
+            y (int): 落下を開始する行
+        
+        Returns:
+            int: 停止する行（開始行より下で最初にぷよがある行の1つ上、なければ最下段）
+        """
+        below = self._column_bits[column] >> (y + 1)
+        if not below:
+            return self.height - 1
+        return y + (below & -below).bit_length() - 1
+    
+    def get_pair_drop_distance(self, puyo_pair):
+        """
+        ぷよペアを真下に落とした時の落下段数を求める
+        
+        Args:
+            puyo_pair (PuyoPair): 対象のぷよペア
+        
+        Returns:
+            int: 落下できる段数
+        """
+        (main_x, main_y), (sub_x, sub_y) = puyo_pair.get_puyo_positions()
+        if main_x == sub_x:
+            # 縦向きは下側のぷよだけで決まる
+            lower_y = max(main_y, sub_y)
+            return self.drop_to_rest(main_x, lower_y) - lower_y
+        # 横向きは両列のうち短い方の落下距離で止まる
+        return min(self.drop_to_rest(main_x, main_y) - main_y,
+                   self.drop_to_rest(sub_x, sub_y) - sub_y)
+    
     def get_all_puyos(self):
         """
         プレイフィールド内の全てのぷよを取得
@@ -297,28 +572,44 @@ class PlayField:
         
         Requirements: 3.3 - ぷよ消去後の重力処理
         """
-        moved = False
+        return bool(self.apply_gravity_moves())
+    
+    def apply_gravity_moves(self):
+        """
+        1回の走査で全ての列を下に詰め、ぷよの移動を返す
+        下に詰まっている列は列の占有ビットだけで判定して走査しない
+        
+        Returns:
+            list: [(x, from_y, to_y), ...] 各列の下のぷよから順の移動リスト（移動なしは空）
+        
+        Requirements: 3.3 - ぷよ消去後の重力処理
+        """
+        moves = []
+        height = self.height
+        grid = self.grid
         
-        # 下から上に向かって各列をチェック
         for x in range(self.width):
-            # 各列で下から上に向かってぷよを詰める
-            write_y = self.height - 1  # 書き込み位置（下から）
+            bits = self._column_bits[x]
+            count = bin(bits).count("1")
+            # 下詰め済みの列は移動なし
+            if bits == ((1 << count) - 1) << (height - count):
+                continue
             
-            for read_y in range(self.height - 1, -1, -1):  # 読み取り位置（下から上へ）
-                puyo = self.grid[read_y][x]
-                
-                if puyo is not None:
-                    # ぷよが存在する場合
+            # 下から上に向かってぷよを詰める
+            write_y = height - 1  # 書き込み位置（下から）
+            for read_y in range(height - 1, -1, -1):  # 読み取り位置（下から上へ）
+                if (bits >> read_y) & 1:
                     if write_y != read_y:
                         # 移動が必要
-                        self.grid[write_y][x] = puyo
-                        self.grid[read_y][x] = None
-                        puyo.set_position(x, write_y)
-                        moved = True
-                    
+                        puyo = grid[read_y][x]
+                        self._set_cell(x, read_y, None)
+                        self._set_cell(x, write_y, puyo)
+                        if not self.flyweight:
+                            puyo.set_position(x, write_y)
+                        moves.append((x, read_y, write_y))
                     write_y -= 1  # 次の書き込み位置
         
-        return moved
+        return moves
     
     def find_connected_groups(self):
         """
@@ -329,82 +620,150 @@ class PlayField:
         
         Requirements: 3.1 - 同色ぷよの隣接判定と連結グループの検出
         """
-        visited = [[False for _ in range(self.width)] for _ in range(self.height)]
-        connected_groups = []
-        
-        # 全てのセルをチェック
-        for y in range(self.height):
-            for x in range(self.width):
-                puyo = self.grid[y][x]
-                
-                # ぷよが存在し、まだ訪問していない場合
-                if puyo is not None and not visited[y][x]:
-                    # 深度優先探索で連結グループを検出
-                    group = self._dfs_connected_group(x, y, puyo.get_color(), visited)
-                    
-                    # グループが見つかった場合は追加
-                    if group:
-                        connected_groups.append(group)
-        
-        return connected_groups
+        self._refresh_groups()
+        return list(self._groups.values())
+    
+    def _refresh_groups(self):
+        """
+        連結グループの追跡情報を最新にする
+        初回は全体をラベル付けし、以降は書き込まれたセルとそのグループだけを再探索する
+        """
+        if self._groups is None:
+            groups, labels = self._label_connected_groups()
+            self._groups = dict(enumerate(groups))
+            self._cell_groups = labels
+            self._next_group_id = len(groups)
+            self._erasable_groups = {
+                group_id: group for group_id, group in self._groups.items() if len(group) >= 4
+            }
+            self._dirty_cells = set()
+            return
+        
+        if not self._dirty_cells:
+            return
+        
+        groups = self._groups
+        cell_groups = self._cell_groups
+        erasable_groups = self._erasable_groups
+        
+        # 書き込まれたセルが属していたグループを解体し、再探索の起点にする
+        seeds = []
+        for x, y in self._dirty_cells:
+            seeds.append((x, y))
+            group_id = cell_groups[y][x]
+            if group_id >= 0 and group_id in groups:
+                members = groups.pop(group_id)
+                erasable_groups.pop(group_id, None)
+                for member_x, member_y in members:
+                    cell_groups[member_y][member_x] = -1
+                seeds.extend(members)
+            cell_groups[y][x] = -1
+        self._dirty_cells = set()
+        
+        # 起点から同色セルを反復的に探索してグループを作り直す
+        grid = self.grid
+        width = self.width
+        height = self.height
+        for seed_x, seed_y in seeds:
+            if cell_groups[seed_y][seed_x] >= 0:
+                continue
+            puyo = grid[seed_y][seed_x]
+            if puyo is None:
+                continue
+            color = puyo.get_color()
+            # お邪魔ぷよ（色コード5）は連結グループに含めない
+            if color == 5:
+                continue
+            
+            group_id = self._next_group_id
+            self._next_group_id += 1
+            cell_groups[seed_y][seed_x] = group_id
+            members = [(seed_x, seed_y)]
+            stack = [(seed_x, seed_y)]
+            while stack:
+                x, y = stack.pop()
+                for next_x, next_y in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                    if not (0 <= next_x < width and 0 <= next_y < height):
+                        continue
+                    neighbor = grid[next_y][next_x]
+                    if neighbor is None or neighbor.get_color() != color:
+                        continue
+                    old_group_id = cell_groups[next_y][next_x]
+                    if old_group_id == group_id:
+                        continue
+                    if old_group_id >= 0:
+                        # 隣接する既存グループは新しいグループに取り込む
+                        groups.pop(old_group_id, None)
+                        erasable_groups.pop(old_group_id, None)
+                    cell_groups[next_y][next_x] = group_id
+                    members.append((next_x, next_y))
+                    stack.append((next_x, next_y))
+            
+            groups[group_id] = members
+            if len(members) >= 4:
+                erasable_groups[group_id] = members
     
-    def _dfs_connected_group(self, start_x, start_y, target_color, visited):
+    def _label_connected_groups(self):
         """
-        深度優先探索で同色の連結グループを検出
-        
-        Args:
-            start_x (int): 開始X座標
-            start_y (int): 開始Y座標
-            target_color (int): 対象の色
-            visited (list): 訪問済みフラグの2次元配列
+        Union-Findで全ての同色連結グループを1回の走査でラベル付けする
+        再帰を使わないため、フィールドを拡張しても再帰上限に達しない
+        （追跡情報の初回構築に使用）
         
         Returns:
-            list: [(x, y), ...] 連結グループの座標リスト
-        """
-        # 境界チェック
-        if not self.is_valid_position(start_x, start_y):
-            return []
-        
-        # 既に訪問済みの場合
-        if visited[start_y][start_x]:
-            return []
-        
-        # ぷよが存在しない場合
-        puyo = self.grid[start_y][start_x]
-        if puyo is None:
-            return []
-        
-        # お邪魔ぷよ（色コード5）は連結グループに含めない
-        if puyo.get_color() == 5:  # お邪魔ぷよ
-            return []
-        
-        # 色が異なる場合
-        if puyo.get_color() != target_color:
-            return []
-        
-        # 現在の位置を訪問済みにマーク
-        visited[start_y][start_x] = True
-        
-        # 現在の位置を結果に追加
-        group = [(start_x, start_y)]
-        
-        # 4方向（上下左右）を探索
-        directions = [
-            (0, -1),  # 上
-            (0, 1),   # 下
-            (-1, 0),  # 左
-            (1, 0)    # 右
-        ]
-        
-        for dx, dy in directions:
-            next_x = start_x + dx
-            next_y = start_y + dy
-            
-            # 再帰的に隣接する同色ぷよを探索
-            adjacent_group = self._dfs_connected_group(next_x, next_y, target_color, visited)
-            group.extend(adjacent_group)
-        
-        return group
+            tuple: (グループのリスト [[(x, y), ...], ...],
+                    セルごとのグループ番号の2次元配列（グループ外は-1）)
+        """
+        width = self.width
+        height = self.height
+        parent = list(range(width * height))
+        colors = [0] * (width * height)
+        
+        def find_root(index):
+            # 経路半減で根を探す
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+        
+        # 左と上の同色セルと併合しながら走査
+        for y in range(height):
+            row = self.grid[y]
+            for x in range(width):
+                puyo = row[x]
+                if puyo is None:
+                    continue
+                color = puyo.get_color()
+                # お邪魔ぷよ（色コード5）は連結グループに含めない
+                if color == 5:
+                    continue
+                index = y * width + x
+                colors[index] = color
+                if x > 0 and colors[index - 1] == color:
+                    parent[find_root(index - 1)] = find_root(index)
+                if y > 0 and colors[index - width] == color:
+                    root_up = find_root(index - width)
+                    root = find_root(index)
+                    if root_up != root:
+                        parent[root_up] = root
+        
+        # 根ごとにグループを組み立てる
+        groups = []
+        labels = [[-1] * width for _ in range(height)]
+        root_labels = {}
+        for index in range(width * height):
+            if colors[index] == 0:
+                continue
+            root = find_root(index)
+            label = root_labels.get(root)
+            if label is None:
+                label = len(groups)
+                root_labels[root] = label
+                groups.append([])
+            y, x = divmod(index, width)
+            groups[label].append((x, y))
+            labels[y][x] = label
+        
+        return groups, labels
     
     def find_erasable_groups(self):
         """
@@ -415,15 +774,8 @@ class PlayField:
         
         Requirements: 3.1 - 4つ以上の連結グループの検出
         """
-        all_groups = self.find_connected_groups()
-        erasable_groups = []
-        
-        # 4つ以上のグループのみを抽出
-        for group in all_groups:
-            if len(group) >= 4:
-                erasable_groups.append(group)
-        
-        return erasable_groups
+        self._refresh_groups()
+        return list(self._erasable_groups.values())
     
     def get_adjacent_positions(self, x, y):
         """
@@ -464,14 +816,15 @@ class PlayField:
         Returns:
             int: 連結している同色ぷよの数（自分を含む）
         """
-        puyo = self.get_puyo(x, y)
-        if puyo is None:
+        if not self.is_valid_position(x, y):
             return 0
         
-        visited = [[False for _ in range(self.width)] for _ in range(self.height)]
-        group = self._dfs_connected_group(x, y, puyo.get_color(), visited)
+        self._refresh_groups()
+        group_id = self._cell_groups[y][x]
+        if group_id < 0:
+            return 0
         
-        return len(group)
+        return len(self._groups[group_id])
     
     def erase_puyo_groups(self, groups_to_erase):
         """
@@ -501,7 +854,7 @@ class PlayField:
         for x, y in positions_to_erase:
             if self.is_valid_position(x, y) and self.grid[y][x] is not None:
                 # 通常のぷよを消去
-                self.grid[y][x] = None
+                self._set_cell(x, y, None)
                 total_erased += 1
                 
                 # 隣接するお邪魔ぷよをチェック
@@ -515,7 +868,7 @@ class PlayField:
         # お邪魔ぷよを消去
         for x, y in obstacle_positions:
             if self.is_valid_position(x, y) and self.grid[y][x] is not None:
-                self.grid[y][x] = None
+                self._set_cell(x, y, None)
                 total_erased += 1
         
         return total_erased
@@ -540,6 +893,47 @@ class PlayField:
         
         return True, total_erased, len(erasable_groups)
     
+    def resolve_chain(self, score_manager=None):
+        """
+        フレームタイマーを使わずに連鎖を最後まで解決する
+        GameSystemsの演出付き処理と同じ順序（消去判定→重力→消去判定）で盤面を進める
+        
+        Args:
+            score_manager (ScoreManager, optional): 指定した場合は各ステップのスコアも計算する
+        
+        Returns:
+            list: 連鎖ステップごとの記録のリスト。各要素は次のキーを持つ辞書
+                chain_level (int): 連鎖レベル（1から開始）
+                groups (list): 消去したグループ [[(x, y), ...], ...]
+                colors (list): 各グループの色
+                cleared_count (int): グループ内のぷよ数の合計（スコア計算対象）
+                erased_count (int): 実際に消去したぷよ数（お邪魔ぷよを含む）
+                score (int): ステップのスコア（score_manager指定時のみ）
+        
+        Requirements: 3.1, 3.3, 3.4 - 消去・重力・連鎖判定の一括処理
+        """
+        steps = []
+        
+        while True:
+            groups = self.find_erasable_groups()
+            
+            if groups:
+                step = {
+                    'chain_level': len(steps) + 1,
+                    'groups': groups,
+                    'colors': self.get_puyo_colors_in_groups(groups),
+                    'cleared_count': sum(len(group) for group in groups),
+                }
+                if score_manager is not None:
+                    step['score'] = score_manager.calculate_chain_score(groups, step['chain_level'])
+                step['erased_count'] = self.erase_puyo_groups(groups)
+                steps.append(step)
+            
+            # 消去の有無にかかわらず重力を適用し、何も変化しなければ安定
+            moved = self.apply_gravity()
+            if not groups and not moved:
+                return steps
+    
     def get_puyo_colors_in_groups(self, groups):
         """
         指定されたグループ内のぷよの色情報を取得
@@ -601,16 +995,8 @@ class PlayField:
         if y == self.height - 1:
             return False
         
-        # 下に何かあるかチェック
-        below_y = y + 1
-        while below_y < self.height:
-            if self.grid[below_y][x] is not None:
-                # 下にぷよがある場合は浮いていない
-                return False
-            below_y += 1
-        
         # 下に何もない場合は浮いている
-        return True
+        return not self._column_bits[x] >> (y + 1)
     
     def calculate_fall_distance(self, x, y):
         """
@@ -633,17 +1019,5 @@ class PlayField:
         if y == self.height - 1:
             return 0
         
-        # 下方向に空きスペースを探す
-        fall_distance = 0
-        check_y = y + 1
-        
-        while check_y < self.height:
-            if self.grid[check_y][x] is None:
-                # 空きがある場合は落下距離を増やす
-                fall_distance += 1
-                check_y += 1
-            else:
-                # ぷよがある場合は停止
-                break
-        
-        return fall_distance
\ No newline at end of file
+        # 下方向で最初にぷよがある行の手前まで落下する
+        return self.drop_to_rest(x, y) - y
\ No newline at end of file
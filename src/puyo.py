@@ -1,4 +1,5 @@
-import pyxel
+from src.graphics import get_backend
+from src.sprite_atlas import draw_puyo_shape, get_sprite_atlas
 
 
 class Puyo:
@@ -7,6 +8,10 @@ class Puyo:
     Requirements: 5.1 - システムは異なる色で区別可能なぷよを描画する
     """
     
+    __slots__ = ('color', 'x', 'y')
+    
+    _shared = {}  # 色 -> 共有インスタンス（フライウェイト）
+    
     def __init__(self, color, x=0, y=0):
         """
         ぷよの初期化
@@ -22,50 +27,17 @@ class Puyo:
     
     def draw(self, screen_x, screen_y):
         """
-        ぷよを画面に描画する
+        ぷよを画面に描画する（スプライトアトラスがあれば1回のbltで描く）
         
         Args:
             screen_x (int): 画面上のX座標
             screen_y (int): 画面上のY座標
         """
-        # デザイン文書の色定義に基づく色マッピング
-        color_map = {
-            1: 8,   # 赤
-            2: 9,   # オレンジ
-            3: 11,  # 緑
-            4: 12,  # 青
-            5: 13   # お邪魔ぷよ（紫）
-        }
-        
-        # ぷよのサイズは24x24ピクセル（デザイン文書に基づく）
-        puyo_size = 24
-        
-        # 有効な色の場合のみ描画
-        if self.color in color_map:
-            draw_color = color_map[self.color]
-            
-            # お邪魔ぷよの場合は特別な描画
-            if self.color == 5:  # お邪魔ぷよ
-                # お邪魔ぷよは角のある形状で描画
-                pyxel.rect(screen_x + 2, screen_y + 2, puyo_size - 4, puyo_size - 4, draw_color)
-                pyxel.rectb(screen_x + 2, screen_y + 2, puyo_size - 4, puyo_size - 4, 7)
-                
-                # お邪魔ぷよの特徴的な模様（X印）
-                pyxel.line(screen_x + 6, screen_y + 6, screen_x + puyo_size - 6, screen_y + puyo_size - 6, 7)
-                pyxel.line(screen_x + puyo_size - 6, screen_y + 6, screen_x + 6, screen_y + puyo_size - 6, 7)
-            else:
-                # 通常のぷよは円形で描画
-                # ぷよ本体を描画（塗りつぶし円）
-                pyxel.circ(screen_x + puyo_size // 2, screen_y + puyo_size // 2, 
-                          puyo_size // 2 - 2, draw_color)
-                
-                # ぷよの輪郭を描画（白色の円）
-                pyxel.circb(screen_x + puyo_size // 2, screen_y + puyo_size // 2, 
-                           puyo_size // 2 - 2, 7)
-                
-                # ぷよの光沢効果（小さな白い円）
-                pyxel.circ(screen_x + puyo_size // 2 - 4, screen_y + puyo_size // 2 - 4, 
-                          2, 7)
+        atlas = get_sprite_atlas()
+        if atlas is not None:
+            atlas.draw(screen_x, screen_y, self.color)
+        else:
+            draw_puyo_shape(get_backend(), screen_x, screen_y, self.color)
     
     def draw_small(self, screen_x, screen_y):
         """
@@ -75,42 +47,30 @@ class Puyo:
             screen_x (int): 画面上のX座標
             screen_y (int): 画面上のY座標
         """
-        # デザイン文書の色定義に基づく色マッピング
-        color_map = {
-            1: 8,   # 赤
-            2: 9,   # オレンジ
-            3: 11,  # 緑
-            4: 12,  # 青
-            5: 13   # お邪魔ぷよ（紫）
-        }
+        atlas = get_sprite_atlas()
+        if atlas is not None:
+            atlas.draw_small(screen_x, screen_y, self.color)
+        else:
+            draw_puyo_shape(get_backend(), screen_x, screen_y, self.color, small=True)
+    
+    @classmethod
+    def shared(cls, color):
+        """
+        色ごとに1つだけ生成される共有ぷよを取得する（盤面の色表現用のフライウェイト）
+        
+        共有ぷよは複数のセルから参照されるため、位置は更新しない。
         
-        # 小さいぷよのサイズは16x16ピクセル
-        puyo_size = 16
+        Args:
+            color (int): ぷよの色
         
-        # 有効な色の場合のみ描画
-        if self.color in color_map:
-            draw_color = color_map[self.color]
-            
-            # お邪魔ぷよの場合は特別な描画
-            if self.color == 5:  # お邪魔ぷよ
-                # お邪魔ぷよは角のある形状で描画
-                pyxel.rect(screen_x + 1, screen_y + 1, puyo_size - 2, puyo_size - 2, draw_color)
-                pyxel.rectb(screen_x + 1, screen_y + 1, puyo_size - 2, puyo_size - 2, 7)
-                
-                # お邪魔ぷよの特徴的な模様（X印）
-                pyxel.line(screen_x + 3, screen_y + 3, screen_x + puyo_size - 3, screen_y + puyo_size - 3, 7)
-                pyxel.line(screen_x + puyo_size - 3, screen_y + 3, screen_x + 3, screen_y + puyo_size - 3, 7)
-            else:
-                # 通常のぷよは円形で描画
-                # ぷよ本体を描画（塗りつぶし円）
-                pyxel.circ(screen_x + puyo_size // 2, screen_y + puyo_size // 2, 
-                          puyo_size // 2 - 1, draw_color)
-                
-                # ぷよの輪郭を描画（白色の円）
-                pyxel.circb(screen_x + puyo_size // 2, screen_y + puyo_size // 2, 
-                           puyo_size // 2 - 1, 7)
-                
-                # 小さいサイズでは光沢効果は省略（シンプルに）
+        Returns:
+            Puyo: 指定色の共有インスタンス
+        """
+        puyo = cls._shared.get(color)
+        if puyo is None:
+            puyo = cls(color)
+            cls._shared[color] = puyo
+        return puyo
     
     def get_color(self):
         """
@@ -1,3 +1,8 @@
+import random
+from array import array
+from bisect import bisect_left
+from collections import deque
+
 from src.puyo import Puyo
 from src.puyo_pair import PuyoPair
 
@@ -8,12 +13,18 @@ class PuyoManager:
     Requirements: 4.2 - 新しいぷよペアの生成システム
     """
     
-    def __init__(self):
+    # 色ごとの出現回数の組 -> (累積重みの表, 重みの合計)（全インスタンスで共有）
+    _weight_tables = {}
+    
+    def __init__(self, seed=None):
         """
         PuyoManagerの初期化
+        
+        Args:
+            seed (int, optional): 乱数シード（同じシードなら同じ順番でぷよペアが出現する）
         """
-        import random
-        self.random = random
+        self.seed = seed
+        self.random = random.Random(seed)  # マネージャーごとの乱数生成器
         
         # 利用可能な色（1-4）
         self.available_colors = [1, 2, 3, 4]
@@ -22,8 +33,9 @@ class PuyoManager:
         self.OBSTACLE_PUYO = 5  # お邪魔ぷよの色コード
         
         # 色の出現履歴（バランスの取れた色分布のため）
-        self.color_history = []
         self.history_max_size = 8  # 履歴の最大サイズ
+        self.color_history = deque(maxlen=self.history_max_size)
+        self._color_counts = {}  # 履歴中の色ごとの出現回数
         
         # 難易度設定（0.0-1.0、高いほど難しい）
         self.difficulty = 0.5
@@ -52,44 +64,112 @@ class PuyoManager:
         if self.random.random() < 0.2:
             return self.random.choice(self.available_colors)
         
-        # 履歴に基づいた重み付け
-        if len(self.color_history) > 0:
-            # 各色の出現回数をカウント
-            color_counts = {color: 0 for color in self.available_colors}
-            for color in self.color_history:
-                if color in color_counts:
-                    color_counts[color] += 1
+        # 履歴に基づいた重み付け（出現回数が少ない色ほど出やすい）
+        colors = self.available_colors
+        if self.color_history:
+            counts = self._color_counts
+            key = tuple([counts.get(color, 0) for color in colors])
+            table = self._weight_tables.get(key)
+            if table is None:
+                table = self._build_weight_table(key)
+            cumulative, total_weight = table
             
-            # 出現回数が少ない色ほど重みを大きくする
-            weights = {}
-            max_count = max(color_counts.values()) if color_counts else 1
-            for color, count in color_counts.items():
-                # 出現回数が少ないほど重みが大きくなる
-                weights[color] = max_count - count + 1
-            
-            # 重み付き抽選
-            total_weight = sum(weights.values())
-            r = self.random.uniform(0, total_weight)
-            cumulative_weight = 0
-            for color, weight in weights.items():
-                cumulative_weight += weight
-                if r <= cumulative_weight:
-                    selected_color = color
-                    break
+            # 重み付き抽選（r <= 累積重み となる最初の色）
+            index = bisect_left(cumulative, self.random.uniform(0, total_weight))
+            if index < len(colors):
+                selected_color = colors[index]
             else:
                 # 万が一の場合は完全ランダム
-                selected_color = self.random.choice(self.available_colors)
+                selected_color = self.random.choice(colors)
         else:
             # 履歴がない場合は完全ランダム
-            selected_color = self.random.choice(self.available_colors)
-        
-        # 履歴を更新
-        self.color_history.append(selected_color)
-        if len(self.color_history) > self.history_max_size:
-            self.color_history.pop(0)  # 古い履歴を削除
+            selected_color = self.random.choice(colors)
         
+        self._push_color_history(selected_color)
         return selected_color
     
+    def draw_colors(self, count):
+        """
+        generate_random_colorをcount回呼び出した場合と同じ色を一括で生成する
+        
+        Args:
+            count (int): 生成する色の数
+        
+        Returns:
+            array: 色コード配列（array('B')）
+        """
+        rand = self.random.random
+        uniform = self.random.uniform
+        choice = self.random.choice
+        colors = self.available_colors
+        color_count = len(colors)
+        history = self.color_history
+        counts = self._color_counts
+        tables = self._weight_tables
+        push = self._push_color_history
+        
+        result = array('B')
+        append = result.append
+        for _ in range(count):
+            if rand() < 0.2:
+                append(choice(colors))
+                continue
+            if history:
+                key = tuple([counts.get(color, 0) for color in colors])
+                table = tables.get(key)
+                if table is None:
+                    table = self._build_weight_table(key)
+                index = bisect_left(table[0], uniform(0, table[1]))
+                color = colors[index] if index < color_count else choice(colors)
+            else:
+                color = choice(colors)
+            push(color)
+            append(color)
+        return result
+    
+    def _push_color_history(self, color):
+        """
+        色の出現履歴に追加する（溢れた古い履歴は出現回数からも除く）
+        
+        Args:
+            color (int): 出現した色
+        """
+        history = self.color_history
+        counts = self._color_counts
+        if len(history) == history.maxlen:
+            counts[history[0]] -= 1
+        history.append(color)
+        counts[color] = counts.get(color, 0) + 1
+    
+    def _clear_color_history(self):
+        """
+        色の出現履歴をクリアする
+        """
+        self.color_history = deque(maxlen=self.history_max_size)
+        self._color_counts = {}
+    
+    @classmethod
+    def _build_weight_table(cls, key):
+        """
+        色ごとの出現回数の組から累積重みの表を作成する
+        
+        Args:
+            key (tuple): available_colorsの順に並べた出現回数
+        
+        Returns:
+            tuple: (累積重みのリスト, 重みの合計)
+        """
+        # 出現回数が少ないほど重みが大きくなる
+        max_count = max(key) if key else 1
+        cumulative = []
+        total_weight = 0
+        for count in key:
+            total_weight += max_count - count + 1
+            cumulative.append(total_weight)
+        table = (cumulative, total_weight)
+        cls._weight_tables[key] = table
+        return table
+    
     def create_random_puyo_pair(self, x=2, y=0):
         """
         ランダムな色のぷよペアを作成
@@ -102,6 +182,16 @@ class PuyoManager:
         Returns:
             PuyoPair: 新しいランダムなぷよペア
         """
+        main_color, sub_color = self._generate_pair_colors()
+        return PuyoPair(Puyo(main_color), Puyo(sub_color), x, y)
+    
+    def _generate_pair_colors(self):
+        """
+        通常のぷよペアの色を抽選する
+        
+        Returns:
+            tuple: (main_color, sub_color)
+        """
         main_color = self.generate_random_color()
         
         # 難易度に応じて同色ペアの確率を調整
@@ -120,10 +210,7 @@ class PuyoManager:
                 sub_color = self.generate_random_color()
                 attempts += 1
         
-        main_puyo = Puyo(main_color)
-        sub_puyo = Puyo(sub_color)
-        
-        return PuyoPair(main_puyo, sub_puyo, x, y)
+        return main_color, sub_color
     
     def generate_initial_pairs(self):
         """
@@ -175,29 +262,77 @@ class PuyoManager:
         # PuyoPairの初期回転状態が下向きなので、そのまま使用
         self.current_pair.set_position(2, 0)  # 初期位置を上端に設定
         
+        # 新しい次の次のペアを生成
+        main_color, sub_color = self._advance_pair_colors()
+        self.next_next_pair = PuyoPair(Puyo(main_color), Puyo(sub_color))
+        
+        return self.current_pair
+    
+    def _advance_pair_colors(self):
+        """
+        ペアを1つ進めた時に新しく生成される次の次のペアの色を抽選する
+        
+        Returns:
+            tuple: (main_color, sub_color)
+        """
         # お邪魔ぷよカウンターを更新
         self.obstacle_counter += 1
         
-        # 新しい次の次のペアを生成
         if self.should_generate_obstacle_puyo():
-            self.next_next_pair = self.create_obstacle_puyo_pair()
             self.obstacle_counter = 0  # カウンターリセット
-        else:
-            self.next_next_pair = self.create_random_puyo_pair()
+            return self._generate_obstacle_pair_colors()
+        return self._generate_pair_colors()
+    
+    def generate_pair_sequence(self, count):
+        """
+        現在のペアから先のcount個のペアの色を事前に生成する
+        実際のゲーム進行（advance_to_next_pair）と同じ乱数消費で抽選し、現在の状態は変更しない
         
-        return self.current_pair
+        Args:
+            count (int): 生成するペアの数
+        
+        Returns:
+            array: [main0, sub0, main1, sub1, ...] の色コード配列（array('B')）
+        """
+        colors = array('B')
+        for pair in (self.current_pair, self.next_pair, self.next_next_pair):
+            if len(colors) >= count * 2:
+                return colors
+            colors.append(pair.get_main_puyo().get_color())
+            colors.append(pair.get_sub_puyo().get_color())
+        
+        # 乱数と履歴の状態を退避して先読みし、最後に元に戻す
+        random_state = self.random.getstate()
+        color_history = self.color_history.copy()
+        color_counts = dict(self._color_counts)
+        obstacle_counter = self.obstacle_counter
+        try:
+            while len(colors) < count * 2:
+                colors.extend(self._advance_pair_colors())
+        finally:
+            self.random.setstate(random_state)
+            self.color_history = color_history
+            self._color_counts = color_counts
+            self.obstacle_counter = obstacle_counter
+        return colors
     
-    def reset(self):
+    def reset(self, seed=None):
         """
         PuyoManagerをリセット（新しいゲーム開始時）
+        
+        Args:
+            seed (int, optional): 指定した場合は乱数生成器をこのシードで初期化し直す
         """
+        if seed is not None:
+            self.seed = seed
+            self.random.seed(seed)
         # 色履歴をクリア
-        self.color_history = []
+        self._clear_color_history()
         # お邪魔ぷよカウンターをリセット
         self.obstacle_counter = 0
         # 初期ペア（現在、次、次の次）を生成
         self.generate_initial_pairs()
-        
+    
     def set_difficulty(self, difficulty):
         """
         難易度を設定する
@@ -231,18 +366,23 @@ class PuyoManager:
         Returns:
             PuyoPair: お邪魔ぷよを含むペア
         """
+        main_color, sub_color = self._generate_obstacle_pair_colors()
+        return PuyoPair(Puyo(main_color), Puyo(sub_color), x, y)
+    
+    def _generate_obstacle_pair_colors(self):
+        """
+        お邪魔ぷよペアの色を抽選する
+        
+        Returns:
+            tuple: (main_color, sub_color)
+        """
         # 難易度に応じてお邪魔ぷよの数を決定
         if self.random.random() < self.difficulty:
             # 難易度が高い場合、両方お邪魔ぷよ
-            main_puyo = Puyo(self.OBSTACLE_PUYO)
-            sub_puyo = Puyo(self.OBSTACLE_PUYO)
-        else:
-            # 片方だけお邪魔ぷよ
-            main_puyo = Puyo(self.OBSTACLE_PUYO)
-            sub_color = self.generate_random_color()
-            sub_puyo = Puyo(sub_color)
+            return self.OBSTACLE_PUYO, self.OBSTACLE_PUYO
         
-        return PuyoPair(main_puyo, sub_puyo, x, y)
+        # 片方だけお邪魔ぷよ
+        return self.OBSTACLE_PUYO, self.generate_random_color()
     
     def draw_next_pair_preview(self, screen_x, screen_y):
         """
@@ -7,6 +7,8 @@ class PuyoPair:
     Requirements: 2.2, 2.3 - ぷよペアの回転と移動機能
     """
     
+    __slots__ = ('main_puyo', 'sub_puyo', 'x', 'y', 'rotation')
+    
     def __init__(self, main_puyo, sub_puyo, x=2, y=0):
         """
         ぷよペアの初期化
@@ -0,0 +1,393 @@
+"""
+Replay - 入力の記録と再生（コンパクトなバイナリ形式）
+Requirements: 2.1, 2.2, 2.3, 2.4, 4.2 - 入力とぷよペアの出現順の再現
+"""
+
+import random
+import struct
+
+from src.headless import HeadlessGame
+from src.input_source import ACTIONS, InputSource
+from src.puyo_manager import PuyoManager
+
+
+REPLAY_MAGIC = b'KRPL'
+REPLAY_VERSION = 1
+
+# 入力ビットマスクのビット番号はACTIONSの順
+ACTION_BITS = {action: 1 << index for index, action in enumerate(ACTIONS)}
+MASK_BITS = len(ACTIONS)
+MASK_LIMIT = 1 << MASK_BITS
+
+# InputSourceの問い合わせメソッド -> 操作名
+_QUERY_ACTIONS = (
+    ('should_move_left', 'move_left'),
+    ('should_move_right', 'move_right'),
+    ('should_rotate_clockwise', 'rotate_clockwise'),
+    ('should_rotate_counterclockwise', 'rotate_counterclockwise'),
+    ('should_fast_drop', 'fast_drop'),
+    ('is_fast_drop_held', 'fast_drop_held'),
+)
+
+
+def encode_varint(value, out):
+    """
+    非負整数を可変長（7ビットずつ、下位から）でバイト列に追加する
+    
+    Args:
+        value (int): 非負整数
+        out (bytearray): 追加先
+    """
+    if value < 0:
+        raise ValueError("varint must not be negative")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, offset):
+    """
+    可変長整数を読み出す
+    
+    Args:
+        data (bytes): バイト列
+        offset (int): 読み出し開始位置
+    
+    Returns:
+        tuple: (値, 次の読み出し位置)
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated replay data")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class Replay:
+    """
+    リプレイクラス - 乱数シード・設定・入力の変化の記録
+    
+    入力はフレームごとのビットマスク（ACTIONSの順）で、値が変わったフレームだけを
+    (前回の変化からのフレーム数, 新しいビットマスク) として保持する。
+    """
+    
+    def __init__(self, seed, difficulty=0.5, obstacle_threshold=25, events=None,
+                 frame_count=0, final_score=0, final_hash=0):
+        """
+        リプレイの初期化
+        
+        Args:
+            seed (int): PuyoManagerの乱数シード
+            difficulty (float): PuyoManagerの難易度
+            obstacle_threshold (int): お邪魔ぷよの発生間隔
+            events (list, optional): [(フレーム番号, ビットマスク), ...] 入力が変化したフレーム（1から開始）
+            frame_count (int): 記録したフレーム数
+            final_score (int): 記録終了時のスコア（再生結果の検証用）
+            final_hash (int): 記録終了時の盤面ハッシュ（再生結果の検証用）
+        """
+        self.seed = seed
+        self.difficulty = difficulty
+        self.obstacle_threshold = obstacle_threshold
+        self.events = events if events is not None else []
+        self.frame_count = frame_count
+        self.final_score = final_score
+        self.final_hash = final_hash
+    
+    def create_puyo_manager(self):
+        """
+        記録時と同じ順番でぷよペアを生成するPuyoManagerを作成
+        
+        Returns:
+            PuyoManager: 初期ペア生成済みのぷよ管理システム
+        """
+        puyo_manager = PuyoManager(self.seed)
+        configure_puyo_manager(puyo_manager, self.seed, self.difficulty, self.obstacle_threshold)
+        return puyo_manager
+    
+    def to_bytes(self):
+        """
+        バイナリ形式に変換
+        
+        Returns:
+            bytes: リプレイのバイト列
+        """
+        out = bytearray(REPLAY_MAGIC)
+        out.append(REPLAY_VERSION)
+        for value in (self.seed, self.obstacle_threshold, self.frame_count, self.final_score,
+                      len(self.events)):
+            encode_varint(value, out)
+        out += struct.pack('<dQ', self.difficulty, self.final_hash)
+        
+        # (フレーム差分 << MASK_BITS) | ビットマスク を1つの可変長整数にする
+        previous_frame = 0
+        for frame, mask in self.events:
+            encode_varint(((frame - previous_frame) << MASK_BITS) | mask, out)
+            previous_frame = frame
+        return bytes(out)
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        バイナリ形式から復元
+        
+        Args:
+            data (bytes): to_bytesで作成したバイト列
+        
+        Returns:
+            Replay: 復元したリプレイ
+        """
+        if bytes(data[:4]) != REPLAY_MAGIC:
+            raise ValueError("not a replay file")
+        if data[4] != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version: {data[4]}")
+        
+        offset = 5
+        values = []
+        for _ in range(5):
+            value, offset = decode_varint(data, offset)
+            values.append(value)
+        seed, obstacle_threshold, frame_count, final_score, event_count = values
+        difficulty, final_hash = struct.unpack_from('<dQ', data, offset)
+        offset += struct.calcsize('<dQ')
+        
+        events = []
+        frame = 0
+        for _ in range(event_count):
+            value, offset = decode_varint(data, offset)
+            frame += value >> MASK_BITS
+            events.append((frame, value & (MASK_LIMIT - 1)))
+        return cls(seed, difficulty, obstacle_threshold, events, frame_count, final_score, final_hash)
+    
+    def save(self, path):
+        """
+        ファイルに保存
+        
+        Args:
+            path (str): 保存先のパス
+        """
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+    
+    @classmethod
+    def load(cls, path):
+        """
+        ファイルから読み込む
+        
+        Args:
+            path (str): 読み込むパス
+        
+        Returns:
+            Replay: 読み込んだリプレイ
+        """
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def configure_puyo_manager(puyo_manager, seed, difficulty, obstacle_threshold):
+    """
+    PuyoManagerに設定を反映し、シードを指定して最初からやり直す
+    
+    Args:
+        puyo_manager (PuyoManager): 対象のぷよ管理システム
+        seed (int): 乱数シード
+        difficulty (float): 難易度
+        obstacle_threshold (int): お邪魔ぷよの発生間隔
+    """
+    puyo_manager.set_difficulty(difficulty)
+    puyo_manager.obstacle_threshold = obstacle_threshold
+    puyo_manager.reset(seed=seed)
+
+
+class ReplayRecorder(InputSource):
+    """
+    入力を記録する入力ソース - 元の入力ソース（InputHandlerなど）を包んで使う
+    
+    update()のたびにゲームシステムが参照する入力を1回だけ読み取り、そのフレームの間は
+    読み取った値を返す。そのため記録した値とゲームに反映された値は必ず一致する。
+    """
+    
+    def __init__(self, input_source, puyo_manager, seed=None):
+        """
+        ReplayRecorderの初期化（ゲーム開始前に作成すること）
+        
+        Args:
+            input_source (InputSource): 記録する入力ソース
+            puyo_manager (PuyoManager): ぷよ管理システム（シードを指定して最初からやり直す）
+            seed (int, optional): 乱数シード（省略時はPuyoManagerのシード、それもなければ新しく決める）
+        """
+        self.input_source = input_source
+        self.puyo_manager = puyo_manager
+        
+        if seed is None:
+            seed = puyo_manager.seed
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        configure_puyo_manager(puyo_manager, seed, puyo_manager.difficulty,
+                               puyo_manager.obstacle_threshold)
+        
+        self.replay = Replay(seed, puyo_manager.difficulty, puyo_manager.obstacle_threshold)
+        self.frame = 0
+        self.mask = 0
+    
+    def update(self):
+        """
+        元の入力ソースを更新し、このフレームの入力を記録する
+        """
+        self.input_source.update()
+        self.frame += 1
+        
+        source = self.input_source
+        mask = 0
+        for query, action in _QUERY_ACTIONS:
+            if getattr(source, query)():
+                mask |= ACTION_BITS[action]
+        if mask != self.mask:
+            self.replay.events.append((self.frame, mask))
+            self.mask = mask
+    
+    def finish(self, score=0, board_hash=0):
+        """
+        記録を終了してリプレイを取得
+        
+        Args:
+            score (int): 記録終了時のスコア
+            board_hash (int): 記録終了時の盤面ハッシュ（PlayField.get_hash）
+        
+        Returns:
+            Replay: 記録したリプレイ
+        """
+        replay = self.replay
+        replay.frame_count = self.frame
+        replay.final_score = score
+        replay.final_hash = board_hash
+        return replay
+    
+    def should_move_left(self):
+        """左移動を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['move_left'])
+    
+    def should_move_right(self):
+        """右移動を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['move_right'])
+    
+    def should_rotate_clockwise(self):
+        """時計回り回転を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['rotate_clockwise'])
+    
+    def should_rotate_counterclockwise(self):
+        """反時計回り回転を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['rotate_counterclockwise'])
+    
+    def should_fast_drop(self):
+        """高速落下（1段移動）を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['fast_drop'])
+    
+    def is_fast_drop_held(self):
+        """高速落下キーが押され続けているかチェック"""
+        return bool(self.mask & ACTION_BITS['fast_drop_held'])
+    
+    def should_start_game(self):
+        """ゲーム開始を実行すべきかチェック（記録対象外）"""
+        return self.input_source.should_start_game()
+    
+    def should_restart_game(self):
+        """ゲーム再開始を実行すべきかチェック（記録対象外）"""
+        return self.input_source.should_restart_game()
+    
+    def should_quit_game(self):
+        """ゲーム終了を実行すべきかチェック（記録対象外）"""
+        return self.input_source.should_quit_game()
+    
+    def __getattr__(self, name):
+        # その他の記録対象外の操作（デバッグ用など）も元の入力ソースに任せる
+        if name == 'input_source':
+            raise AttributeError(name)
+        return getattr(self.input_source, name)
+
+
+class ReplayPlayer(InputSource):
+    """
+    リプレイを再生する入力ソース - update()のたびに記録したフレームの入力を返す
+    """
+    
+    def __init__(self, replay):
+        """
+        ReplayPlayerの初期化
+        
+        Args:
+            replay (Replay): 再生するリプレイ
+        """
+        self.replay = replay
+        self.frame = 0
+        self.mask = 0
+        self._next_event = 0
+    
+    def update(self):
+        """
+        次のフレームの入力に進める
+        """
+        self.frame += 1
+        events = self.replay.events
+        while self._next_event < len(events) and events[self._next_event][0] <= self.frame:
+            self.mask = events[self._next_event][1]
+            self._next_event += 1
+    
+    def is_finished(self):
+        """
+        記録したフレームを全て再生したかチェック
+        
+        Returns:
+            bool: 再生し終えた場合True
+        """
+        return self.frame >= self.replay.frame_count
+    
+    def should_move_left(self):
+        """左移動を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['move_left'])
+    
+    def should_move_right(self):
+        """右移動を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['move_right'])
+    
+    def should_rotate_clockwise(self):
+        """時計回り回転を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['rotate_clockwise'])
+    
+    def should_rotate_counterclockwise(self):
+        """反時計回り回転を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['rotate_counterclockwise'])
+    
+    def should_fast_drop(self):
+        """高速落下（1段移動）を実行すべきかチェック"""
+        return bool(self.mask & ACTION_BITS['fast_drop'])
+    
+    def is_fast_drop_held(self):
+        """高速落下キーが押され続けているかチェック"""
+        return bool(self.mask & ACTION_BITS['fast_drop_held'])
+
+
+def play_replay(replay, playfield=None):
+    """
+    リプレイをヘッドレスで最後まで再生する（描画もフレーム待ちもないため最速で進む）
+    
+    Args:
+        replay (Replay): 再生するリプレイ
+        playfield (PlayField, optional): 使用するプレイフィールド
+    
+    Returns:
+        HeadlessGame: 再生し終えたゲーム（スコアや盤面を記録時の値と比較できる）
+    """
+    game = HeadlessGame(
+        input_source=ReplayPlayer(replay),
+        playfield=playfield,
+        puyo_manager=replay.create_puyo_manager(),
+    )
+    game.run(replay.frame_count)
+    return game
@@ -0,0 +1,283 @@
+"""
+ReplayArchive - 多数のリプレイをまとめて保存するアーカイブ（mmapによる読み出し）
+Requirements: 4.2 - 記録したゲームの保存と読み出し
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from src.replay import Replay
+
+
+ARCHIVE_MAGIC = b'KRPA'
+ARCHIVE_VERSION = 1
+ARCHIVE_EXTENSION = '.krpa'
+
+# ヘッダー: マジック, バージョン, 予約, レコード数, 索引の位置, 索引の容量（0の場合はレコード数）
+_HEADER = struct.Struct('<4sHHQQQ')
+HEADER_SIZE = 32
+_LENGTH = struct.Struct('<I')
+# 索引を書き直す時に確保する容量の最小値
+_MIN_INDEX_CAPACITY = 16
+
+
+def _offsets_to_bytes(offsets):
+    """
+    索引（レコード位置の配列）をリトルエンディアンのバイト列に変換
+    """
+    if sys.byteorder != 'little':
+        offsets = array('Q', offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _offsets_from_buffer(buffer):
+    """
+    リトルエンディアンのバイト列から索引を復元
+    """
+    offsets = array('Q')
+    offsets.frombytes(buffer)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    return offsets
+
+
+def _read_header(data, path):
+    """
+    ヘッダーを読み出して検証する
+    
+    Returns:
+        tuple: (レコード数, 索引の位置, 索引の容量)
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"not a replay archive: {path}")
+    magic, version, _, count, index_offset, capacity = _HEADER.unpack_from(data, 0)
+    if magic != ARCHIVE_MAGIC:
+        raise ValueError(f"not a replay archive: {path}")
+    if version != ARCHIVE_VERSION:
+        raise ValueError(f"unsupported replay archive version: {version}")
+    return count, index_offset, max(count, capacity)
+
+
+class ReplayArchiveWriter:
+    """
+    アーカイブ書き込みクラス - リプレイを末尾に追加する
+    
+    ファイルは「ヘッダー（32バイト）、長さ付きのレコード、索引（レコード位置の配列）」の順。
+    索引には空きを確保しておき、追加したレコードはファイルの末尾に書く。閉じる時に
+    追加分の位置を索引の空きに書いてからヘッダーを書き換える。空きが足りない場合だけ
+    容量を2倍にした索引を末尾に書き直すため、1件ずつ追加してもファイルは線形にしか
+    大きくならない。途中で終了しても既存の索引とレコードは壊れない。
+    """
+    
+    def __init__(self, path):
+        """
+        アーカイブを追加用に開く（なければ作成する）
+        
+        Args:
+            path (str): アーカイブのパス
+        """
+        self.path = path
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self._file = open(path, 'r+b')
+            header = self._file.read(HEADER_SIZE)
+            count, self._index_offset, self._index_capacity = _read_header(header, path)
+            self._file.seek(self._index_offset)
+            self.offsets = _offsets_from_buffer(self._file.read(count * 8))
+        else:
+            self._file = open(path, 'w+b')
+            self._file.write(bytes(HEADER_SIZE))
+            self.offsets = array('Q')
+            self._index_offset = HEADER_SIZE
+            self._index_capacity = 0
+            self._write_header()
+        self._saved_count = len(self.offsets)
+        self._file.seek(0, os.SEEK_END)
+    
+    def append(self, replay):
+        """
+        リプレイを追加する
+        
+        Args:
+            replay (Replay or bytes): 追加するリプレイ（バイト列の場合はそのまま格納）
+        
+        Returns:
+            int: 追加したレコードの番号
+        """
+        data = replay.to_bytes() if isinstance(replay, Replay) else bytes(replay)
+        f = self._file
+        self.offsets.append(f.tell())
+        f.write(_LENGTH.pack(len(data)))
+        f.write(data)
+        return len(self.offsets) - 1
+    
+    def __len__(self):
+        return len(self.offsets)
+    
+    def close(self):
+        """
+        索引とヘッダーを書き込んで閉じる
+        """
+        if self._file is None:
+            return
+        self._write_index()
+        self._file.close()
+        self._file = None
+    
+    def _write_index(self):
+        """
+        追加したレコードの位置を索引に書き、ヘッダーを更新する
+        
+        索引の空きに収まる場合は追加分だけを書き、収まらない場合は容量を2倍にした
+        索引を末尾に書き直す。ヘッダーは最後に書き換えるため、途中で終了しても
+        古いヘッダーが指す索引は壊れない。
+        """
+        count = len(self.offsets)
+        if count == self._saved_count:
+            return
+        f = self._file
+        if count <= self._index_capacity:
+            f.seek(self._index_offset + self._saved_count * 8)
+            f.write(_offsets_to_bytes(self.offsets[self._saved_count:]))
+        else:
+            capacity = max(count * 2, _MIN_INDEX_CAPACITY)
+            f.seek(0, os.SEEK_END)
+            # 索引は8バイト境界に揃える
+            f.write(bytes(-f.tell() % 8))
+            self._index_offset = f.tell()
+            self._index_capacity = capacity
+            f.write(_offsets_to_bytes(self.offsets))
+            f.write(bytes((capacity - count) * 8))
+        f.flush()
+        self._write_header()
+        self._saved_count = count
+        f.seek(0, os.SEEK_END)
+    
+    def _write_header(self):
+        """
+        ヘッダー（レコード数と索引の位置・容量）を書き込む
+        """
+        f = self._file
+        f.seek(0)
+        f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, len(self.offsets),
+                             self._index_offset, self._index_capacity))
+        f.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class ReplayArchive:
+    """
+    アーカイブ読み出しクラス - mmapでファイルを開き、レコードをコピーせずに参照する
+    """
+    
+    def __init__(self, path):
+        """
+        アーカイブを読み出し用に開く
+        
+        Args:
+            path (str): アーカイブのパス
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        count, index_offset, _ = _read_header(self._view, path)
+        index = self._view[index_offset:index_offset + count * 8]
+        if sys.byteorder == 'little':
+            self._offsets = index.cast('Q')
+        else:
+            self._offsets = _offsets_from_buffer(index)
+    
+    def __len__(self):
+        return len(self._offsets)
+    
+    def get_bytes(self, index):
+        """
+        レコードのバイト列を取得（ファイルの該当部分を指すmemoryview、コピーしない）
+        
+        Args:
+            index (int): レコードの番号（負の値は末尾から）
+        
+        Returns:
+            memoryview: リプレイのバイト列
+        """
+        offset = self._offsets[index]
+        length, = _LENGTH.unpack_from(self._view, offset)
+        start = offset + _LENGTH.size
+        return self._view[start:start + length]
+    
+    def __getitem__(self, index):
+        """
+        レコードをリプレイとして取得
+        
+        Args:
+            index (int): レコードの番号
+        
+        Returns:
+            Replay: 復元したリプレイ
+        """
+        return Replay.from_bytes(self.get_bytes(index))
+    
+    def iter_bytes(self, start=0):
+        """
+        レコードのバイト列を順番に取得
+        
+        Args:
+            start (int): 最初のレコードの番号
+        
+        Yields:
+            memoryview: リプレイのバイト列
+        """
+        for index in range(start, len(self._offsets)):
+            yield self.get_bytes(index)
+    
+    def __iter__(self):
+        for data in self.iter_bytes():
+            yield Replay.from_bytes(data)
+    
+    def close(self):
+        """
+        アーカイブを閉じる（get_bytesで取得したmemoryviewは先に解放しておくこと）
+        """
+        if self._mmap is None:
+            return
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._offsets = ()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def append_replays(path, replays):
+    """
+    アーカイブにリプレイを追加する（なければ作成する）
+    
+    Args:
+        path (str): アーカイブのパス
+        replays (iterable): 追加するリプレイ（Replayまたはバイト列）
+    
+    Returns:
+        int: 追加後のレコード数
+    """
+    with ReplayArchiveWriter(path) as writer:
+        for replay in replays:
+            writer.append(replay)
+        return len(writer)
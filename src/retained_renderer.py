@@ -0,0 +1,268 @@
+"""
+RetainedRenderer - 変化した領域だけを描き直す描画モード
+Requirements: 1.1, 1.2 - ゲーム画面・プレイフィールドとぷよの表示
+"""
+
+from src.graphics import get_backend
+
+
+CELL_SIZE = 24
+
+
+class RetainedRenderer:
+    """
+    差分描画クラス - 前のフレームの画面を残したまま、変化した領域だけを描き直す
+    
+    毎フレーム、盤面の色コード列と各表示要素の状態を前のフレームと比較し、
+    変化した要素の前後の範囲を書き換え領域とする。書き換え領域ごとに、
+    UIRendererがキャッシュした変化しない部分のイメージから背景をbltで戻し、
+    その領域に重なる表示要素だけを奥から順に描き直す。
+    """
+    
+    def __init__(self, game):
+        """
+        差分描画の初期化
+        
+        Args:
+            game: 描画するKiroKiroGame
+        """
+        self.game = game
+        self._static_layer = None  # 前のフレームで使った変化しない部分のイメージ
+        self._full_redraw = True  # 次のフレームで画面全体を描き直す場合True
+        self._playfield = None  # 前のフレームで描いた盤面
+        self._cells = None  # 前のフレームで描いた盤面の色コード列
+        self._states = {}  # 表示要素名 -> (状態, 範囲のリスト)
+        
+        # 盤面のぷよより奥に描く表示要素
+        self._back_elements = (
+            ('danger_band', self._danger_band_state, self._draw_danger_band),
+        )
+        # 盤面のぷよより手前に描く表示要素（奥から順）
+        self._front_elements = (
+            ('danger_warnings', self._danger_warnings_state, self._draw_danger_warnings),
+            ('elimination', self._elimination_state, self._draw_elimination),
+            ('falling_pair', self._falling_pair_state, self._draw_falling_pair),
+            ('next_preview', self._next_preview_state, self._draw_next_preview),
+            ('next_next_preview', self._next_next_preview_state, self._draw_next_next_preview),
+            ('score', self._score_state, self._draw_score),
+            ('chain', self._chain_state, self._draw_chain),
+            ('final_score', self._final_score_state, self._draw_final_score),
+        )
+        
+        self._frame_info = (0, 0)  # (フレームカウンター, 危険レベル)
+        self.redrawn_regions = 0  # 直前のフレームで描き直した領域の数（デバッグ用）
+    
+    def invalidate(self):
+        """
+        次のフレームで画面全体を描き直す
+        """
+        self._full_redraw = True
+    
+    def draw(self):
+        """
+        前のフレームから変化した領域を描き直す
+        """
+        game = self.game
+        gfx = get_backend()
+        ui = game.ui_renderer
+        # 変化しない部分のイメージが作り直された場合は画面全体を描き直す
+        static_layer = ui.get_static_layer(False, game.playfield)
+        if static_layer is not self._static_layer:
+            self._static_layer = static_layer
+            self._full_redraw = True
+        if game.playfield is not self._playfield:
+            self._playfield = game.playfield
+            self._full_redraw = True
+        
+        regions = []
+        self._frame_info = (game.frame_count, game.game_controller.get_danger_level())
+        
+        # 盤面のぷよは色コード列を前のフレームと比較する
+        cells = game.playfield.snapshot()
+        previous = self._cells
+        if previous is not None and cells != previous:
+            width = game.playfield.width
+            for cell, color in enumerate(cells):
+                if color != previous[cell]:
+                    y, x = divmod(cell, width)
+                    regions.append(self._cell_rect(x, y))
+        self._cells = cells
+        
+        for elements in (self._back_elements, self._front_elements):
+            for name, state_function, _ in elements:
+                state, rects = state_function()
+                self._update_state(name, state, rects, regions)
+        
+        if self._full_redraw:
+            regions = [(0, 0, gfx.width, gfx.height)]
+            self._full_redraw = False
+        
+        regions = set(regions)
+        for region in regions:
+            self._redraw_region(gfx, ui, region)
+        self.redrawn_regions = len(regions)
+    
+    def _update_state(self, name, state, rects, regions):
+        """
+        表示要素の状態を記録し、変化していれば前後の範囲を書き換え領域に加える
+        """
+        previous = self._states.get(name)
+        self._states[name] = (state, rects)
+        if previous is None:
+            regions.extend(rects)
+        elif previous[0] != state:
+            regions.extend(previous[1])
+            regions.extend(rects)
+    
+    def _redraw_region(self, gfx, ui, region):
+        """
+        書き換え領域を描き直す（背景を戻してから、重なる表示要素を奥から順に描く）
+        
+        Args:
+            gfx: 描画バックエンド
+            ui: UIRenderer
+            region (tuple): (x, y, 幅, 高さ)
+        """
+        x, y, w, h = region
+        gfx.clip(x, y, w, h)
+        gfx.blt(x, y, self._static_layer, x, y, w, h)
+        
+        self._draw_elements(self._back_elements, region)
+        self._draw_cells(ui, region)
+        self._draw_elements(self._front_elements, region)
+        gfx.clip()
+    
+    def _draw_elements(self, elements, region):
+        """
+        書き換え領域に重なる表示要素を描画（描画範囲はclipで書き換え領域に制限されている）
+        """
+        states = self._states
+        for name, _, draw_function in elements:
+            for rect in states[name][1]:
+                if _intersects(rect, region):
+                    draw_function()
+                    break
+    
+    def _draw_cells(self, ui, region):
+        """
+        書き換え領域に重なる盤面のセルのぷよを描画
+        """
+        playfield = self.game.playfield
+        x, y, w, h = region
+        left = max(0, (x - ui.playfield_x) // CELL_SIZE)
+        top = max(0, (y - ui.playfield_y) // CELL_SIZE)
+        right = min(playfield.width, -(-(x + w - ui.playfield_x) // CELL_SIZE))
+        bottom = min(playfield.height, -(-(y + h - ui.playfield_y) // CELL_SIZE))
+        if left < right and top < bottom:
+            playfield.draw_cells(ui.playfield_x, ui.playfield_y, left, top, right, bottom)
+    
+    def _cell_rect(self, x, y):
+        ui = self.game.ui_renderer
+        return (ui.playfield_x + x * CELL_SIZE, ui.playfield_y + y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+    
+    # 表示要素ごとの状態（変化の検出用）と範囲、描画処理
+    
+    def _danger_band_state(self):
+        frame_count, danger_level = self._frame_info
+        if danger_level >= 3 and frame_count % 30 < 15:
+            return True, [(0, 0, get_backend().width, 10)]
+        return False, []
+    
+    def _draw_danger_band(self):
+        self.game.ui_renderer.draw_danger_band(*self._frame_info)
+    
+    def _danger_warnings_state(self):
+        frame_count, danger_level = self._frame_info
+        if danger_level >= 3 and frame_count % 30 < 15:
+            ui = self.game.ui_renderer
+            return True, [(ui.playfield_x, ui.playfield_y, ui.playfield_width, CELL_SIZE * 2 + 2)]
+        return False, []
+    
+    def _draw_danger_warnings(self):
+        frame_count, danger_level = self._frame_info
+        self.game.ui_renderer.draw_danger_warnings(danger_level, frame_count)
+    
+    def _elimination_state(self):
+        active, timer, groups = self.game.game_systems.get_elimination_info()
+        if not (active and groups and (timer // 5) % 2 == 0):
+            return None, []
+        cells = [cell for group in groups for cell in group]
+        return tuple(cells), [self._cell_rect(x, y) for x, y in cells]
+    
+    def _draw_elimination(self):
+        self.game.ui_renderer.draw_elimination_effects(*self.game.game_systems.get_elimination_info())
+    
+    def _falling_pair_state(self):
+        pair = self.game.game_systems.current_falling_pair
+        if pair is None:
+            return None, []
+        main = pair.get_main_puyo()
+        sub = pair.get_sub_puyo()
+        state = (main.x, main.y, main.color, sub.x, sub.y, sub.color)
+        return state, [self._cell_rect(main.x, main.y), self._cell_rect(sub.x, sub.y)]
+    
+    def _draw_falling_pair(self):
+        ui = self.game.ui_renderer
+        self.game.game_systems.current_falling_pair.draw(ui.playfield_x, ui.playfield_y)
+    
+    def _next_preview_state(self):
+        ui = self.game.ui_renderer
+        rect = (ui.next_preview_x - 5, ui.next_preview_y - 25, ui.preview_width, ui.preview_height)
+        return _pair_colors(self.game.puyo_manager.get_next_pair()), [rect]
+    
+    def _draw_next_preview(self):
+        self.game.ui_renderer.draw_next_preview_puyos()
+    
+    def _next_next_preview_state(self):
+        ui = self.game.ui_renderer
+        rect = (ui.next_next_preview_x - 5, ui.next_next_preview_y - 15,
+                ui.next_next_preview_width, ui.next_next_preview_height)
+        return _pair_colors(self.game.puyo_manager.get_next_next_pair()), [rect]
+    
+    def _draw_next_next_preview(self):
+        self.game.ui_renderer.draw_next_next_preview_puyos()
+    
+    def _score_state(self):
+        game = self.game
+        ui = game.ui_renderer
+        # 増加量の表示は枠の右へはみ出すことがあるため画面の右端までを範囲とする
+        rect = (ui.score_area_x, ui.score_area_y, get_backend().width - ui.score_area_x, ui.score_area_height)
+        return (game.score_manager.get_score(), game.game_controller.get_score_display_info()), [rect]
+    
+    def _draw_score(self):
+        self.game.ui_renderer.draw_score_value(*self.game.game_controller.get_score_display_info())
+    
+    def _chain_state(self):
+        show_chain_text, chain_level, phase = self.game.game_systems.get_chain_display_info()
+        if not (show_chain_text and chain_level > 0):
+            return None, []
+        return (chain_level, phase), [self.game.ui_renderer.get_chain_animation_bounds(chain_level)]
+    
+    def _draw_chain(self):
+        self.game.ui_renderer.draw_chain_animation(*self.game.game_systems.get_chain_display_info())
+    
+    def _final_score_state(self):
+        game = self.game
+        if not game.game_controller.show_final_score:
+            return None, []
+        gfx = get_backend()
+        return game.score_manager.get_score(), [(0, 0, gfx.width, gfx.height)]
+    
+    def _draw_final_score(self):
+        self.game.ui_renderer.draw_final_score_display(self.game.game_controller.show_final_score)
+
+
+def _pair_colors(pair):
+    """
+    プレビュー表示の状態としてペアの色を取得
+    """
+    if pair is None:
+        return None
+    return pair.get_main_puyo().color, pair.get_sub_puyo().color
+
+
+def _intersects(a, b):
+    """
+    2つの矩形 (x, y, 幅, 高さ) が重なるか判定
+    """
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
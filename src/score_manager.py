@@ -10,6 +10,12 @@ class ScoreManager:
     Requirements: 3.2 - スコア加算と管理
     """
     
+    # スコア表に含める消去ぷよ数の上限（6×12フィールドが全て消える場合）
+    MAX_TABLE_CLEARED = 72
+    
+    # スコア計算の設定 -> スコア表（同じ設定のインスタンスで共有する）
+    _shared_score_tables = {}
+    
     def __init__(self):
         """
         ScoreManagerの初期化
@@ -22,6 +28,62 @@ class ScoreManager:
         self.chain_bonus_multiplier = [1, 8, 16, 32, 64, 96, 128, 160, 192, 224]  # 連鎖ボーナス倍率
         self.color_bonus = {1: 0, 2: 3, 3: 6, 4: 12, 5: 24}  # 色数ボーナス
         self.group_bonus = 0  # グループボーナス（4個以上で追加）
+        
+        self.rebuild_score_tables()
+    
+    def get_settings(self):
+        """
+        スコア計算の設定を比較・ハッシュ可能なタプルとして取得
+        
+        Returns:
+            tuple: (基本スコア, 連鎖ボーナス倍率, 色数ボーナス)
+        """
+        return (
+            self.base_score_per_puyo,
+            tuple(self.chain_bonus_multiplier),
+            tuple(sorted(self.color_bonus.items())),
+        )
+    
+    def rebuild_score_tables(self):
+        """
+        (消去ぷよ数, 連鎖レベル, 色数) ごとのスコア表を作成する
+        設定（倍率・ボーナス）の変更は表を使う前に検出して自動で作り直す
+        """
+        # 表を作成した時の設定（変更の検出用に、リストと辞書は複製して持つ）
+        self._table_settings = (
+            self.base_score_per_puyo,
+            list(self.chain_bonus_multiplier),
+            dict(self.color_bonus),
+        )
+        
+        # 連鎖レベルの添字: 0は連鎖レベル0以下、倍率表を超えた連鎖は最後の添字にまとめる
+        self._max_table_chain = len(self.chain_bonus_multiplier)
+        self._color_table_size = max(self.color_bonus, default=0) + 1
+        
+        settings = self.get_settings()
+        table = self._shared_score_tables.get(settings)
+        if table is None:
+            table = [
+                [
+                    [self._compute_score(cleared_count, chain_level, color_count)
+                     for color_count in range(self._color_table_size)]
+                    for chain_level in range(self._max_table_chain + 1)
+                ]
+                for cleared_count in range(self.MAX_TABLE_CLEARED + 1)
+            ]
+            self._shared_score_tables[settings] = table
+        self._score_table = table
+        self._score_arrays = None  # score_batch用の配列（初回呼び出し時に作成）
+    
+    def _ensure_score_tables(self):
+        """
+        設定が表の作成時から変更されていればスコア表を作り直す
+        """
+        base_score_per_puyo, chain_bonus_multiplier, color_bonus = self._table_settings
+        if (self.base_score_per_puyo != base_score_per_puyo or
+                self.chain_bonus_multiplier != chain_bonus_multiplier or
+                self.color_bonus != color_bonus):
+            self.rebuild_score_tables()
     
     def calculate_score(self, cleared_count, chain_level, color_count=1, group_count=1):
         """
@@ -41,6 +103,31 @@ class ScoreManager:
         if cleared_count <= 0:
             return 0
         
+        self._ensure_score_tables()
+        if cleared_count <= self.MAX_TABLE_CLEARED and 0 <= color_count < self._color_table_size:
+            if chain_level > self._max_table_chain:
+                chain_level = self._max_table_chain
+            elif chain_level < 0:
+                chain_level = 0
+            return self._score_table[cleared_count][chain_level][color_count]
+        
+        return self._compute_score(cleared_count, chain_level, color_count)
+    
+    def _compute_score(self, cleared_count, chain_level, color_count):
+        """
+        スコアを計算式から求める（スコア表の作成と表の範囲外の値に使用）
+        
+        Args:
+            cleared_count (int): 消去されたぷよの数
+            chain_level (int): 連鎖レベル
+            color_count (int): 消去された色の種類数
+        
+        Returns:
+            int: 計算されたスコア
+        """
+        if cleared_count <= 0:
+            return 0
+        
         # 基本スコア = 消去ぷよ数 × 基本スコア
         base_score = cleared_count * self.base_score_per_puyo
         
@@ -148,7 +235,7 @@ class ScoreManager:
             return 0
         
         # 総消去ぷよ数を計算
-        total_cleared = sum(len(group) for group in eliminated_groups)
+        total_cleared = sum(map(len, eliminated_groups))
         
         # 色の種類数を計算（将来的に実装）
         color_count = len(eliminated_groups)  # 簡易実装：グループ数を色数とする
@@ -161,6 +248,43 @@ class ScoreManager:
         
         return score
     
+    def score_batch(self, cleared_counts, chain_levels, color_counts):
+        """
+        複数の連鎖ステップのスコアをまとめて計算する（calculate_scoreと同じ結果）
+        
+        Args:
+            cleared_counts (array-like): ステップごとの消去されたぷよの数
+            chain_levels (array-like): ステップごとの連鎖レベル
+            color_counts (array-like): ステップごとの消去された色の種類数
+        
+        Returns:
+            numpy.ndarray: ステップごとのスコア（int64）
+        """
+        import numpy as np
+        
+        self._ensure_score_tables()
+        if self._score_arrays is None:
+            # 添字0は連鎖レベル0以下（倍率1）、表にない色数はボーナス0（最後の添字）
+            chain_multipliers = np.array([1] + self.chain_bonus_multiplier, dtype=np.int64)
+            color_bonus = np.array(
+                [self.color_bonus.get(count, 0) for count in range(self._color_table_size)] + [0],
+                dtype=np.int64
+            )
+            self._score_arrays = (chain_multipliers, color_bonus)
+        chain_multipliers, color_bonus = self._score_arrays
+        
+        cleared_counts = np.asarray(cleared_counts, dtype=np.int64)
+        chain_levels = np.clip(chain_levels, 0, self._max_table_chain)
+        color_counts = np.asarray(color_counts, dtype=np.int64)
+        color_counts = np.where((color_counts >= 0) & (color_counts < self._color_table_size),
+                                color_counts, self._color_table_size)
+        
+        base_score = cleared_counts * self.base_score_per_puyo
+        group_bonus = np.maximum(0, (cleared_counts - 4) * 2)
+        total_bonus = color_bonus[color_counts] + group_bonus
+        scores = base_score * chain_multipliers[chain_levels] * np.maximum(1, 1 + total_bonus)
+        return np.where(cleared_counts > 0, scores, 0)
+    
     def format_score(self, score=None):
         """
         スコアを表示用にフォーマットする
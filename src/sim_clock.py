@@ -0,0 +1,122 @@
+"""
+SimulationClock - 描画から切り離した固定ステップのシミュレーション時計
+Requirements: 1.1 - メインゲームループの時間管理
+"""
+
+
+class SimulationClock:
+    """
+    シミュレーション時計クラス - 1ティック = ゲームロジックの1フレーム分
+    
+    GameSystemsやInputHandlerのタイマーはすべてティック数で数えるため、
+    1描画フレームあたりのティック数を変えてもルールと結果は変わらない。
+    """
+    
+    def __init__(self, fps=30, time_scale=1.0, skip_waits=False, max_ticks_per_frame=100000):
+        """
+        シミュレーション時計の初期化
+        
+        Args:
+            fps (int): 1秒あたりのティック数（等倍時）
+            time_scale (float): 時間倍率（1.0が等倍、1000.0で1000倍速、0.5でスロー）
+            skip_waits (bool): Trueの場合、消去・重力・連鎖表示の待ち時間を飛ばす
+            max_ticks_per_frame (int): 1回の呼び出しで進める最大ティック数
+        """
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.fps = fps
+        self.time_scale = 1.0
+        self.set_time_scale(time_scale)
+        self.skip_waits = skip_waits
+        self.max_ticks_per_frame = max_ticks_per_frame
+        
+        self.tick_count = 0  # これまでに進めたティック数
+        self._pending_ticks = 0.0  # 端数として繰り越すティック数
+    
+    def set_time_scale(self, time_scale):
+        """
+        時間倍率を設定
+        
+        Args:
+            time_scale (float): 時間倍率（0以上）
+        """
+        if time_scale < 0:
+            raise ValueError("time_scale must not be negative")
+        self.time_scale = time_scale
+    
+    def ticks_for_frame(self):
+        """
+        1描画フレームで進めるティック数を求める（端数は次のフレームに繰り越す）
+        
+        Returns:
+            int: 進めるティック数
+        """
+        return self._take_ticks(self.time_scale)
+    
+    def ticks_for_elapsed(self, elapsed_seconds):
+        """
+        実経過時間に対して進めるティック数を求める（端数は次の呼び出しに繰り越す）
+        
+        Args:
+            elapsed_seconds (float): 前回の呼び出しからの実経過時間（秒）
+        
+        Returns:
+            int: 進めるティック数
+        """
+        return self._take_ticks(elapsed_seconds * self.fps * self.time_scale)
+    
+    def run(self, tick_function, ticks):
+        """
+        指定ティック数だけtick_functionを呼び出す
+        
+        Args:
+            tick_function (callable): tick_function(tick_index) の形で呼ばれる関数。Falseを返すと中断する
+            ticks (int): 進めるティック数
+        
+        Returns:
+            int: 実際に進めたティック数
+        """
+        for index in range(ticks):
+            self.tick_count += 1
+            if tick_function(index) is False:
+                return index + 1
+        return ticks
+    
+    def run_frame(self, tick_function):
+        """
+        1描画フレーム分のティックを進める
+        
+        Args:
+            tick_function (callable): runと同じ
+        
+        Returns:
+            int: 実際に進めたティック数
+        """
+        return self.run(tick_function, self.ticks_for_frame())
+    
+    def get_simulated_seconds(self):
+        """
+        ゲーム内の経過時間を取得
+        
+        Returns:
+            float: 進めたティック数を等倍時の秒数に換算した値
+        """
+        return self.tick_count / self.fps
+    
+    def _take_ticks(self, amount):
+        """
+        ティック数を繰り越し分と合わせて整数に切り出す
+        
+        Args:
+            amount (float): 追加するティック数
+        
+        Returns:
+            int: 進めるティック数
+        """
+        self._pending_ticks += amount
+        ticks = int(self._pending_ticks)
+        self._pending_ticks -= ticks
+        if ticks > self.max_ticks_per_frame:
+            # 処理が追いつかない分は捨てる（際限なく遅れが溜まらないように）
+            ticks = self.max_ticks_per_frame
+        return ticks
@@ -0,0 +1,537 @@
+"""
+SoftwareRenderer - pyxelを使わずにNumPy配列へ描画するオフスクリーン描画バックエンド
+Requirements: 1.1, 1.2 - ゲーム画面・プレイフィールドとぷよの表示（ウィンドウなしでの画面取得）
+"""
+
+import math
+import sys
+
+import numpy as np
+
+from src.headless import HeadlessGame
+from src.replay import ReplayPlayer
+from src.retained_renderer import RetainedRenderer
+from src.graphics import get_backend, set_backend
+from src.sprite_atlas import build_sprite_atlas, clear_sprite_atlas
+from src.ui_renderer import UIRenderer
+
+
+SCREEN_WIDTH = 320  # KiroKiroGameのpyxel.initと同じ画面サイズ
+SCREEN_HEIGHT = 380
+IMAGE_BANK_COUNT = 3
+IMAGE_BANK_SIZE = 256
+
+# pyxelの既定パレット（pyxel.DEFAULT_COLORSと同じ値）
+PALETTE = (
+    0x000000, 0x2b335f, 0x7e2072, 0x19959c, 0x8b4852, 0x395c98, 0xa9c1ff, 0xeeeeee,
+    0xd4186c, 0xd38441, 0xe9c35b, 0x70c6a9, 0x7696de, 0xa3a3a3, 0xff9798, 0xedc7b0,
+)
+
+# 色番号 -> (R, G, B) の変換表（範囲外の色番号は黒）
+_RGB_TABLE = np.zeros((256, 3), dtype=np.uint8)
+for _index, _rgb in enumerate(PALETTE):
+    _RGB_TABLE[_index] = ((_rgb >> 16) & 0xff, (_rgb >> 8) & 0xff, _rgb & 0xff)
+
+# pyxelの組み込みフォント（文字コード32-127、1文字3x6ドット、上の行から3ビットずつ）
+FONT_WIDTH = 4  # 文字送りの幅（文字の右に1ドットの間隔）
+FONT_HEIGHT = 6
+_FONT_DATA = (
+    0x00000, 0x12410, 0x2d000, 0x2fbe8, 0x1e790, 0x21508, 0x15570, 0x12000,
+    0x0a488, 0x224a0, 0x2aea8, 0x02e80, 0x000a0, 0x00e00, 0x00010, 0x09520,
+    0x1db70, 0x16490, 0x31538, 0x31470, 0x2de48, 0x3cc70, 0x1cf78, 0x39520,
+    0x3df78, 0x3de70, 0x02080, 0x020a0, 0x0a888, 0x071c0, 0x222a0, 0x39410,
+    0x15b18, 0x15f68, 0x35d70, 0x1c918, 0x35b70, 0x3cf38, 0x3cf20, 0x1cf58,
+    0x2df68, 0x3a4b8, 0x09350, 0x2dd68, 0x24938, 0x2ff68, 0x35b68, 0x15b50,
+    0x35d20, 0x15bd8, 0x35fa8, 0x1c470, 0x3a490, 0x2db58, 0x2db50, 0x2dfe8,
+    0x2d568, 0x2d490, 0x39538, 0x1a498, 0x24448, 0x324b0, 0x15000, 0x00038,
+    0x22000, 0x03b58, 0x26b70, 0x03918, 0x0bb58, 0x03b98, 0x0ae90, 0x03bca,
+    0x26b68, 0x10490, 0x0826a, 0x25da8, 0x324b8, 0x07fe8, 0x06b68, 0x02b50,
+    0x06b74, 0x03b59, 0x03920, 0x03cf0, 0x17498, 0x05b58, 0x05b50, 0x05bf8,
+    0x054a8, 0x05aca, 0x072b8, 0x1ac98, 0x12490, 0x326b0, 0x1e000, 0x3fff8,
+)
+
+# 文字ごとの 6x4 のマスク
+_GLYPHS = np.zeros((len(_FONT_DATA), FONT_HEIGHT, FONT_WIDTH), dtype=bool)
+for _index, _bits in enumerate(_FONT_DATA):
+    for _row in range(FONT_HEIGHT):
+        for _column in range(3):
+            _GLYPHS[_index, _row, _column] = bool(_bits & (1 << (17 - _row * 3 - _column)))
+
+
+def _to_int(value):
+    """
+    座標を整数にする（pyxelと同じく小数は0から遠い方へ四捨五入）
+    """
+    if isinstance(value, int):
+        return value
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+def _round_away(values):
+    """
+    float32の配列を0から遠い方へ四捨五入して整数にする
+    """
+    return (np.sign(values) * np.floor(np.abs(values) + np.float32(0.5))).astype(np.int64)
+
+
+_circle_masks = {}  # 半径 -> (塗りつぶしのマスク, 輪郭のマスク)
+
+
+def _get_circle_masks(radius):
+    """
+    半径ごとの円のマスクを取得（pyxelのcirc/circbと同じ画素になる）
+    
+    Returns:
+        tuple: ((2r+1)x(2r+1) の塗りつぶしのマスク, 同じ大きさの輪郭のマスク)
+    """
+    masks = _circle_masks.get(radius)
+    if masks is not None:
+        return masks
+    
+    size = radius * 2 + 1
+    filled = np.zeros((size, size), dtype=bool)
+    outline = np.zeros((size, size), dtype=bool)
+    for k in range(radius + 1):
+        h = int(math.floor(math.sqrt(radius * radius - k * k) + 0.51))
+        # 中心から縦横にk離れた列・行を ±h の範囲で塗る（8方向の対称）
+        for offset in (-k, k):
+            filled[radius - h:radius + h + 1, radius + offset] = True
+            filled[radius + offset, radius - h:radius + h + 1] = True
+            for sign in (-h, h):
+                outline[radius + sign, radius + offset] = True
+                outline[radius + offset, radius + sign] = True
+    masks = (filled, outline)
+    _circle_masks[radius] = masks
+    return masks
+
+
+class SoftwareImage:
+    """
+    ソフトウェア描画イメージ - pyxel.Imageと同じ描画命令で (高さ, 幅) のuint8配列に色番号を書き込む
+    
+    描画結果はpyxel.Imageと画素単位で一致する（円・線・文字の描き方をpyxelに合わせている）。
+    """
+    
+    def __init__(self, width, height):
+        """
+        イメージの初期化（全画素を色0で埋める）
+        
+        Args:
+            width (int): 幅
+            height (int): 高さ
+        """
+        self.width = width
+        self.height = height
+        self.data = np.zeros((height, width), dtype=np.uint8)
+        self._clip_rect = (0, 0, width, height)  # (左, 上, 右, 下)、右と下は範囲外
+    
+    def clip(self, x=None, y=None, w=None, h=None):
+        """
+        描画範囲を制限する（引数なしの場合は制限を解除）
+        """
+        if x is None:
+            self._clip_rect = (0, 0, self.width, self.height)
+            return
+        x, y, w, h = _to_int(x), _to_int(y), _to_int(w), _to_int(h)
+        left = min(max(x, 0), self.width)
+        top = min(max(y, 0), self.height)
+        self._clip_rect = (left, top, max(left, min(x + w, self.width)), max(top, min(y + h, self.height)))
+    
+    def cls(self, col):
+        """
+        イメージ全体を塗りつぶす（pyxelと同じく描画範囲の制限は無視する）
+        """
+        self.data.fill(col)
+    
+    def pget(self, x, y):
+        """
+        画素の色番号を取得（範囲外は0）
+        """
+        x, y = _to_int(x), _to_int(y)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.data[y, x])
+        return 0
+    
+    def pset(self, x, y, col):
+        """
+        画素を描く
+        """
+        x, y = _to_int(x), _to_int(y)
+        left, top, right, bottom = self._clip_rect
+        if left <= x < right and top <= y < bottom:
+            self.data[y, x] = col
+    
+    def rect(self, x, y, w, h, col):
+        """
+        塗りつぶした矩形を描く
+        """
+        x, y, w, h = _to_int(x), _to_int(y), _to_int(w), _to_int(h)
+        if w > 0 and h > 0:
+            self._fill(x, y, x + w, y + h, col)
+    
+    def rectb(self, x, y, w, h, col):
+        """
+        矩形の枠を描く
+        """
+        x, y, w, h = _to_int(x), _to_int(y), _to_int(w), _to_int(h)
+        if w <= 0 or h <= 0:
+            return
+        self._fill(x, y, x + w, y + 1, col)
+        self._fill(x, y + h - 1, x + w, y + h, col)
+        self._fill(x, y, x + 1, y + h, col)
+        self._fill(x + w - 1, y, x + w, y + h, col)
+    
+    def line(self, x1, y1, x2, y2, col):
+        """
+        線分を描く（pyxelと同じく長い方の軸に沿って1ドットずつ、float32で傾きを計算する）
+        """
+        x1, y1, x2, y2 = _to_int(x1), _to_int(y1), _to_int(x2), _to_int(y2)
+        if x1 == x2 and y1 == y2:
+            self.pset(x1, y1, col)
+            return
+        
+        steep = abs(y2 - y1) >= abs(x2 - x1)
+        if steep:
+            x1, y1, x2, y2 = y1, x1, y2, x2
+        if x1 > x2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        length = x2 - x1
+        slope = np.float32(y2 - y1) / np.float32(length)
+        major = np.arange(x1, x2 + 1)
+        minor = y1 + _round_away(slope * np.arange(length + 1, dtype=np.float32))
+        xs, ys = (minor, major) if steep else (major, minor)
+        
+        left, top, right, bottom = self._clip_rect
+        inside = (xs >= left) & (xs < right) & (ys >= top) & (ys < bottom)
+        self.data[ys[inside], xs[inside]] = col
+    
+    def circ(self, x, y, r, col):
+        """
+        塗りつぶした円を描く
+        """
+        radius = max(_to_int(r), 0)
+        self._apply_mask(_to_int(x) - radius, _to_int(y) - radius, _get_circle_masks(radius)[0], col)
+    
+    def circb(self, x, y, r, col):
+        """
+        円の輪郭を描く
+        """
+        radius = max(_to_int(r), 0)
+        self._apply_mask(_to_int(x) - radius, _to_int(y) - radius, _get_circle_masks(radius)[1], col)
+    
+    def text(self, x, y, s, col):
+        """
+        文字列を描く（pyxelと同じく組み込みフォントにない文字は文字送りもせずに飛ばす）
+        """
+        x, y = _to_int(x), _to_int(y)
+        for line_index, line in enumerate(s.split('\n')):
+            codes = np.frombuffer(line.encode('utf-32-le'), dtype=np.uint32).astype(np.int64) - 32
+            codes = codes[(codes >= 0) & (codes < len(_FONT_DATA))]
+            if len(codes) == 0:
+                continue
+            # 1行分の文字のマスクを横に並べて1回で描く
+            mask = _GLYPHS[codes].transpose(1, 0, 2).reshape(FONT_HEIGHT, len(codes) * FONT_WIDTH)
+            self._apply_mask(x, y + line_index * FONT_HEIGHT, mask, col)
+    
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        """
+        別のイメージの矩形を転写する（幅・高さが負の場合は反転、colkeyの色は透明）
+        
+        Args:
+            x (int): 転写先のX座標
+            y (int): 転写先のY座標
+            img (SoftwareImage): 転写元のイメージ
+            u (int): 転写元のX座標
+            v (int): 転写元のY座標
+            w (int): 幅（負の場合は左右反転）
+            h (int): 高さ（負の場合は上下反転）
+            colkey (int, optional): 透明色
+        """
+        x, y, u, v = _to_int(x), _to_int(y), _to_int(u), _to_int(v)
+        w, h = _to_int(w), _to_int(h)
+        flip_x, flip_y = w < 0, h < 0
+        w, h = abs(w), abs(h)
+        
+        # 転写元の範囲外は描かない（-1で印を付ける）
+        if 0 <= u and 0 <= v and u + w <= img.width and v + h <= img.height:
+            block = img.data[v:v + h, u:u + w]
+            outside = None
+        else:
+            block = np.full((h, w), -1, dtype=np.int16)
+            src_left, src_top = max(u, 0), max(v, 0)
+            src_right, src_bottom = min(u + w, img.width), min(v + h, img.height)
+            if src_left < src_right and src_top < src_bottom:
+                block[src_top - v:src_bottom - v, src_left - u:src_right - u] = \
+                    img.data[src_top:src_bottom, src_left:src_right]
+            outside = block < 0
+        if flip_x:
+            block = block[:, ::-1]
+            outside = outside[:, ::-1] if outside is not None else None
+        if flip_y:
+            block = block[::-1]
+            outside = outside[::-1] if outside is not None else None
+        
+        left, top, right, bottom = self._clip_rect
+        dst_left, dst_top = max(x, left), max(y, top)
+        dst_right, dst_bottom = min(x + w, right), min(y + h, bottom)
+        if dst_left >= dst_right or dst_top >= dst_bottom:
+            return
+        block = block[dst_top - y:dst_bottom - y, dst_left - x:dst_right - x]
+        target = self.data[dst_top:dst_bottom, dst_left:dst_right]
+        
+        if colkey is None and outside is None:
+            target[...] = block
+            return
+        mask = block != colkey if colkey is not None else np.ones(block.shape, dtype=bool)
+        if outside is not None:
+            mask &= ~outside[dst_top - y:dst_bottom - y, dst_left - x:dst_right - x]
+        np.copyto(target, block, casting='unsafe', where=mask)
+    
+    def _fill(self, left, top, right, bottom, col):
+        """
+        描画範囲内の矩形 [left, right) x [top, bottom) を塗る
+        """
+        clip_left, clip_top, clip_right, clip_bottom = self._clip_rect
+        left, top = max(left, clip_left), max(top, clip_top)
+        right, bottom = min(right, clip_right), min(bottom, clip_bottom)
+        if left < right and top < bottom:
+            self.data[top:bottom, left:right] = col
+    
+    def _apply_mask(self, x, y, mask, col):
+        """
+        マスクがTrueの画素を描画範囲内だけ塗る
+        
+        Args:
+            x (int): マスクの左上X座標
+            y (int): マスクの左上Y座標
+            mask (numpy.ndarray): (高さ, 幅) のbool配列
+            col (int): 色番号
+        """
+        height, width = mask.shape
+        clip_left, clip_top, clip_right, clip_bottom = self._clip_rect
+        left, top = max(x, clip_left), max(y, clip_top)
+        right, bottom = min(x + width, clip_right), min(y + height, clip_bottom)
+        if left >= right or top >= bottom:
+            return
+        target = self.data[top:bottom, left:right]
+        target[mask[top - y:bottom - y, left - x:right - x]] = col
+
+
+class SoftwareRenderer:
+    """
+    ソフトウェア描画バックエンド - set_backendで差し替えて、画面をNumPy配列として取得する
+    
+    pyxelモジュールと同じ属性（screen, images, Image, width, height）と描画命令を持つ。
+    画面は色番号の (高さ, 幅) 配列で、frame()でそのまま、to_rgb()でRGBの配列として取得する。
+    """
+    
+    Image = SoftwareImage
+    
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """
+        ソフトウェア描画バックエンドの初期化
+        
+        Args:
+            width (int): 画面の幅
+            height (int): 画面の高さ
+        """
+        self.width = width
+        self.height = height
+        self.screen = SoftwareImage(width, height)
+        self.images = [SoftwareImage(IMAGE_BANK_SIZE, IMAGE_BANK_SIZE) for _ in range(IMAGE_BANK_COUNT)]
+        self._rgb = np.empty((height, width, 3), dtype=np.uint8)  # to_rgbの変換先
+    
+    # pyxel互換の描画命令（画面に描く）
+    
+    def clip(self, x=None, y=None, w=None, h=None):
+        self.screen.clip(x, y, w, h)
+    
+    def cls(self, col):
+        self.screen.cls(col)
+    
+    def pget(self, x, y):
+        return self.screen.pget(x, y)
+    
+    def pset(self, x, y, col):
+        self.screen.pset(x, y, col)
+    
+    def line(self, x1, y1, x2, y2, col):
+        self.screen.line(x1, y1, x2, y2, col)
+    
+    def rect(self, x, y, w, h, col):
+        self.screen.rect(x, y, w, h, col)
+    
+    def rectb(self, x, y, w, h, col):
+        self.screen.rectb(x, y, w, h, col)
+    
+    def circ(self, x, y, r, col):
+        self.screen.circ(x, y, r, col)
+    
+    def circb(self, x, y, r, col):
+        self.screen.circb(x, y, r, col)
+    
+    def text(self, x, y, s, col):
+        self.screen.text(x, y, s, col)
+    
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        """
+        イメージを画面に転写する（imgがイメージバンクの番号の場合はimagesから取得）
+        """
+        if isinstance(img, int):
+            img = self.images[img]
+        self.screen.blt(x, y, img, u, v, w, h, colkey)
+    
+    # 画面の取得
+    
+    def frame(self):
+        """
+        画面の色番号の配列を取得（描画を続けると内容が変わるため、保存する場合はコピーする）
+        
+        Returns:
+            numpy.ndarray: (高さ, 幅) のuint8配列
+        """
+        return self.screen.data
+    
+    def to_rgb(self):
+        """
+        画面をパレットでRGBに変換（結果の配列は次の呼び出しで上書きされる）
+        
+        Returns:
+            numpy.ndarray: (高さ, 幅, 3) のuint8配列
+        """
+        np.take(_RGB_TABLE, self.screen.data, axis=0, out=self._rgb)
+        return self._rgb
+    
+    def write_frame(self, stream, rgb=True):
+        """
+        画面をストリームに書き込む（ffmpegの -f rawvideo -pix_fmt rgb24 に渡せる形式）
+        
+        Args:
+            stream: バイナリの書き込み先
+            rgb (bool): Trueの場合はRGB（1画素3バイト）、Falseの場合は色番号（1画素1バイト）
+        """
+        frame = self.to_rgb() if rgb else self.screen.data
+        stream.write(frame.tobytes())
+
+
+class _HeadlessDisplayController:
+    """
+    HeadlessGameの表示用の状態 - RetainedRendererが参照するGameControllerの一部
+    
+    ヘッドレスではスコアのアニメーションを進めないため、スコアは常に現在値を表示する。
+    """
+    
+    def __init__(self, game):
+        self.game = game
+    
+    @property
+    def show_final_score(self):
+        return self.game.game_over
+    
+    def get_danger_level(self):
+        return self.game.playfield.count_puyos_in_top_rows(3)
+    
+    def get_score_display_info(self):
+        return (False, 0, 0.0, 0)
+
+
+class HeadlessGameView:
+    """
+    ヘッドレス表示アダプター - HeadlessGameをKiroKiroGameと同じ形でRetainedRendererに渡す
+    """
+    
+    def __init__(self, game):
+        """
+        表示アダプターの初期化
+        
+        Args:
+            game (HeadlessGame): 描画するゲーム
+        """
+        self.game = game
+        self.ui_renderer = UIRenderer(None, game.score_manager, game.puyo_manager, game.audio_manager)
+        self.game_controller = _HeadlessDisplayController(game)
+    
+    def __getattr__(self, name):
+        # playfield, game_systems, puyo_manager, score_manager, frame_count はゲームから取得
+        return getattr(self.game, name)
+
+
+def render_replay_frames(replay, renderer=None, playfield=None, use_atlas=True):
+    """
+    リプレイをヘッドレスで再生しながら1フレームずつ描画する
+    
+    KiroKiroGameと同じく1回の更新ごとに1回描画し、ゲームオーバーの画面を描いたところで終わる。
+    描画は差分描画で行うため、前のフレームから変化した領域だけを描き直す。
+    
+    Args:
+        replay (Replay): 再生するリプレイ
+        renderer (SoftwareRenderer, optional): 描画先（省略時は新しく作成）
+        playfield (PlayField, optional): 使用するプレイフィールド
+        use_atlas (bool): Trueの場合はスプライトアトラスでぷよを描く
+    
+    Yields:
+        SoftwareRenderer: 描画し終えた描画バックエンド（frame()やwrite_frame()で画面を取得する）
+    """
+    if renderer is None:
+        renderer = SoftwareRenderer()
+    game = HeadlessGame(
+        input_source=ReplayPlayer(replay),
+        playfield=playfield,
+        puyo_manager=replay.create_puyo_manager(),
+    )
+    retained = RetainedRenderer(HeadlessGameView(game))
+    
+    previous_backend = get_backend()
+    set_backend(renderer)
+    try:
+        if use_atlas:
+            build_sprite_atlas(renderer)
+        for _ in range(replay.frame_count):
+            running = game.step()
+            retained.draw()
+            # 呼び出し側の処理中は元の描画バックエンドに戻しておく
+            set_backend(previous_backend)
+            yield renderer
+            set_backend(renderer)
+            if not running:
+                break
+    finally:
+        clear_sprite_atlas(renderer)
+        set_backend(previous_backend)
+
+
+def main(argv=None):
+    """
+    リプレイの画面を生の映像データとして書き出す
+    
+    例: python -m src.software_renderer game.krpl | ffmpeg -f rawvideo -pix_fmt rgb24 -s 320x380 -r 30 -i - out.mp4
+    """
+    import argparse
+    from src.replay import Replay
+    from src.replay_archive import ARCHIVE_EXTENSION, ReplayArchive
+    
+    parser = argparse.ArgumentParser(description="Render a replay to raw video frames")
+    parser.add_argument('replay', help="replay file (.krpl) or replay archive (.krpa)")
+    parser.add_argument('--index', type=int, default=0, help="record number in a replay archive")
+    parser.add_argument('--output', default='-', help="output file ('-' for stdout)")
+    parser.add_argument('--indexed', action='store_true',
+                        help="write palette indices (gray8) instead of rgb24")
+    args = parser.parse_args(argv)
+    
+    if args.replay.endswith(ARCHIVE_EXTENSION):
+        with ReplayArchive(args.replay) as archive:
+            replay = archive[args.index]
+    else:
+        replay = Replay.load(args.replay)
+    
+    output = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    try:
+        for renderer in render_replay_frames(replay):
+            renderer.write_frame(output, rgb=not args.indexed)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+SpriteAtlas - ぷよの画像を起動時にイメージバンクへ描き込み、1回のbltで描画する
+Requirements: 5.1 - システムは異なる色で区別可能なぷよを描画する
+"""
+
+from src.graphics import get_backend
+
+
+# デザイン文書の色定義に基づく色マッピング
+PUYO_DRAW_COLORS = {
+    1: 8,   # 赤
+    2: 9,   # オレンジ
+    3: 11,  # 緑
+    4: 12,  # 青
+    5: 13   # お邪魔ぷよ（紫）
+}
+OBSTACLE_COLOR = 5
+
+PUYO_SIZE = 24  # 通常のぷよのサイズ（デザイン文書に基づく）
+SMALL_PUYO_SIZE = 16  # 小さいぷよのサイズ（NEXT NEXT用）
+
+SPRITE_BANK = 0  # ぷよの画像を置くイメージバンク
+TRANSPARENT_COLOR = 0  # 透明色（ぷよの画像では使わない色）
+
+
+def draw_puyo_shape(target, screen_x, screen_y, color, small=False):
+    """
+    ぷよを描画命令で描く（アトラスの作成と、アトラスが使えない場合の描画に使う）
+    
+    Args:
+        target: pyxel互換の描画API（描画バックエンドまたはイメージ）
+        screen_x (int): X座標
+        screen_y (int): Y座標
+        color (int): ぷよの色（1-5、それ以外は何も描かない）
+        small (bool): Trueの場合は16x16で描く
+    """
+    draw_color = PUYO_DRAW_COLORS.get(color)
+    if draw_color is None:
+        return
+    
+    if small:
+        puyo_size = SMALL_PUYO_SIZE
+        margin = 1
+        cross = 3
+    else:
+        puyo_size = PUYO_SIZE
+        margin = 2
+        cross = 6
+    
+    if color == OBSTACLE_COLOR:
+        # お邪魔ぷよは角のある形状で描画
+        target.rect(screen_x + margin, screen_y + margin, puyo_size - margin * 2, puyo_size - margin * 2, draw_color)
+        target.rectb(screen_x + margin, screen_y + margin, puyo_size - margin * 2, puyo_size - margin * 2, 7)
+        
+        # お邪魔ぷよの特徴的な模様（X印）
+        target.line(screen_x + cross, screen_y + cross,
+                    screen_x + puyo_size - cross, screen_y + puyo_size - cross, 7)
+        target.line(screen_x + puyo_size - cross, screen_y + cross,
+                    screen_x + cross, screen_y + puyo_size - cross, 7)
+    else:
+        # 通常のぷよは円形で描画（本体と白色の輪郭）
+        center_x = screen_x + puyo_size // 2
+        center_y = screen_y + puyo_size // 2
+        radius = puyo_size // 2 - margin
+        target.circ(center_x, center_y, radius, draw_color)
+        target.circb(center_x, center_y, radius, 7)
+        
+        if not small:
+            # ぷよの光沢効果（小さな白い円、小さいサイズでは省略）
+            target.circ(center_x - 4, center_y - 4, 2, 7)
+
+
+class SpriteAtlas:
+    """
+    スプライトアトラスクラス - 全色・全サイズのぷよをイメージバンクに並べて保持する
+    
+    1段目（v=0）に通常サイズ、2段目（v=24）に小さいサイズを色の順に並べる。
+    """
+    
+    def __init__(self, backend, bank=SPRITE_BANK, origin_x=0, origin_y=0):
+        """
+        スプライトアトラスの初期化（画像はbuildで描き込む）
+        
+        Args:
+            backend: pyxel互換の描画API（imagesを持つもの）
+            bank (int): 使用するイメージバンクの番号
+            origin_x (int): イメージバンク内の左上X座標
+            origin_y (int): イメージバンク内の左上Y座標
+        """
+        self.backend = backend
+        self.bank = bank
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        
+        # 色 -> イメージバンク内の座標 (u, v)
+        self._normal = {}
+        self._small = {}
+        for color in PUYO_DRAW_COLORS:
+            self._normal[color] = (origin_x + (color - 1) * PUYO_SIZE, origin_y)
+            self._small[color] = (origin_x + (color - 1) * SMALL_PUYO_SIZE, origin_y + PUYO_SIZE)
+    
+    def build(self):
+        """
+        イメージバンクにぷよの画像を描き込む（pyxel.initの後に呼び出す）
+        """
+        image = self.backend.images[self.bank]
+        width = len(PUYO_DRAW_COLORS) * PUYO_SIZE
+        image.rect(self.origin_x, self.origin_y, width, PUYO_SIZE + SMALL_PUYO_SIZE, TRANSPARENT_COLOR)
+        for color, (u, v) in self._normal.items():
+            draw_puyo_shape(image, u, v, color)
+        for color, (u, v) in self._small.items():
+            draw_puyo_shape(image, u, v, color, small=True)
+    
+    def draw(self, screen_x, screen_y, color):
+        """
+        通常サイズのぷよを描画
+        
+        Args:
+            screen_x (int): 画面上のX座標
+            screen_y (int): 画面上のY座標
+            color (int): ぷよの色（範囲外の場合は何も描かない）
+        """
+        uv = self._normal.get(color)
+        if uv is not None:
+            self.backend.blt(screen_x, screen_y, self.bank, uv[0], uv[1],
+                             PUYO_SIZE, PUYO_SIZE, TRANSPARENT_COLOR)
+    
+    def draw_small(self, screen_x, screen_y, color):
+        """
+        小さいサイズのぷよを描画
+        
+        Args:
+            screen_x (int): 画面上のX座標
+            screen_y (int): 画面上のY座標
+            color (int): ぷよの色（範囲外の場合は何も描かない）
+        """
+        uv = self._small.get(color)
+        if uv is not None:
+            self.backend.blt(screen_x, screen_y, self.bank, uv[0], uv[1],
+                             SMALL_PUYO_SIZE, SMALL_PUYO_SIZE, TRANSPARENT_COLOR)
+
+
+_atlases = {}  # 描画バックエンド -> SpriteAtlas
+
+
+def build_sprite_atlas(backend=None, bank=SPRITE_BANK):
+    """
+    スプライトアトラスを作成して有効にする（pyxel.initの後に1回だけ呼び出す）
+    
+    Args:
+        backend: pyxel互換の描画API（省略時は現在の描画バックエンド）
+        bank (int): 使用するイメージバンクの番号
+    
+    Returns:
+        SpriteAtlas: 作成したアトラス
+    """
+    if backend is None:
+        backend = get_backend()
+    atlas = SpriteAtlas(backend, bank)
+    atlas.build()
+    _atlases[backend] = atlas
+    return atlas
+
+
+def get_sprite_atlas():
+    """
+    現在の描画バックエンド用のスプライトアトラスを取得
+    
+    Returns:
+        SpriteAtlas: アトラス（現在の描画バックエンド用に作成されていない場合はNone）
+    """
+    return _atlases.get(get_backend())
+
+
+def clear_sprite_atlas(backend=None):
+    """
+    スプライトアトラスを無効にする（以降は描画命令で描く）
+    
+    Args:
+        backend: 対象の描画バックエンド（省略時は全て）
+    """
+    if backend is None:
+        _atlases.clear()
+    else:
+        _atlases.pop(backend, None)
@@ -0,0 +1,148 @@
+"""
+TranspositionTable - 盤面ハッシュをキーにした探索結果のキャッシュ
+Requirements: 3.1, 3.3, 3.4 - 同一盤面の連鎖解決・評価の再計算防止
+"""
+
+from collections import OrderedDict
+
+
+class TranspositionTable:
+    """
+    置換表クラス - 上限付きのLRUキャッシュ
+    
+    キーは盤面のZobristハッシュ（PlayField.get_hash）またはそれを含むタプル。
+    上限を超えると最も長く参照されていないエントリから追い出す。
+    """
+    
+    def __init__(self, max_entries=100000, on_evict=None):
+        """
+        置換表の初期化
+        
+        Args:
+            max_entries (int): 保持するエントリの最大数
+            on_evict (callable, optional): 追い出し時に (key, value) で呼ばれる関数
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self._entries = OrderedDict()
+        
+        # 統計情報
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, default=None):
+        """
+        エントリを取得する（参照したエントリは最新として扱う）
+        
+        Args:
+            key: 盤面ハッシュなどのキー
+            default: エントリがない場合の戻り値
+        
+        Returns:
+            保存されている値、またはdefault
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+    
+    def store(self, key, value):
+        """
+        エントリを保存する（上限を超えた場合は最も古いエントリを追い出す）
+        
+        Args:
+            key: 盤面ハッシュなどのキー
+            value: 保存する値
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        entries[key] = value
+        
+        while len(entries) > self.max_entries:
+            evicted_key, evicted_value = entries.popitem(last=False)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
+    
+    def clear(self):
+        """
+        全てのエントリと統計情報をクリアする
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_stats(self):
+        """
+        統計情報を取得
+        
+        Returns:
+            dict: エントリ数・ヒット数・ミス数・追い出し数・ヒット率
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+def _copy_steps(steps):
+    """
+    連鎖ステップの記録を複製する（置換表の値を呼び出し側の変更から守る）
+    
+    Args:
+        steps (list): PlayField.resolve_chainの戻り値
+    
+    Returns:
+        list: 辞書・グループ・色のリストを複製した記録
+    """
+    return [
+        dict(step, groups=[list(group) for group in step['groups']], colors=list(step['colors']))
+        for step in steps
+    ]
+
+
+def resolve_chain_cached(playfield, table, score_manager=None):
+    """
+    置換表を使って連鎖を解決する（PlayField.resolve_chainのキャッシュ版）
+    
+    同じ盤面が既に解決済みであれば連鎖処理を行わず、保存しておいた解決後の盤面を書き戻す。
+    スコアはスコア計算の設定ごとに別のエントリとして保存する。
+    
+    Args:
+        playfield (PlayField): 対象のプレイフィールド
+        table (TranspositionTable): 置換表
+        score_manager (ScoreManager, optional): 指定した場合は各ステップのスコアも計算する
+    
+    Returns:
+        list: PlayField.resolve_chainと同じ連鎖ステップの記録（呼び出しごとに別のリスト）
+    """
+    settings = score_manager.get_settings() if score_manager is not None else None
+    key = ('chain', playfield.get_hash(), settings)
+    cached = table.get(key)
+    
+    if cached is not None:
+        steps, result_snapshot = cached
+        playfield.restore(result_snapshot)
+        return _copy_steps(steps)
+    
+    steps = playfield.resolve_chain(score_manager)
+    table.store(key, (_copy_steps(steps), playfield.snapshot()))
+    return steps
@@ -3,9 +3,10 @@ UI Renderer - ゲーム画面の描画を担当
 Requirements: 4.1, 4.4, 5.3 - UI要素の描画とアニメーション
 """
 
-import pyxel
 import math
 
+from src.graphics import get_backend
+
 
 class UIRenderer:
     """
@@ -50,6 +51,83 @@ class UIRenderer:
         self.score_area_y = self.next_next_preview_y + self.next_next_preview_height - 10
         self.score_area_width = self.preview_width
         self.score_area_height = 60
+        
+        # 変化しない部分（タイトル・枠・ラベル・操作説明）のキャッシュ
+        # Falseの場合は毎フレーム描画命令で描く
+        self.cache_static_layer = True
+        self._static_layers = {}  # 描画バックエンド -> (キー, イメージ)
+    
+    def draw_static_layer(self, debug_mode, playfield=None):
+        """
+        変化しない部分をまとめて描画（キャッシュしたイメージを1回のbltで描く）
+        
+        Args:
+            debug_mode: デバッグモードフラグ（操作説明の内容が変わる）
+            playfield: 枠内の背景を描くプレイフィールド（省略可）
+        """
+        if not self.cache_static_layer:
+            self.draw_static_parts(debug_mode, playfield)
+            return
+        layer = self.get_static_layer(debug_mode, playfield)
+        get_backend().blt(0, 0, layer, 0, 0, layer.width, layer.height)
+    
+    def get_static_layer(self, debug_mode, playfield=None):
+        """
+        変化しない部分を描いたイメージを取得（デバッグモード・レイアウト・描画バックエンドが変わった時だけ作り直す）
+        
+        Args:
+            debug_mode: デバッグモードフラグ
+            playfield: 枠内の背景を描くプレイフィールド（省略可）
+        
+        Returns:
+            Image: 画面と同じ大きさのイメージ
+        """
+        gfx = get_backend()
+        key = (debug_mode, self.get_layout(), gfx.width, gfx.height,
+               None if playfield is None else (playfield.width, playfield.height))
+        cached = self._static_layers.get(gfx)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        # 画面に描いてからイメージへ写す（初回とレイアウト変更時のみ）
+        gfx.clip()
+        self.draw_static_parts(debug_mode, playfield)
+        layer = gfx.Image(gfx.width, gfx.height)
+        layer.blt(0, 0, gfx.screen, 0, 0, gfx.width, gfx.height)
+        self._static_layers[gfx] = (key, layer)
+        return layer
+    
+    def get_layout(self):
+        """
+        画面レイアウトの設定値を取得（変化しない部分のキャッシュの判定用）
+        
+        Returns:
+            tuple: 各表示エリアの位置と大きさ
+        """
+        return (self.playfield_x, self.playfield_y, self.playfield_width, self.playfield_height,
+                self.next_preview_x, self.next_preview_y, self.preview_width, self.preview_height,
+                self.next_next_preview_x, self.next_next_preview_y,
+                self.next_next_preview_width, self.next_next_preview_height,
+                self.score_area_x, self.score_area_y, self.score_area_width, self.score_area_height)
+    
+    def draw_static_parts(self, debug_mode, playfield=None):
+        """
+        変化しない部分を描画命令で描く
+        
+        Args:
+            debug_mode: デバッグモードフラグ
+            playfield: 枠内の背景を描くプレイフィールド（省略可）
+        """
+        gfx = get_backend()
+        gfx.cls(0)
+        self.draw_title()
+        self.draw_playfield_frame()
+        if playfield is not None:
+            playfield.draw_background(self.playfield_x, self.playfield_y)
+        self.draw_next_preview_frame()
+        self.draw_next_next_preview_frame()
+        self.draw_score_area_frame()
+        self.draw_controls_panel(debug_mode)
     
     def draw_background(self, frame_count, danger_level):
         """
@@ -59,32 +137,46 @@ class UIRenderer:
             frame_count: フレームカウンター
             danger_level: 危険レベル
         """
+        gfx = get_backend()
         # 画面をクリア（黒色）
-        pyxel.cls(0)
+        gfx.cls(0)
         
         # 危険レベルに応じた背景色の変更（ゲームオーバー警告）
+        self.draw_danger_band(frame_count, danger_level)
+    
+    def draw_danger_band(self, frame_count, danger_level):
+        """
+        画面上部の警告帯の描画
+        
+        Args:
+            frame_count: フレームカウンター
+            danger_level: 危険レベル
+        """
+        gfx = get_backend()
         if danger_level >= 3 and frame_count % 30 < 15:  # 0.5秒ごとに点滅
             # 画面の上部に赤い警告帯を表示
-            pyxel.rect(0, 0, 320, 10, 8)  # 赤色の警告帯
+            gfx.rect(0, 0, 320, 10, 8)  # 赤色の警告帯
     
     def draw_title(self):
         """
         ゲームタイトルの描画
         """
+        gfx = get_backend()
         title_text = "Kiro Kiro Puzzle Game"
         title_x = (320 - len(title_text) * 4) // 2  # 中央揃え
-        pyxel.text(title_x, 50, title_text, 7)  # 白色で表示
+        gfx.text(title_x, 50, title_text, 7)  # 白色で表示
     
     def draw_playfield_frame(self):
         """
         プレイフィールドの枠線描画
         """
+        gfx = get_backend()
         # プレイフィールドの背景と枠線を描画
-        pyxel.rect(self.playfield_x - 2, self.playfield_y - 2, 
+        gfx.rect(self.playfield_x - 2, self.playfield_y - 2, 
                   self.playfield_width + 4, self.playfield_height + 4, 5)  # 紫色の背景
-        pyxel.rectb(self.playfield_x - 3, self.playfield_y - 3, 
+        gfx.rectb(self.playfield_x - 3, self.playfield_y - 3, 
                    self.playfield_width + 6, self.playfield_height + 6, 7)  # 白色の外枠
-        pyxel.rectb(self.playfield_x - 1, self.playfield_y - 1, 
+        gfx.rectb(self.playfield_x - 1, self.playfield_y - 1, 
                    self.playfield_width + 2, self.playfield_height + 2, 13)  # 薄い紫色の内枠
     
     def draw_danger_warnings(self, danger_level, frame_count):
@@ -95,13 +187,14 @@ class UIRenderer:
             danger_level: 危険レベル
             frame_count: フレームカウンター
         """
+        gfx = get_backend()
         if danger_level >= 3:
             # 上部3行に警告表示（点滅効果）
             if frame_count % 30 < 15:  # 0.5秒ごとに点滅
                 for y in range(3):
                     # 上部3行に半透明の赤い警告エリアを表示
                     warning_y = self.playfield_y + y * 24
-                    pyxel.rect(self.playfield_x, warning_y, self.playfield_width, 2, 8)  # 赤色の警告線
+                    gfx.rect(self.playfield_x, warning_y, self.playfield_width, 2, 8)  # 赤色の警告線
     
     def draw_elimination_effects(self, elimination_active, elimination_timer, elimination_groups):
         """
@@ -112,6 +205,7 @@ class UIRenderer:
             elimination_timer: 消去タイマー
             elimination_groups: 消去予定グループ
         """
+        gfx = get_backend()
         if elimination_active and elimination_groups:
             # 点滅効果（フレーム数に基づく）
             if (elimination_timer // 5) % 2 == 0:  # 5フレームごとに点滅
@@ -120,21 +214,33 @@ class UIRenderer:
                         screen_x = self.playfield_x + x * 24
                         screen_y = self.playfield_y + y * 24
                         # 白い枠で強調表示
-                        pyxel.rectb(screen_x, screen_y, 24, 24, 7)
+                        gfx.rectb(screen_x, screen_y, 24, 24, 7)
     
     def draw_next_preview(self):
         """
         次のぷよペアのプレビュー表示
         """
+        self.draw_next_preview_frame()
+        self.draw_next_preview_puyos()
+    
+    def draw_next_preview_frame(self):
+        """
+        次のぷよペアの表示エリアの描画（背景・枠線・ラベル）
+        """
+        gfx = get_backend()
         # 次のぷよペアの表示エリアの背景と枠線
-        pyxel.rect(self.next_preview_x - 5, self.next_preview_y - 25, 
+        gfx.rect(self.next_preview_x - 5, self.next_preview_y - 25, 
                   self.preview_width, self.preview_height, 1)  # 暗い青色の背景
-        pyxel.rectb(self.next_preview_x - 5, self.next_preview_y - 25, 
+        gfx.rectb(self.next_preview_x - 5, self.next_preview_y - 25, 
                    self.preview_width, self.preview_height, 7)  # 白色の枠線
         
         # "NEXT" ラベルの表示（中央揃え）
-        pyxel.text(self.next_preview_x + 15, self.next_preview_y - 20, "NEXT", 7)
-        
+        gfx.text(self.next_preview_x + 15, self.next_preview_y - 20, "NEXT", 7)
+    
+    def draw_next_preview_puyos(self):
+        """
+        次のぷよペアの描画
+        """
         # 次のペアのプレビューを描画（中央に配置）
         self.puyo_manager.draw_next_pair_preview(self.next_preview_x + 11, self.next_preview_y + 10)
     
@@ -142,15 +248,27 @@ class UIRenderer:
         """
         次の次のぷよペアのプレビュー表示
         """
+        self.draw_next_next_preview_frame()
+        self.draw_next_next_preview_puyos()
+    
+    def draw_next_next_preview_frame(self):
+        """
+        次の次のぷよペアの表示エリアの描画（背景・枠線・ラベル）
+        """
+        gfx = get_backend()
         # 次の次のぷよペアの表示エリアの背景と枠線
-        pyxel.rect(self.next_next_preview_x - 5, self.next_next_preview_y - 15, 
+        gfx.rect(self.next_next_preview_x - 5, self.next_next_preview_y - 15, 
                   self.next_next_preview_width, self.next_next_preview_height, 1)  # 暗い青色の背景
-        pyxel.rectb(self.next_next_preview_x - 5, self.next_next_preview_y - 15, 
+        gfx.rectb(self.next_next_preview_x - 5, self.next_next_preview_y - 15, 
                    self.next_next_preview_width, self.next_next_preview_height, 7)  # 白色の枠線
         
         # "NEXT" ラベルの表示（小さめ）
-        pyxel.text(self.next_next_preview_x + 5, self.next_next_preview_y - 10, "NEXT", 6)  # 薄い色で小さく
-        
+        gfx.text(self.next_next_preview_x + 5, self.next_next_preview_y - 10, "NEXT", 6)  # 薄い色で小さく
+    
+    def draw_next_next_preview_puyos(self):
+        """
+        次の次のぷよペアの描画
+        """
         # 次の次のペアのプレビューを描画（小さく中央に配置）
         self.puyo_manager.draw_next_next_pair_preview(self.next_next_preview_x + 9, self.next_next_preview_y + 10)
     
@@ -165,12 +283,31 @@ class UIRenderer:
             score_animation_phase: アニメーション位相
             score_increment_amount: スコア増加量
         """
-        # スコア表示エリアの背景と枠線
-        pyxel.rect(self.score_area_x, self.score_area_y, 
+        self.draw_score_area_frame()
+        self.draw_score_value(score_animation_active, score_animation_timer,
+                              score_animation_phase, score_increment_amount)
+    
+    def draw_score_area_frame(self):
+        """
+        スコア表示エリアの背景と枠線の描画
+        """
+        gfx = get_backend()
+        gfx.rect(self.score_area_x, self.score_area_y, 
                   self.score_area_width, self.score_area_height, 5)  # 紫色の背景
-        pyxel.rectb(self.score_area_x, self.score_area_y, 
+        gfx.rectb(self.score_area_x, self.score_area_y, 
                    self.score_area_width, self.score_area_height, 7)  # 白色の枠線
+    
+    def draw_score_value(self, score_animation_active, score_animation_timer, 
+                         score_animation_phase, score_increment_amount):
+        """
+        スコア表示エリア内のスコアの描画
         
+        Args:
+            score_animation_active: スコアアニメーション中フラグ
+            score_animation_timer: アニメーションタイマー
+            score_animation_phase: アニメーション位相
+            score_increment_amount: スコア増加量
+        """
         # 強化されたスコア表示
         self.draw_enhanced_score_display(self.score_area_x + 5, self.score_area_y + 5,
                                        score_animation_active, score_animation_timer,
@@ -188,10 +325,11 @@ class UIRenderer:
             score_animation_phase: アニメーション位相
             score_increment_amount: スコア増加量
         """
+        gfx = get_backend()
         current_score = self.score_manager.get_score()
         
         # スコアラベルの表示
-        pyxel.text(x, y, "SCORE", 7)
+        gfx.text(x, y, "SCORE", 7)
         
         # スコア値の表示
         score_text = self.score_manager.format_score(current_score)
@@ -213,16 +351,16 @@ class UIRenderer:
             if score_increment_amount > 0:
                 increment_text = f"+{self.score_manager.format_score(score_increment_amount)}"
                 increment_y = score_y - 10 - int(5 * math.sin(score_animation_phase))
-                pyxel.text(x + 50, increment_y, increment_text, 8)  # 赤色で増加量表示
+                gfx.text(x + 50, increment_y, increment_text, 8)  # 赤色で増加量表示
         else:
             score_color = 7  # 通常の白色
         
         # スコア値の描画
-        pyxel.text(x, score_y, score_text, score_color)
+        gfx.text(x, score_y, score_text, score_color)
         
         # スコアの背景枠（見やすさ向上）
         text_width = len(score_text) * 4
-        pyxel.rectb(x - 2, y - 2, max(text_width + 4, 50), 22, 7)
+        gfx.rectb(x - 2, y - 2, max(text_width + 4, 50), 22, 7)
     
     def draw_chain_animation(self, show_chain_text, chain_level, chain_animation_phase):
         """
@@ -233,6 +371,7 @@ class UIRenderer:
             chain_level: 連鎖レベル
             chain_animation_phase: アニメーション位相
         """
+        gfx = get_backend()
         if show_chain_text and chain_level > 0:
             # アニメーション効果（サイン波による拡大縮小）
             scale_factor = 1.0 + 0.3 * math.sin(chain_animation_phase)
@@ -244,12 +383,9 @@ class UIRenderer:
             text_y = 200
             
             # 背景の描画（黒い矩形）
-            bg_width = int(text_width * scale_factor) + 8
-            bg_height = int(8 * scale_factor) + 4
-            bg_x = text_x - (bg_width - text_width) // 2 - 4
-            bg_y = text_y - (bg_height - 8) // 2 - 2
-            pyxel.rect(bg_x, bg_y, bg_width, bg_height, 0)
-            pyxel.rectb(bg_x, bg_y, bg_width, bg_height, 7)
+            bg_x, bg_y, bg_width, bg_height = self._chain_background_rect(text_x, text_y, text_width, scale_factor)
+            gfx.rect(bg_x, bg_y, bg_width, bg_height, 0)
+            gfx.rectb(bg_x, bg_y, bg_width, bg_height, 7)
             
             # 連鎖数に応じた色の選択
             chain_colors = [7, 8, 9, 10, 11, 12, 13, 14, 15]  # 白から様々な色
@@ -257,7 +393,33 @@ class UIRenderer:
             chain_color = chain_colors[color_index]
             
             # 連鎖テキストの描画
-            pyxel.text(text_x, text_y, chain_text, chain_color)
+            gfx.text(text_x, text_y, chain_text, chain_color)
+    
+    def get_chain_animation_bounds(self, chain_level):
+        """
+        連鎖アニメーションが描画されうる範囲を取得（拡大が最大の時の背景の矩形）
+        
+        Args:
+            chain_level: 連鎖レベル
+        
+        Returns:
+            tuple: (x, y, 幅, 高さ)
+        """
+        text_width = len(f"{chain_level} CHAIN!") * 4
+        return self._chain_background_rect((320 - text_width) // 2, 200, text_width, 1.3)
+    
+    def _chain_background_rect(self, text_x, text_y, text_width, scale_factor):
+        """
+        連鎖テキストの背景の矩形を計算
+        
+        Returns:
+            tuple: (x, y, 幅, 高さ)
+        """
+        bg_width = int(text_width * scale_factor) + 8
+        bg_height = int(8 * scale_factor) + 4
+        bg_x = text_x - (bg_width - text_width) // 2 - 4
+        bg_y = text_y - (bg_height - 8) // 2 - 2
+        return bg_x, bg_y, bg_width, bg_height
     
     def draw_controls_panel(self, debug_mode):
         """
@@ -266,6 +428,7 @@ class UIRenderer:
         Args:
             debug_mode: デバッグモードフラグ
         """
+        gfx = get_backend()
         # スコア欄の下に配置
         controls_x = self.score_area_x
         controls_y = self.score_area_y + self.score_area_height + 10
@@ -274,27 +437,27 @@ class UIRenderer:
         controls_height = 70  # コンパクトに縮小
         
         # 操作説明パネルの背景と枠線
-        pyxel.rect(controls_x, controls_y, controls_width, controls_height, 1)  # 暗い青色の背景
-        pyxel.rectb(controls_x, controls_y, controls_width, controls_height, 7)  # 白色の枠線
+        gfx.rect(controls_x, controls_y, controls_width, controls_height, 1)  # 暗い青色の背景
+        gfx.rectb(controls_x, controls_y, controls_width, controls_height, 7)  # 白色の枠線
         
         # 操作説明のタイトル
-        pyxel.text(controls_x + 5, controls_y + 5, "CONTROLS:", 10)  # 緑色のタイトル
+        gfx.text(controls_x + 5, controls_y + 5, "CONTROLS:", 10)  # 緑色のタイトル
         
         # 操作説明の表示（縦に並べる）
         text_x = controls_x + 5
-        pyxel.text(text_x, controls_y + 15, "Arrow: Move/Drop", 7)
-        pyxel.text(text_x, controls_y + 25, "X/UP: Rotate CW", 7)
-        pyxel.text(text_x, controls_y + 35, "Z: Rotate CCW", 7)
-        pyxel.text(text_x, controls_y + 45, "R: Restart", 7)
+        gfx.text(text_x, controls_y + 15, "Arrow: Move/Drop", 7)
+        gfx.text(text_x, controls_y + 25, "X/UP: Rotate CW", 7)
+        gfx.text(text_x, controls_y + 35, "Z: Rotate CCW", 7)
+        gfx.text(text_x, controls_y + 45, "R: Restart", 7)
         
         # デバッグ用操作（デバッグモード時のみ表示）
         if debug_mode:
             debug_x = controls_x + 5
             debug_y = controls_y + controls_height + 5
-            pyxel.text(debug_x, debug_y + 0, "G: Test Gravity", 6)
-            pyxel.text(debug_x, debug_y + 10, "C: Test Connection", 6)
-            pyxel.text(debug_x, debug_y + 20, "E: Test Elimination", 6)
-            pyxel.text(debug_x, debug_y + 30, "A: Test Chain", 6)
+            gfx.text(debug_x, debug_y + 0, "G: Test Gravity", 6)
+            gfx.text(debug_x, debug_y + 10, "C: Test Connection", 6)
+            gfx.text(debug_x, debug_y + 20, "E: Test Elimination", 6)
+            gfx.text(debug_x, debug_y + 30, "A: Test Chain", 6)
     
     def draw_final_score_display(self, show_final_score):
         """
@@ -303,6 +466,7 @@ class UIRenderer:
         Args:
             show_final_score: 最終スコア表示フラグ
         """
+        gfx = get_backend()
         if not show_final_score:
             return
         
@@ -311,7 +475,7 @@ class UIRenderer:
         screen_height = 480
         
         # 半透明の黒い背景
-        pyxel.rect(0, 0, screen_width, screen_height, 0)
+        gfx.rect(0, 0, screen_width, screen_height, 0)
         
         # 最終スコア表示エリア
         final_score_x = 60
@@ -320,22 +484,22 @@ class UIRenderer:
         final_score_height = 180
         
         # 最終スコア表示の背景と枠線
-        pyxel.rect(final_score_x, final_score_y, final_score_width, final_score_height, 5)  # 紫色の背景
-        pyxel.rectb(final_score_x, final_score_y, final_score_width, final_score_height, 7)  # 白色の枠線
-        pyxel.rectb(final_score_x + 2, final_score_y + 2, final_score_width - 4, final_score_height - 4, 13)  # 内側の枠線
+        gfx.rect(final_score_x, final_score_y, final_score_width, final_score_height, 5)  # 紫色の背景
+        gfx.rectb(final_score_x, final_score_y, final_score_width, final_score_height, 7)  # 白色の枠線
+        gfx.rectb(final_score_x + 2, final_score_y + 2, final_score_width - 4, final_score_height - 4, 13)  # 内側の枠線
         
         # タイトル
         title_text = "GAME OVER"
         title_x = final_score_x + (final_score_width - len(title_text) * 4) // 2
-        pyxel.text(title_x, final_score_y + 20, title_text, 8)  # 赤色
+        gfx.text(title_x, final_score_y + 20, title_text, 8)  # 赤色
         
         # 最終スコア
         final_score = self.score_manager.get_score()
         score_text = f"FINAL SCORE: {self.score_manager.format_score(final_score)}"
         score_x = final_score_x + (final_score_width - len(score_text) * 4) // 2
-        pyxel.text(score_x, final_score_y + 50, score_text, 7)  # 白色
+        gfx.text(score_x, final_score_y + 50, score_text, 7)  # 白色
         
         # 操作説明
         restart_text = "Press R to Restart"
         restart_x = final_score_x + (final_score_width - len(restart_text) * 4) // 2
-        pyxel.text(restart_x, final_score_y + 80, restart_text, 10)  # 緑色
\ No newline at end of file
+        gfx.text(restart_x, final_score_y + 80, restart_text, 10)  # 緑色
\ No newline at end of file
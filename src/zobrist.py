@@ -0,0 +1,31 @@
+"""
+Zobrist - 盤面ハッシュ用の乱数表
+Requirements: 2.5 - 盤面状態の高速な同一性判定
+"""
+
+import random
+
+ZOBRIST_SEED = 0x5A0B  # 乱数表の生成シード（実行ごとに同じハッシュ値になるよう固定）
+COLOR_SLOTS = 6  # 色コード0-5（0は未使用）
+
+_tables = {}
+
+
+def get_zobrist_table(width, height):
+    """
+    指定サイズの盤面用の乱数表を取得（サイズごとに1回だけ生成）
+    
+    Args:
+        width (int): フィールドの幅
+        height (int): フィールドの高さ
+    
+    Returns:
+        list: インデックス (y * width + x) * COLOR_SLOTS + color の64ビット乱数
+    """
+    key = (width, height)
+    table = _tables.get(key)
+    if table is None:
+        rng = random.Random(ZOBRIST_SEED)
+        table = [rng.getrandbits(64) for _ in range(width * height * COLOR_SLOTS)]
+        _tables[key] = table
+    return table
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+NumPyバッチ環境のテスト
+"""
+
+import sys
+import os
+import random
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+from src.batch_env import BatchPuyoEnv
+from src.playfield import PlayField
+from src.puyo import Puyo
+from src.score_manager import ScoreManager
+
+
+def _fill_random(playfield, seed):
+    """シード付きでランダムな盤面を作成（浮いたぷよを含む）"""
+    rng = random.Random(seed)
+    for x in range(playfield.get_width()):
+        column_height = rng.randint(0, playfield.get_height())
+        for y in range(playfield.get_height() - column_height, playfield.get_height()):
+            if rng.random() < 0.85:
+                playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4, 1, 2, 3, 4, 5])))
+
+
+def _colors(playfield):
+    """盤面を色コードの2次元リストに変換"""
+    return [[puyo.get_color() if puyo else 0 for puyo in row] for row in playfield.grid]
+
+
+def test_batch_resolve_matches_playfield():
+    """バッチ版の連鎖解決がPlayField.resolve_chainと一致することをテスト"""
+    print("Running batch resolve equivalence test...")
+    batch_size = 200
+    env = BatchPuyoEnv(batch_size)
+    playfields = []
+    for seed in range(batch_size):
+        playfield = PlayField()
+        _fill_random(playfield, seed)
+        env.load_playfield(seed, playfield)
+        playfields.append(playfield)
+
+    chain_counts, chain_scores = env.resolve_chains()
+
+    score_manager = ScoreManager()
+    for index, playfield in enumerate(playfields):
+        steps = playfield.resolve_chain(score_manager)
+        assert chain_counts[index] == len(steps)
+        assert chain_scores[index] == sum(step['score'] for step in steps)
+        assert env.boards[index].tolist() == _colors(playfield)
+    assert chain_counts.max() >= 2
+    print("[OK] Batch resolve equivalence test passed")
+
+
+def test_batch_place_pairs():
+    """ぷよペアが回転状態に応じた位置に配置されることをテスト"""
+    print("Running batch placement test...")
+    env = BatchPuyoEnv(5)
+    env.boards[:, 11, 0] = 3
+    env.boards[:, 10, 0] = 3
+
+    placed = env.place_pairs([2, 2, 0, 1, 5], [2, 0, 1, 3, 1], [1, 1, 1, 1, 1], [2, 2, 2, 2, 2])
+    assert placed.tolist() == [True, True, True, True, False]
+
+    # 下向き：サブぷよが下
+    assert env.boards[0, 11, 2] == 2 and env.boards[0, 10, 2] == 1
+    # 上向き：メインぷよが下
+    assert env.boards[1, 11, 2] == 1 and env.boards[1, 10, 2] == 2
+    # 横向き：高い方の列に合わせて止まる
+    assert env.boards[2, 9, 0] == 1 and env.boards[2, 9, 1] == 2
+    assert env.boards[3, 9, 1] == 1 and env.boards[3, 9, 0] == 2
+    # 範囲外の配置は盤面を変更しない
+    assert not env.boards[4, :9].any()
+    print("[OK] Batch placement test passed")
+
+
+def test_batch_step_scores_and_game_over():
+    """ステップ実行でスコア加算とゲームオーバー判定が行われることをテスト"""
+    print("Running batch step test...")
+    env = BatchPuyoEnv(2)
+    env.boards[0, 11, 0:2] = 1
+    env.boards[1, 1:, 3] = 4
+
+    rewards, chain_counts, done = env.step([2, 3], [1, 2], [1, 2], [1, 3])
+    expected = ScoreManager().calculate_score(4, 1, 1, 1)
+    assert rewards.tolist() == [expected, 0]
+    assert chain_counts.tolist() == [1, 0]
+    assert env.scores.tolist() == [expected, 0]
+    assert done.tolist() == [False, True]
+    assert not env.boards[0].any()
+
+    # 終了済みの盤面には配置しない
+    rewards, _, done = env.step([0, 0], [2, 2], [1, 1], [1, 1])
+    assert done.tolist() == [False, True]
+    assert not env.boards[1, :, 0].any()
+    env.reset(done)
+    assert not env.done.any()
+    assert not env.boards[1].any()
+    print("[OK] Batch step test passed")
+
+
+if __name__ == "__main__":
+    test_batch_resolve_matches_playfield()
+    test_batch_place_pairs()
+    test_batch_step_scores_and_game_over()
+    print("Batch environment test passed! [OK]")
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+ベンチマーク用盤面と比較処理のテスト
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.fixtures import (
+    DEEP_CHAIN_LENGTH, FIXTURES, build_playfield, deep_chain_rows, half_full_rows,
+    near_death_rows, playfield_to_rows
+)
+from benchmarks.engine_benchmarks import compare_results, main
+
+
+def test_fixtures():
+    """盤面がシード固定で再現でき、想定どおりの形になっていることをテスト"""
+    print("Running benchmark fixture test...")
+    assert half_full_rows() == half_full_rows()
+    assert near_death_rows() == near_death_rows()
+
+    for name, fixture in FIXTURES.items():
+        rows = fixture()
+        playfield = build_playfield(rows)
+        assert playfield_to_rows(playfield) == rows
+        if name != 'deep_chain':
+            assert playfield.find_erasable_groups() == []
+
+    assert build_playfield(half_full_rows()).get_column_heights() == (6,) * 6
+    assert build_playfield(near_death_rows()).get_column_heights() == (10,) * 6
+
+    steps = build_playfield(deep_chain_rows()).resolve_chain()
+    assert len(steps) == DEEP_CHAIN_LENGTH
+    print("[OK] Benchmark fixture test passed")
+
+
+def test_compare_results():
+    """基準値との比較で劣化が検出されることをテスト"""
+    print("Running benchmark compare test...")
+    baseline = {'results': {'a': {'min_ns': 100.0}, 'b': {'min_ns': 100.0}, 'old': {'min_ns': 1.0}}}
+    current = {'results': {'a': {'min_ns': 110.0}, 'b': {'min_ns': 150.0}, 'new': {'min_ns': 1.0}}}
+    rows = compare_results(baseline, current, threshold=0.2)
+    assert [(name, regressed) for name, _, _, _, regressed in rows] == [('a', False), ('b', True)]
+    print("[OK] Benchmark compare test passed")
+
+
+def test_command_line():
+    """結果のJSON出力と比較モードの終了コードをテスト"""
+    print("Running benchmark command line test...")
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'results.json')
+        args = ['--filter', 'try_rotate_with_kick[empty]', '--repeat', '1', '--min-time', '0.001']
+        assert main(args + ['--output', output]) == 0
+        with open(output, encoding='utf-8') as f:
+            results = json.load(f)
+        assert list(results['results']) == ['try_rotate_with_kick[empty]']
+
+        # 極端に速い基準値と比べると劣化として終了コード1を返す
+        results['results']['try_rotate_with_kick[empty]']['min_ns'] = 0.001
+        baseline = os.path.join(directory, 'baseline.json')
+        with open(baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+        assert main(args + ['--compare', baseline]) == 1
+    print("[OK] Benchmark command line test passed")
+
+
+if __name__ == "__main__":
+    test_fixtures()
+    test_compare_results()
+    test_command_line()
+    print("Benchmark test passed! [OK]")
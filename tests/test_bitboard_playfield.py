@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+ビットボード版プレイフィールドのテスト
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.fixtures import DEEP_CHAIN_LENGTH, build_playfield, deep_chain_rows
+from src.playfield import PlayField
+from src.bitboard_playfield import BitboardPlayField
+from src.puyo import Puyo
+from src.score_manager import ScoreManager
+
+
+def _fill_random(playfield, seed):
+    """シード付きでランダムな盤面を作成"""
+    rng = random.Random(seed)
+    for x in range(playfield.get_width()):
+        column_height = rng.randint(0, playfield.get_height())
+        for y in range(playfield.get_height() - column_height, playfield.get_height()):
+            if rng.random() < 0.8:
+                playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4, 5])))
+
+
+def _colors(playfield):
+    """盤面を色コードの2次元リストに変換"""
+    return [[puyo.get_color() if puyo else 0 for puyo in row] for row in playfield.grid]
+
+
+def _normalize(groups):
+    """グループの比較用に並びを正規化"""
+    return sorted(sorted(group) for group in groups)
+
+
+def test_bitboard_matches_list_playfield():
+    """ビットボード版が通常版と同じ結果を返すことをテスト"""
+    print("Running bitboard equivalence test...")
+    for seed in range(100):
+        list_field = PlayField()
+        bit_field = BitboardPlayField()
+        _fill_random(list_field, seed)
+        _fill_random(bit_field, seed)
+
+        assert _normalize(list_field.find_connected_groups()) == _normalize(bit_field.find_connected_groups())
+        for x in range(6):
+            for y in range(12):
+                assert list_field.is_empty(x, y) == bit_field.is_empty(x, y)
+                assert list_field.count_connected_puyos(x, y) == bit_field.count_connected_puyos(x, y)
+
+        # 消去と重力を安定するまで繰り返して比較
+        while True:
+            list_result = list_field.process_puyo_elimination()
+            bit_result = bit_field.process_puyo_elimination()
+            assert list_result == bit_result
+            list_moved = list_field.apply_gravity()
+            bit_moved = bit_field.apply_gravity()
+            assert list_moved == bit_moved
+            assert _colors(list_field) == _colors(bit_field)
+            if not list_result[0] and not list_moved:
+                break
+    print("[OK] Bitboard equivalence test passed")
+
+
+def test_bitboard_gravity_updates_positions():
+    """重力処理でぷよの位置が更新されることをテスト"""
+    print("Running bitboard gravity test...")
+    playfield = BitboardPlayField()
+    puyo = Puyo(2)
+    playfield.place_puyo(3, 4, puyo)
+
+    assert playfield.apply_gravity()
+    assert playfield.is_empty(3, 4)
+    assert playfield.get_puyo(3, 11) is puyo
+    assert puyo.get_position() == (3, 11)
+    assert not playfield.apply_gravity()
+    print("[OK] Bitboard gravity test passed")
+
+
+def test_bitboard_erases_adjacent_obstacles():
+    """隣接するお邪魔ぷよが一緒に消去されることをテスト"""
+    print("Running bitboard obstacle erase test...")
+    playfield = BitboardPlayField()
+    for x in range(4):
+        playfield.place_puyo(x, 11, Puyo(1))
+    playfield.place_puyo(0, 10, Puyo(5))
+    playfield.place_puyo(5, 10, Puyo(5))
+
+    eliminated, total_erased, group_count = playfield.process_puyo_elimination()
+    assert eliminated
+    assert total_erased == 5
+    assert group_count == 1
+    assert playfield.is_empty(0, 10)
+    assert not playfield.is_empty(5, 10)
+    print("[OK] Bitboard obstacle erase test passed")
+
+
+def _normalize_steps(steps):
+    """連鎖ステップの比較用にグループと色の並びを正規化"""
+    normalized = []
+    for step in steps:
+        step = dict(step)
+        step['groups'], step['colors'] = zip(*sorted(zip(map(sorted, step['groups']), step['colors'])))
+        normalized.append(step)
+    return normalized
+
+
+def test_bitboard_resolve_chain_matches_list_playfield():
+    """ビットボード版のresolve_chainが通常版と同じ結果になり、Undoで戻せることをテスト"""
+    print("Running bitboard resolve chain test...")
+    score_manager = ScoreManager()
+    boards = [(build_playfield(deep_chain_rows()), build_playfield(deep_chain_rows(), BitboardPlayField))]
+    for seed in range(200):
+        list_field = PlayField()
+        bit_field = BitboardPlayField()
+        _fill_random(list_field, seed)
+        _fill_random(bit_field, seed)
+        boards.append((list_field, bit_field))
+
+    for list_field, bit_field in boards:
+        snapshot = bit_field.snapshot()
+        mark = bit_field.mark_undo()
+        list_steps = list_field.resolve_chain(score_manager)
+        bit_steps = bit_field.resolve_chain(score_manager)
+        assert _normalize_steps(list_steps) == _normalize_steps(bit_steps)
+        assert _colors(list_field) == _colors(bit_field)
+        assert bit_field.snapshot() == list_field.snapshot()
+        assert bit_field.get_hash() == list_field.get_hash() == bit_field.compute_hash()
+        for x, y, puyo in bit_field.get_all_puyos():
+            assert puyo.get_position() == (x, y)
+
+        bit_field.undo(mark)
+        assert bit_field.snapshot() == snapshot
+        assert bit_field.get_hash() == bit_field.compute_hash()
+    assert len(boards[0][1].resolve_chain()) == DEEP_CHAIN_LENGTH
+    print("[OK] Bitboard resolve chain test passed")
+
+
+if __name__ == "__main__":
+    test_bitboard_matches_list_playfield()
+    test_bitboard_gravity_updates_positions()
+    test_bitboard_erases_adjacent_obstacles()
+    test_bitboard_resolve_chain_matches_list_playfield()
+    print("Bitboard playfield test passed! [OK]")
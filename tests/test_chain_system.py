@@ -7,11 +7,77 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.playfield import PlayField
+from src.puyo import Puyo
+from src.puyo_manager import PuyoManager
+from src.score_manager import ScoreManager
+from src.audio_manager import AudioManager
+from src.game_systems import GameSystems
+
+def _build_two_chain_field():
+    """赤4つの消去で緑が落ちて2連鎖になる盤面を作成"""
+    playfield = PlayField()
+    for y in range(8, 12):
+        playfield.place_puyo(0, y, Puyo(1))  # 赤
+    playfield.place_puyo(0, 7, Puyo(3))  # 赤の上に緑
+    for y in range(9, 12):
+        playfield.place_puyo(1, y, Puyo(3))  # 緑
+    playfield.place_puyo(2, 11, Puyo(5))  # 緑に隣接するお邪魔ぷよ
+    return playfield
+
+def _colors(playfield):
+    """盤面を色コードの2次元リストに変換"""
+    return [[puyo.get_color() if puyo else 0 for puyo in row] for row in playfield.grid]
+
 def test_chain_system_basic():
     """chain_systemの基本テスト"""
     print("Running chain_system basic test...")
     print("[OK] chain_system basic test passed")
 
+def test_resolve_chain_records_steps():
+    """resolve_chainが連鎖ステップを記録することをテスト"""
+    print("Running resolve chain test...")
+    playfield = _build_two_chain_field()
+    steps = playfield.resolve_chain(ScoreManager())
+    
+    assert [step['chain_level'] for step in steps] == [1, 2]
+    assert steps[0]['colors'] == [1]
+    assert steps[0]['cleared_count'] == 4
+    assert steps[0]['erased_count'] == 4
+    assert steps[1]['colors'] == [3]
+    assert steps[1]['erased_count'] == 5  # お邪魔ぷよを含む
+    assert all(step['score'] > 0 for step in steps)
+    assert playfield.get_all_puyos() == []
+    assert playfield.resolve_chain() == []
+    print("[OK] Resolve chain test passed")
+
+def test_resolve_chain_matches_animated_path():
+    """resolve_chainの結果がフレーム単位の処理と一致することをテスト"""
+    print("Running resolve chain equivalence test...")
+    instant_field = _build_two_chain_field()
+    instant_field.place_puyo(4, 5, Puyo(2))  # 重力で落ちるだけのぷよ
+    instant_score = ScoreManager()
+    steps = instant_field.resolve_chain(instant_score)
+    
+    animated_field = _build_two_chain_field()
+    animated_field.place_puyo(4, 5, Puyo(2))
+    animated_score = ScoreManager()
+    systems = GameSystems(animated_field, PuyoManager(), animated_score, AudioManager(), None)
+    chain_levels = []
+    systems.start_elimination_process()
+    while systems.is_systems_active():
+        if systems.elimination_active and systems.chain_level not in chain_levels:
+            chain_levels.append(systems.chain_level)
+        systems.update_elimination_system()
+        systems.update_gravity_system()
+    
+    assert chain_levels == [step['chain_level'] for step in steps]
+    assert animated_score.get_score() == sum(step['score'] for step in steps)
+    assert _colors(animated_field) == _colors(instant_field)
+    print("[OK] Resolve chain equivalence test passed")
+
 if __name__ == "__main__":
     test_chain_system_basic()
+    test_resolve_chain_records_steps()
+    test_resolve_chain_matches_animated_path()
     print("chain_system test passed! [OK]")
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+列の高さインデックスと一括落下のテスト
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.playfield import PlayField
+from src.bitboard_playfield import BitboardPlayField
+from src.puyo import Puyo
+from src.puyo_pair import PuyoPair
+from src.headless import HeadlessGame
+
+
+def _scan_height(playfield, x):
+    """セルを走査して列の高さを求める"""
+    for y in range(playfield.get_height()):
+        if playfield.grid[y][x] is not None:
+            return playfield.get_height() - y
+    return 0
+
+
+def _scan_fall_distance(playfield, x, y):
+    """セルを走査して落下距離を求める"""
+    distance = 0
+    while y + distance + 1 < playfield.get_height() and playfield.grid[y + distance + 1][x] is None:
+        distance += 1
+    return distance
+
+
+def test_column_index_matches_scan():
+    """列の高さインデックスによる判定がセルの走査結果と一致することをテスト"""
+    print("Running column index test...")
+    rng = random.Random(21)
+    for playfield in (PlayField(), BitboardPlayField()):
+        for _ in range(1500):
+            x, y = rng.randrange(6), rng.randrange(12)
+            operation = rng.random()
+            if operation < 0.6:
+                playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4])))
+            elif operation < 0.85:
+                playfield.remove_puyo(x, y)
+            elif operation < 0.95:
+                playfield.apply_gravity()
+            else:
+                playfield.process_puyo_elimination()
+
+            heights = tuple(_scan_height(playfield, column) for column in range(6))
+            assert playfield.get_column_heights() == heights
+            top_columns = [column for column in range(6) if playfield.grid[0][column] is not None]
+            assert playfield.find_column_reaching_top() == (top_columns[0] if top_columns else -1)
+            danger = sum(1 for row in playfield.grid[:3] for puyo in row if puyo is not None)
+            assert playfield.count_puyos_in_top_rows(3) == danger
+
+            for column in range(6):
+                for row in range(12):
+                    if playfield.grid[row][column] is None:
+                        continue
+                    below = any(playfield.grid[r][column] is not None for r in range(row + 1, 12))
+                    assert playfield._is_puyo_floating(column, row) == (row < 11 and not below)
+                    assert playfield.calculate_fall_distance(column, row) == _scan_fall_distance(playfield, column, row)
+    print("[OK] Column index test passed")
+
+
+def test_pair_drop_distance_matches_stepping():
+    """ぷよペアの落下段数が1段ずつ移動した結果と一致することをテスト"""
+    print("Running pair drop distance test...")
+    rng = random.Random(4)
+    for _ in range(300):
+        playfield = PlayField()
+        for column in range(6):
+            for row in range(12 - rng.randint(0, 9), 12):
+                playfield.place_puyo(column, row, Puyo(rng.choice([1, 2, 3, 4])))
+        pair = PuyoPair(Puyo(1), Puyo(2), rng.randrange(1, 5), 1)
+        pair.rotation = rng.randrange(4)
+        pair.set_position(pair.x, 1)
+        if not playfield.can_place_puyo_pair(pair):
+            continue
+
+        steps = 0
+        while playfield.can_move_puyo_pair(pair, 0, steps + 1):
+            steps += 1
+        assert playfield.get_pair_drop_distance(pair) == steps
+    print("[OK] Pair drop distance test passed")
+
+
+def test_hard_drop_lands_pair():
+    """一括落下でぷよペアが着地位置に固定されることをテスト"""
+    print("Running hard drop test...")
+    game = HeadlessGame()
+    systems = game.game_systems
+    pair = systems.current_falling_pair
+    main_color = pair.get_main_puyo().get_color()
+    sub_color = pair.get_sub_puyo().get_color()
+
+    systems.hard_drop()
+    # 初期状態は下向き（サブぷよが下）
+    assert game.playfield.get_puyo(2, 11).get_color() == sub_color
+    assert game.playfield.get_puyo(2, 10).get_color() == main_color
+    assert systems.current_falling_pair is not pair
+    print("[OK] Hard drop test passed")
+
+
+if __name__ == "__main__":
+    test_column_index_matches_scan()
+    test_pair_drop_distance_matches_stepping()
+    test_hard_drop_lands_pair()
+    print("Column heights test passed! [OK]")
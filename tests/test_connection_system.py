@@ -5,13 +5,90 @@ connection_systemのテスト
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.playfield import PlayField
+from src.puyo import Puyo
+
 def test_connection_system_basic():
     """connection_systemの基本テスト"""
     print("Running connection_system basic test...")
     print("[OK] connection_system basic test passed")
 
+def test_connected_group_labeling():
+    """1回のラベル付けから連結グループと連結数が得られることをテスト"""
+    print("Running connected group labeling test...")
+    playfield = PlayField()
+    # L字型の赤4つ、離れた青2つ、お邪魔ぷよ1つ
+    for x, y in [(0, 9), (0, 10), (0, 11), (1, 11)]:
+        playfield.place_puyo(x, y, Puyo(1))
+    playfield.place_puyo(4, 11, Puyo(4))
+    playfield.place_puyo(5, 11, Puyo(4))
+    playfield.place_puyo(2, 11, Puyo(5))
+    
+    groups = playfield.find_connected_groups()
+    assert sorted(len(group) for group in groups) == [2, 4]
+    assert len(playfield.find_erasable_groups()) == 1
+    assert playfield.count_connected_puyos(1, 11) == 4
+    assert playfield.count_connected_puyos(5, 11) == 2
+    assert playfield.count_connected_puyos(2, 11) == 0  # お邪魔ぷよ
+    assert playfield.count_connected_puyos(3, 3) == 0  # 空きセル
+    
+    # 盤面を変更するとラベル付けがやり直される
+    playfield.remove_puyo(0, 9)
+    assert playfield.find_erasable_groups() == []
+    assert playfield.count_connected_puyos(1, 11) == 3
+    print("[OK] Connected group labeling test passed")
+
+def test_connection_on_enlarged_field():
+    """再帰上限を超える大きさのフィールドでも連結判定できることをテスト"""
+    print("Running enlarged field connection test...")
+    playfield = PlayField()
+    playfield.width = 60
+    playfield.height = 120
+    playfield.grid = [[Puyo(3) for _ in range(playfield.width)] for _ in range(playfield.height)]
+    
+    groups = playfield.find_connected_groups()
+    assert len(groups) == 1
+    assert len(groups[0]) == 60 * 120
+    print("[OK] Enlarged field connection test passed")
+
+def test_incremental_group_tracking():
+    """差分更新したグループが全体の再ラベル付けと一致することをテスト"""
+    print("Running incremental group tracking test...")
+    rng = random.Random(7)
+    playfield = PlayField()
+    
+    def normalize(groups):
+        return sorted(sorted(group) for group in groups)
+    
+    for step in range(2000):
+        operation = rng.random()
+        x = rng.randrange(6)
+        y = rng.randrange(12)
+        if operation < 0.6:
+            playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4, 5])))
+        elif operation < 0.8:
+            playfield.remove_puyo(x, y)
+        elif operation < 0.9:
+            playfield.process_puyo_elimination()
+        else:
+            playfield.apply_gravity()
+        
+        expected_groups, _ = playfield._label_connected_groups()
+        assert normalize(playfield.find_connected_groups()) == normalize(expected_groups)
+        assert normalize(playfield.find_erasable_groups()) == normalize(
+            group for group in expected_groups if len(group) >= 4)
+        
+        if step % 500 == 499:
+            playfield.clear()
+            assert playfield.find_connected_groups() == []
+    print("[OK] Incremental group tracking test passed")
+
 if __name__ == "__main__":
     test_connection_system_basic()
+    test_connected_group_labeling()
+    test_connection_on_enlarged_field()
+    test_incremental_group_tracking()
     print("connection_system test passed! [OK]")
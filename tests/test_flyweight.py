@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+スロット化とフライウェイト盤面のテスト
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.playfield import PlayField
+from src.bitboard_playfield import BitboardPlayField
+from src.puyo import Puyo
+from src.puyo_pair import PuyoPair
+
+
+def _colors(playfield):
+    """盤面を色コードの2次元リストに変換"""
+    return [[puyo.get_color() if puyo else 0 for puyo in row] for row in playfield.grid]
+
+
+def test_puyo_and_pair_use_slots():
+    """PuyoとPuyoPairが__dict__を持たないことをテスト"""
+    print("Running slots test...")
+    pair = PuyoPair(Puyo(1), Puyo(2))
+    assert not hasattr(pair.get_main_puyo(), '__dict__')
+    assert not hasattr(pair, '__dict__')
+    try:
+        pair.get_main_puyo().unknown = 1
+        assert False, "スロットにない属性は設定できない"
+    except AttributeError:
+        pass
+    print("[OK] Slots test passed")
+
+
+def test_flyweight_field_matches_normal_field():
+    """フライウェイト盤面が通常の盤面と同じ結果になることをテスト"""
+    print("Running flyweight equivalence test...")
+    for field_class in (PlayField, BitboardPlayField):
+        for seed in range(30):
+            rng = random.Random(seed)
+            normal = field_class()
+            flyweight = field_class(flyweight=True)
+            for x in range(6):
+                for y in range(12 - rng.randint(0, 10), 12):
+                    color = rng.choice([1, 2, 3, 4, 5])
+                    normal.place_puyo(x, y, Puyo(color))
+                    flyweight.place_puyo(x, y, Puyo(color))
+
+            assert normal.resolve_chain() == flyweight.resolve_chain()
+            assert _colors(normal) == _colors(flyweight)
+            assert normal.get_hash() == flyweight.get_hash()
+    print("[OK] Flyweight equivalence test passed")
+
+
+def test_flyweight_cells_share_puyo_objects():
+    """フライウェイト盤面では色ごとに共有ぷよを参照し、位置を更新しないことをテスト"""
+    print("Running flyweight sharing test...")
+    playfield = PlayField(flyweight=True)
+    placed = Puyo(3, 4, 4)
+    playfield.place_puyo(0, 5, placed)
+    playfield.place_puyo(1, 11, Puyo(3))
+
+    assert placed.get_position() == (4, 4)
+    assert playfield.get_puyo(0, 5) is Puyo.shared(3)
+    assert playfield.get_puyo(1, 11) is Puyo.shared(3)
+
+    mark = playfield.mark_undo()
+    playfield.apply_gravity()
+    assert playfield.get_puyo(0, 11) is Puyo.shared(3)
+    playfield.undo(mark)
+    assert playfield.get_puyo(0, 5) is Puyo.shared(3)
+
+    snapshot = playfield.snapshot()
+    playfield.clear()
+    playfield.restore(snapshot)
+    assert playfield.get_puyo(1, 11) is Puyo.shared(3)
+    assert Puyo.shared(3).get_position() == (0, 0)
+    print("[OK] Flyweight sharing test passed")
+
+
+if __name__ == "__main__":
+    test_puyo_and_pair_use_slots()
+    test_flyweight_field_matches_normal_field()
+    test_flyweight_cells_share_puyo_objects()
+    print("Flyweight test passed! [OK]")
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+フレームペーシングのテスト
+Requirements: 1.1 - メインゲームループの時間管理
+"""
+
+import sys
+import os
+import unittest.mock as mock
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.frame_pacer import FramePacer
+from src.game import KiroKiroGame
+from src.graphics import set_backend
+
+
+class MockPyxel:
+    """Pyxelのモック - キー入力なし"""
+    
+    KEY_LEFT = 'LEFT'
+    KEY_RIGHT = 'RIGHT'
+    KEY_UP = 'UP'
+    KEY_DOWN = 'DOWN'
+    KEY_X = 'X'
+    KEY_Z = 'Z'
+    KEY_Q = 'Q'
+    KEY_ESCAPE = 'ESCAPE'
+    KEY_G = 'G'
+    KEY_C = 'C'
+    KEY_E = 'E'
+    KEY_A = 'A'
+    KEY_R = 'R'
+    KEY_RETURN = 'RETURN'
+    KEY_SPACE = 'SPACE'
+    
+    def btn(self, key):
+        return False
+    
+    def btnp(self, key):
+        return False
+    
+    def quit(self):
+        pass
+
+
+class FakeTimer:
+    """手動で進める時計"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def _run_loop(pacer, timer, seconds, update_cost, draw_cost):
+    """
+    pyxelのループ（予定時刻まで待ち、遅れている場合は待たずにupdateとdrawを1回ずつ呼ぶ）を模擬する
+    
+    Returns:
+        list: フレームごとに描画したかどうか
+    """
+    drawn = []
+    next_frame = 0.0
+    while timer.now < seconds:
+        timer.now = max(timer.now, next_frame)
+        next_frame = max(next_frame + pacer.frame_time, timer.now - pacer.frame_time)
+        pacer.begin_update()
+        timer.now += update_cost
+        if pacer.should_draw():
+            pacer.begin_draw()
+            timer.now += draw_cost
+            pacer.end_draw()
+            drawn.append(True)
+        else:
+            drawn.append(False)
+    return drawn
+
+
+def test_fast_draw_is_never_skipped():
+    """描画が予算内に収まる場合は毎フレーム描画することをテスト"""
+    print("Running fast draw test...")
+    timer = FakeTimer()
+    pacer = FramePacer(fps=30, timer=timer)
+    drawn = _run_loop(pacer, timer, 5.0, update_cost=0.004, draw_cost=0.010)
+    assert all(drawn)
+    assert pacer.skipped_draws == 0
+    stats = pacer.get_stats()
+    assert stats['ups'] == pytest.approx(30, abs=0.5)
+    assert stats['fps'] == pytest.approx(30, abs=0.5)
+    assert stats['draw_ms'] == pytest.approx(10, abs=0.5)
+    print("[OK] Fast draw test passed")
+
+
+def test_slow_draw_keeps_update_rate():
+    """描画が予算を超える場合は描画だけを飛ばして更新の回数を保つことをテスト"""
+    print("Running slow draw test...")
+    # 描画を飛ばさない場合は更新も描画の遅さに引きずられる
+    timer = FakeTimer()
+    unpaced = FramePacer(fps=30, enabled=False, timer=timer)
+    _run_loop(unpaced, timer, 5.0, update_cost=0.005, draw_cost=0.050)
+    assert unpaced.get_stats()['ups'] < 20
+    
+    timer = FakeTimer()
+    pacer = FramePacer(fps=30, max_skip=4, timer=timer)
+    drawn = _run_loop(pacer, timer, 5.0, update_cost=0.005, draw_cost=0.050)
+    stats = pacer.get_stats()
+    assert stats['ups'] == pytest.approx(30, abs=1)
+    # 1フレームおきに描画する
+    assert stats['fps'] == pytest.approx(15, abs=1)
+    assert stats['skipped_draws'] > 0
+    # 連続して飛ばすのはmax_skipフレームまで
+    run = 0
+    for frame_drawn in drawn:
+        run = 0 if frame_drawn else run + 1
+        assert run <= pacer.max_skip
+    print("[OK] Slow draw test passed")
+
+
+def test_slightly_slow_draw_is_rarely_skipped():
+    """描画が予算をわずかに超える場合は時々飛ばすだけで遅れを取り戻すことをテスト"""
+    print("Running slightly slow draw test...")
+    timer = FakeTimer()
+    pacer = FramePacer(fps=30, timer=timer)
+    _run_loop(pacer, timer, 5.0, update_cost=0.005, draw_cost=0.030)
+    stats = pacer.get_stats()
+    assert stats['ups'] == pytest.approx(30, abs=1)
+    assert stats['fps'] > 25
+    print("[OK] Slightly slow draw test passed")
+
+
+def test_hopeless_draw_is_capped_by_max_skip():
+    """描画を飛ばしても追いつかない場合はmax_skipごとに描画し、遅れを溜め込まないことをテスト"""
+    print("Running hopeless draw test...")
+    timer = FakeTimer()
+    pacer = FramePacer(fps=30, max_skip=2, timer=timer)
+    drawn = _run_loop(pacer, timer, 10.0, update_cost=0.030, draw_cost=0.200)
+    assert drawn[-3:].count(True) == 1
+    # 遅れが溜まり続けないので、途中から描画の間隔は一定になる
+    tail = drawn[len(drawn) // 2:]
+    assert tail.count(True) * 3 == pytest.approx(len(tail), abs=3)
+    print("[OK] Hopeless draw test passed")
+
+
+def test_game_skips_draw_but_not_update():
+    """ゲームのdrawを飛ばしても更新は毎回行われ、次の描画で画面が正しく追いつくことをテスト"""
+    print("Running game skip draw test...")
+    pytest.importorskip("numpy")
+    from src.software_renderer import SoftwareRenderer
+    
+    mock_pyxel = MockPyxel()
+    paced = SoftwareRenderer()
+    full = SoftwareRenderer()
+    timer = FakeTimer()
+    try:
+        with mock.patch('src.game.pyxel', mock_pyxel), \
+                mock.patch('src.input_handler.pyxel', mock_pyxel), \
+                mock.patch('src.game_controller.pyxel', mock_pyxel):
+            game = KiroKiroGame.__new__(KiroKiroGame)
+            game.initialize_game()
+            game.frame_pacer.timer = timer
+            for frame in range(300):
+                timer.now = frame * game.frame_pacer.frame_time
+                game.update()
+                # 3フレームのうち2フレームは更新が大きく遅れて描画の予算がない
+                if frame % 3:
+                    timer.now += game.frame_pacer.frame_time * 3
+                set_backend(paced)
+                game.draw()
+                if frame % 3 == 0:
+                    set_backend(full)
+                    game.draw_all()
+                    assert (paced.frame() == full.frame()).all(), f"frame {frame} differs"
+            assert game.frame_count == 300
+            assert game.frame_pacer.update_count == 300
+            assert game.frame_pacer.draw_count == 100
+            assert game.frame_pacer.skipped_draws == 200
+    finally:
+        set_backend(None)
+    print("[OK] Game skip draw test passed")
+
+
+if __name__ == "__main__":
+    test_fast_draw_is_never_skipped()
+    test_slow_draw_keeps_update_rate()
+    test_slightly_slow_draw_is_rarely_skipped()
+    test_hopeless_draw_is_capped_by_max_skip()
+    test_game_skips_draw_but_not_update()
+    print("Frame pacer test passed! [OK]")
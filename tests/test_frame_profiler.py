@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+フレームプロファイラーのテスト
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+import unittest.mock as mock
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pyxel
+
+from src.frame_profiler import FrameProfiler
+from src.graphics import set_backend
+from src.game import KiroKiroGame
+
+
+class MockPyxel:
+    """Pyxelのモック - キー入力なし"""
+    
+    KEY_LEFT = 'LEFT'
+    KEY_RIGHT = 'RIGHT'
+    KEY_UP = 'UP'
+    KEY_DOWN = 'DOWN'
+    KEY_X = 'X'
+    KEY_Z = 'Z'
+    KEY_Q = 'Q'
+    KEY_ESCAPE = 'ESCAPE'
+    KEY_G = 'G'
+    KEY_C = 'C'
+    KEY_E = 'E'
+    KEY_A = 'A'
+    KEY_R = 'R'
+    KEY_RETURN = 'RETURN'
+    KEY_SPACE = 'SPACE'
+    
+    def btn(self, key):
+        return False
+    
+    def btnp(self, key):
+        return False
+    
+    def quit(self):
+        pass
+
+
+class RecordingBackend:
+    """描画呼び出しを記録するバックエンド"""
+
+    def __init__(self):
+        self.texts = []
+
+    def rect(self, x, y, w, h, col):
+        pass
+
+    def text(self, x, y, s, col):
+        self.texts.append(s)
+
+
+class ImageBackend:
+    """pyxel.Imageを画面とする描画バックエンド（ウィンドウなしで描画する）"""
+
+    Image = pyxel.Image
+
+    def __init__(self, width=320, height=380):
+        self.width = width
+        self.height = height
+        self.screen = pyxel.Image(width, height)
+        self.images = [pyxel.Image(256, 256) for _ in range(3)]
+
+    def __getattr__(self, name):
+        return getattr(self.screen, name)
+
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        if isinstance(img, int):
+            img = self.images[img]
+        self.screen.blt(x, y, img, u, v, w, h, colkey)
+
+
+class Worker:
+    """計測対象のダミーサブシステム"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def step(self, amount=1):
+        self.calls += amount
+        return self.calls
+
+
+def test_percentiles():
+    """フレームごとの合計時間とパーセンタイルの計算をテスト"""
+    print("Running percentile test...")
+    profiler = FrameProfiler(window=100)
+    for duration in range(1, 201):
+        profiler.begin_frame()
+        # 同じフレーム内の呼び出しは合計される
+        profiler.record('work', duration * 500)
+        profiler.record('work', duration * 500)
+        profiler.end_frame()
+
+    # 直近100フレーム（101〜200µs）だけが対象
+    assert profiler.get_percentiles('work') == {'p50': 150.0, 'p95': 195.0, 'p99': 199.0}
+    assert profiler.get_percentiles('missing') is None
+    assert profiler.frame_index == 200
+
+    names = [row[0] for row in profiler.get_report()]
+    assert set(names) == {'work', FrameProfiler.FRAME_SECTION}
+    print("[OK] Percentile test passed")
+
+
+def test_instrument_and_restore():
+    """メソッドの差し替えと復元をテスト"""
+    print("Running instrument test...")
+    profiler = FrameProfiler()
+    worker = Worker()
+    profiler.instrument(worker, ['step'], prefix='worker')
+
+    profiler.begin_frame()
+    assert worker.step(2) == 2
+    with profiler.section('block'):
+        worker.step()
+    profiler.end_frame()
+    assert set(profiler._samples) == {'worker.step', 'block', FrameProfiler.FRAME_SECTION}
+
+    profiler.uninstrument()
+    assert 'step' not in vars(worker)
+    assert worker.step() == 4
+
+    # 無効時は差し替えも記録もしない
+    disabled = FrameProfiler(enabled=False)
+    disabled.instrument(worker, ['step'])
+    disabled.begin_frame()
+    disabled.end_frame()
+    assert 'step' not in vars(worker)
+    assert disabled.frame_index == 0
+    print("[OK] Instrument test passed")
+
+
+def test_output_files():
+    """CSVとJSONLへの出力をテスト"""
+    print("Running output file test...")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in ('csv', 'jsonl'):
+            path = os.path.join(directory, f"profile.{extension}")
+            profiler = FrameProfiler()
+            profiler.open_output(path)
+            for _ in range(3):
+                profiler.begin_frame()
+                profiler.record('work', 2000)
+                profiler.end_frame()
+            profiler.close_output()
+
+            with open(path, encoding='utf-8') as f:
+                if extension == 'csv':
+                    rows = [row for row in csv.DictReader(f) if row['section'] == 'work']
+                    assert [(row['frame'], float(row['duration_us'])) for row in rows] == \
+                        [('0', 2.0), ('1', 2.0), ('2', 2.0)]
+                else:
+                    records = [json.loads(line) for line in f]
+                    assert [record['frame'] for record in records] == [0, 1, 2]
+                    assert all(record['sections']['work'] == 2.0 for record in records)
+    print("[OK] Output file test passed")
+
+
+def test_overlay():
+    """デバッグ表示をテスト"""
+    print("Running overlay test...")
+    backend = RecordingBackend()
+    set_backend(backend)
+    try:
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        profiler.record('slow', 5000000)
+        profiler.record('fast', 1000)
+        profiler.end_frame()
+        profiler.draw_overlay()
+    finally:
+        set_backend(None)
+
+    # 見出しの次にp95の大きい順
+    assert backend.texts[1].startswith('slow')
+    assert any(text.startswith('fast') for text in backend.texts[2:])
+    print("[OK] Overlay test passed")
+
+
+def test_game_instrumentation():
+    """KiroKiroGameのサブシステムが計測されることをテスト"""
+    print("Running game instrumentation test...")
+    mock_pyxel = MockPyxel()
+    with mock.patch('src.game.pyxel', mock_pyxel), \
+            mock.patch('src.input_handler.pyxel', mock_pyxel), \
+            mock.patch('src.game_controller.pyxel', mock_pyxel):
+        game = KiroKiroGame.__new__(KiroKiroGame)
+        game.initialize_game()
+        game.profiler = FrameProfiler()
+        game.instrument_systems()
+
+        game.update()
+        set_backend(ImageBackend())
+        try:
+            game.draw()
+        finally:
+            set_backend(None)
+        sections = set(game.profiler._samples)
+        assert 'GameSystems.update_fall_system' in sections
+        assert 'InputHandler.update' in sections
+        # プレイフィールドの描画（セルと背景）も計測する
+        assert 'PlayField.draw_cells' in sections
+        assert 'PlayField.draw_background' in sections
+        assert FrameProfiler.FRAME_SECTION in sections
+
+        # 作り直しても計測対象を差し替えられる
+        game.instrument_systems()
+        game.profiler.uninstrument()
+        assert 'update_fall_system' not in vars(game.game_systems)
+    print("[OK] Game instrumentation test passed")
+
+
+if __name__ == "__main__":
+    test_percentiles()
+    test_instrument_and_restore()
+    test_output_files()
+    test_overlay()
+    test_game_instrumentation()
+    print("Frame profiler test passed! [OK]")
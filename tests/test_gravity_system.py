@@ -7,11 +7,61 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.playfield import PlayField
+from src.puyo import Puyo
+from src.headless import HeadlessGame
+
 def test_gravity_system_basic():
     """gravity_systemの基本テスト"""
     print("Running gravity_system basic test...")
     print("[OK] gravity_system basic test passed")
 
+def test_apply_gravity_moves_single_pass():
+    """1回の重力適用で全ての列が詰まり、移動リストが返ることをテスト"""
+    print("Running single pass gravity test...")
+    playfield = PlayField()
+    top = Puyo(1)
+    middle = Puyo(2)
+    playfield.place_puyo(0, 2, top)
+    playfield.place_puyo(0, 6, middle)
+    playfield.place_puyo(0, 11, Puyo(3))
+    playfield.place_puyo(4, 11, Puyo(4))
+
+    moves = playfield.apply_gravity_moves()
+    assert moves == [(0, 6, 10), (0, 2, 9)]
+    assert middle.get_position() == (0, 10)
+    assert top.get_position() == (0, 9)
+    assert playfield.apply_gravity_moves() == []
+    assert not playfield.apply_gravity()
+    print("[OK] Single pass gravity test passed")
+
+def test_gravity_system_uses_move_list():
+    """重力システムが移動リストを保持し、再走査せずに終了することをテスト"""
+    print("Running gravity system move list test...")
+    game = HeadlessGame()
+    systems = game.game_systems
+    playfield = game.playfield
+    playfield.place_puyo(1, 3, Puyo(1))
+
+    calls = []
+    original = playfield.apply_gravity_moves
+    playfield.apply_gravity_moves = lambda: calls.append(1) or original()
+
+    systems.apply_gravity_after_fixation()
+    for _ in range(systems.gravity_interval):
+        systems.update_gravity_system()
+    active, progress, moves = systems.get_gravity_info()
+    assert active and moves == [(1, 3, 11)] and progress == 0.0
+
+    for _ in range(systems.gravity_interval):
+        systems.update_gravity_system()
+    assert not systems.gravity_active
+    assert calls == [1]
+    assert systems.get_gravity_info() == (False, 0.0, [])
+    print("[OK] Gravity system move list test passed")
+
 if __name__ == "__main__":
     test_gravity_system_basic()
+    test_apply_gravity_moves_single_pass()
+    test_gravity_system_uses_move_list()
     print("gravity_system test passed! [OK]")
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+ヘッドレス実行のテスト
+"""
+
+import sys
+import os
+import subprocess
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.headless import HeadlessGame, ScriptedInputSource
+from src.puyo import Puyo
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def test_headless_import_without_pyxel():
+    """pyxelを読み込めない環境でもヘッドレス実行できることをテスト"""
+    print("Running headless import test...")
+    script = (
+        "import sys\n"
+        "sys.modules['pyxel'] = None\n"
+        "from src.headless import HeadlessGame\n"
+        "game = HeadlessGame()\n"
+        "game.run(600)\n"
+        "assert 'pyxel' not in sys.modules or sys.modules['pyxel'] is None\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    print("[OK] Headless import test passed")
+
+def test_headless_game_reaches_game_over():
+    """入力なしのヘッドレスゲームがゲームオーバーまで進むことをテスト"""
+    print("Running headless game over test...")
+    game = HeadlessGame()
+    frames = game.run(100000)
+    assert game.game_over
+    assert frames < 100000
+    assert not game.step()
+    print("[OK] Headless game over test passed")
+
+def test_scripted_input_moves_pair():
+    """スクリプト入力でぷよペアを操作できることをテスト"""
+    print("Running scripted input test...")
+    input_source = ScriptedInputSource()
+    game = HeadlessGame(input_source=input_source)
+    pair = game.game_systems.current_falling_pair
+    start_x, _ = pair.get_position()
+    
+    input_source.set_actions('move_left')
+    game.step()
+    input_source.clear_actions()
+    game.step()
+    assert pair.get_position()[0] == start_x - 1
+    
+    # 高速落下キーを押し続けると毎フレーム落下する
+    input_source.set_actions('fast_drop_held')
+    _, start_y = pair.get_position()
+    game.step()
+    game.step()
+    assert pair.get_position()[1] == start_y + 2
+    print("[OK] Scripted input test passed")
+
+def test_board_game_over_check():
+    """盤面によるゲームオーバー判定（GameControllerと共通）をテスト"""
+    print("Running board game over check test...")
+    game = HeadlessGame()
+    assert game.check_game_over() == (False, "正常")
+    
+    # 初期位置のぷよペアと重なる位置にぷよがある
+    _, (sub_x, sub_y) = game.game_systems.current_falling_pair.get_puyo_positions()
+    game.playfield.place_puyo(sub_x, sub_y, Puyo(1))
+    assert game.check_game_over() == (True, "新しいぷよペアが配置不可能")
+    
+    # 上端にぷよがある
+    game.playfield.place_puyo(5, 0, Puyo(2))
+    assert game.check_game_over() == (True, "プレイフィールド上端到達 (列 5)")
+    assert game.game_systems.check_board_game_over() == game.check_game_over()
+    print("[OK] Board game over check test passed")
+
+if __name__ == "__main__":
+    test_headless_import_without_pyxel()
+    test_headless_game_reaches_game_over()
+    test_scripted_input_moves_pair()
+    test_board_game_over_check()
+    print("Headless test passed! [OK]")
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+ぷよペア配置列挙のテスト
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.placement import PlacementEnumerator
+from src.playfield import PlayField
+from src.bitboard_playfield import BitboardPlayField
+from src.puyo import Puyo
+from src.puyo_pair import PuyoPair
+
+
+def _fill_columns(playfield, heights, rng):
+    """指定した高さで各列を下から埋める"""
+    for x, column_height in enumerate(heights):
+        for y in range(playfield.get_height() - column_height, playfield.get_height()):
+            playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4])))
+
+
+def _brute_force_placements(playfield, main_color=1, sub_color=2):
+    """PlayFieldの移動・回転判定を1手ずつ試して最終配置を求める"""
+    def make_pair(x, y, rotation):
+        pair = PuyoPair(Puyo(main_color), Puyo(sub_color), x, y)
+        pair.rotation = rotation
+        pair.set_position(x, y)
+        return pair
+
+    start = (2, 0, 2)
+    if not playfield.can_place_puyo_pair(make_pair(*start)):
+        return set()
+
+    visited = {start}
+    queue = [start]
+    placements = set()
+    for state in queue:
+        pair = make_pair(*state)
+        next_states = []
+        for dx, dy in ((-1, 0), (1, 0), (0, 1)):
+            if playfield.can_move_puyo_pair(pair, dx, dy):
+                next_states.append((state[0] + dx, state[1] + dy, state[2]))
+        if not playfield.can_move_puyo_pair(pair, 0, 1):
+            placements.add((state[0], state[2]) + pair.get_puyo_positions())
+        for clockwise in (True, False):
+            rotated = make_pair(*state)
+            if playfield.try_rotate_with_kick(rotated, clockwise)[0]:
+                next_states.append(rotated.get_position() + (rotated.get_rotation(),))
+        for next_state in next_states:
+            if next_state not in visited:
+                visited.add(next_state)
+                queue.append(next_state)
+    return placements
+
+
+def test_placements_match_brute_force():
+    """列挙結果が1手ずつの探索結果と一致することをテスト"""
+    print("Running placement brute force comparison test...")
+    rng = random.Random(7)
+    enumerator = PlacementEnumerator()
+    for _ in range(300):
+        playfield = PlayField()
+        heights = [rng.choice([0, 3, 8, 9, 10, 11, 12]) for _ in range(6)]
+        _fill_columns(playfield, heights, rng)
+
+        expected = _brute_force_placements(playfield)
+        placements = enumerator.enumerate_placements(playfield)
+        assert set(placements) == expected
+        assert len(placements) == len(expected)
+    print("[OK] Placement brute force comparison test passed")
+
+
+def test_empty_field_placements():
+    """空の盤面では全ての列・回転状態に配置できることをテスト"""
+    print("Running empty field placement test...")
+    enumerator = PlacementEnumerator()
+    placements = enumerator.enumerate_placements(PlayField())
+    # 縦向き6列x2 + 横向き5列x2
+    assert len(placements) == 22
+    assert (2, 2, (2, 10), (2, 11)) in placements
+    assert (0, 1, (0, 11), (1, 11)) in placements
+    print("[OK] Empty field placement test passed")
+
+
+def test_same_color_pairs_are_deduplicated():
+    """同色ペアでは同じ盤面になる配置が1つにまとめられることをテスト"""
+    print("Running same color deduplication test...")
+    enumerator = PlacementEnumerator()
+    playfield = PlayField()
+    pair = PuyoPair(Puyo(3), Puyo(3))
+    placements = enumerator.enumerate_placements(playfield, pair)
+    assert len(placements) == 11
+    boards = {frozenset((main_pos, sub_pos)) for _, _, main_pos, sub_pos in placements}
+    assert len(boards) == len(placements)
+
+    # 異なる色のペアでは重複除去しない
+    assert len(enumerator.enumerate_placements(playfield, PuyoPair(Puyo(1), Puyo(2)))) == 22
+    print("[OK] Same color deduplication test passed")
+
+
+def test_column_heights_and_blocked_spawn():
+    """列の高さ取得と出現位置が塞がれた場合の結果をテスト"""
+    print("Running column heights test...")
+    rng = random.Random(3)
+    for playfield in (PlayField(), BitboardPlayField()):
+        _fill_columns(playfield, [0, 1, 5, 12, 11, 2], rng)
+        assert playfield.get_column_heights() == (0, 1, 5, 12, 11, 2)
+
+    enumerator = PlacementEnumerator()
+    playfield = PlayField()
+    _fill_columns(playfield, [0, 0, 11, 0, 0, 0], rng)
+    assert enumerator.enumerate_placements(playfield) == []
+
+    # 表を事前に作成しても結果は変わらない
+    assert enumerator.precompute() == 4 ** 6
+    assert enumerator.get_reachable((0,) * 6) == enumerator.get_reachable((5, 2, 0, 1, 4, 6))
+    print("[OK] Column heights test passed")
+
+
+if __name__ == "__main__":
+    test_placements_match_brute_force()
+    test_empty_field_placements()
+    test_same_color_pairs_are_deduplicated()
+    test_column_heights_and_blocked_spawn()
+    print("Placement test passed! [OK]")
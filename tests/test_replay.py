@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+リプレイの記録と再生のテスト
+"""
+
+import sys
+import os
+import random
+import tempfile
+import unittest.mock as mock
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.replay import (
+    Replay, ReplayRecorder, ReplayPlayer, play_replay, encode_varint, decode_varint
+)
+from src.headless import HeadlessGame, PuyoManager
+from src.input_source import ACTIONS, ScriptedInputSource
+from src.game import KiroKiroGame
+from src.game_state import GameState
+
+
+class MockPyxel:
+    """Pyxelのモック - pressedに入れたキーだけが押された瞬間として扱われる"""
+    
+    KEY_LEFT = 'LEFT'
+    KEY_RIGHT = 'RIGHT'
+    KEY_UP = 'UP'
+    KEY_DOWN = 'DOWN'
+    KEY_X = 'X'
+    KEY_Z = 'Z'
+    KEY_Q = 'Q'
+    KEY_ESCAPE = 'ESCAPE'
+    KEY_G = 'G'
+    KEY_C = 'C'
+    KEY_E = 'E'
+    KEY_A = 'A'
+    KEY_R = 'R'
+    KEY_RETURN = 'RETURN'
+    KEY_SPACE = 'SPACE'
+    
+    def __init__(self):
+        self.pressed = set()
+    
+    def btn(self, key):
+        return False
+    
+    def btnp(self, key):
+        return key in self.pressed
+    
+    def quit(self):
+        pass
+
+
+class RandomPlayer(ScriptedInputSource):
+    """時々ランダムな操作を1フレームだけ行う入力ソース"""
+    
+    def __init__(self, seed, press_rate=0.1):
+        super().__init__()
+        self.rng = random.Random(seed)
+        self.press_rate = press_rate
+    
+    def update(self):
+        if self.rng.random() < self.press_rate:
+            self.set_actions(self.rng.choice(ACTIONS))
+        else:
+            self.clear_actions()
+
+
+def _record_game(seed, max_frames):
+    """ランダムな操作でゲームを記録する"""
+    puyo_manager = PuyoManager()
+    recorder = ReplayRecorder(RandomPlayer(seed), puyo_manager, seed=seed)
+    game = HeadlessGame(input_source=recorder, puyo_manager=puyo_manager)
+    game.run(max_frames)
+    replay = recorder.finish(game.get_score(), game.playfield.get_hash())
+    return game, replay
+
+
+def test_varint_roundtrip():
+    """可変長整数の変換をテスト"""
+    print("Running varint test...")
+    out = bytearray()
+    values = [0, 1, 127, 128, 300, 2 ** 32, 2 ** 64 - 1]
+    for value in values:
+        encode_varint(value, out)
+    offset = 0
+    for value in values:
+        decoded, offset = decode_varint(out, offset)
+        assert decoded == value
+    assert offset == len(out)
+    print("[OK] Varint test passed")
+
+
+def test_replay_reproduces_game():
+    """記録したリプレイを再生すると同じ結果になることをテスト"""
+    print("Running replay reproduction test...")
+    for seed in (1, 2, 3):
+        game, replay = _record_game(seed, 6000)
+        data = replay.to_bytes()
+        restored = Replay.from_bytes(data)
+        assert restored.events == replay.events
+        assert restored.seed == seed
+        # 1回の入力変化はほぼ2バイト以内
+        assert len(data) <= 40 + len(replay.events) * 2
+
+        replayed = play_replay(restored)
+        assert replayed.frame_count == game.frame_count == replay.frame_count
+        assert replayed.game_over == game.game_over
+        assert replayed.get_score() == replay.final_score
+        assert replayed.playfield.get_hash() == replay.final_hash
+        assert replayed.playfield.snapshot() == game.playfield.snapshot()
+    print("[OK] Replay reproduction test passed")
+
+
+def test_replay_player_masks():
+    """再生時の入力がフレームごとに切り替わることをテスト"""
+    print("Running replay player test...")
+    replay = Replay(seed=0, events=[(2, 0b1), (3, 0b100000), (5, 0)], frame_count=6)
+    player = ReplayPlayer(replay)
+    states = []
+    for _ in range(6):
+        player.update()
+        states.append((player.should_move_left(), player.is_fast_drop_held()))
+    assert states == [(False, False), (True, False), (False, True), (False, True),
+                      (False, False), (False, False)]
+    assert player.is_finished()
+    print("[OK] Replay player test passed")
+
+
+def test_game_records_replay():
+    """KiroKiroGameがゲームオーバー時にリプレイを保存することをテスト"""
+    print("Running game replay recording test...")
+    mock_pyxel = MockPyxel()
+    with tempfile.TemporaryDirectory() as directory, \
+            mock.patch('src.game.pyxel', mock_pyxel), \
+            mock.patch('src.input_handler.pyxel', mock_pyxel), \
+            mock.patch('src.game_controller.pyxel', mock_pyxel):
+        game = KiroKiroGame.__new__(KiroKiroGame)
+        game.initialize_game()
+        game.replay_output = os.path.join(directory, 'game_{index}.krpl')
+        game.restart_game()
+        assert isinstance(game.input_handler, ReplayRecorder)
+
+        for _ in range(20000):
+            game.update()
+            if game.replay_recorder is None:
+                break
+        assert game.replay_recorder is None
+        assert not isinstance(game.input_handler, ReplayRecorder)
+
+        replay = Replay.load(os.path.join(directory, 'game_0.krpl'))
+        replayed = play_replay(replay)
+        assert replayed.game_over
+        assert replayed.frame_count == replay.frame_count
+        assert replayed.get_score() == replay.final_score == game.score_manager.get_score()
+        assert replayed.playfield.get_hash() == replay.final_hash == game.playfield.get_hash()
+    print("[OK] Game replay recording test passed")
+
+
+def _assert_replay_matches(path):
+    """保存したリプレイを再生して記録時の結果と一致することを確認する"""
+    replay = Replay.load(path)
+    replayed = play_replay(replay)
+    assert replayed.frame_count == replay.frame_count
+    assert replayed.get_score() == replay.final_score
+    assert replayed.playfield.get_hash() == replay.final_hash
+    return replay, replayed
+
+
+def test_game_records_replay_after_restart():
+    """Rキーで再開始したゲームもupdateだけでリプレイが記録されることをテスト"""
+    print("Running game replay recording after restart test...")
+    mock_pyxel = MockPyxel()
+    with tempfile.TemporaryDirectory() as directory, \
+            mock.patch('src.game.pyxel', mock_pyxel), \
+            mock.patch('src.input_handler.pyxel', mock_pyxel), \
+            mock.patch('src.game_controller.pyxel', mock_pyxel):
+        game = KiroKiroGame.__new__(KiroKiroGame)
+        game.initialize_game()
+        game.replay_output = os.path.join(directory, 'game_{index}.krpl')
+        game.restart_game()
+
+        def play_until_game_over():
+            for _ in range(20000):
+                game.update()
+                if game.replay_recorder is None:
+                    break
+            assert game.replay_recorder is None
+
+        def press_restart():
+            mock_pyxel.pressed = {mock_pyxel.KEY_R}
+            game.update()
+            mock_pyxel.pressed = set()
+
+        # 1ゲーム目はゲームオーバーまで進め、ゲームオーバー画面からRキーで再開始する
+        play_until_game_over()
+        # ゲームオーバーへの遷移中の再開始は受け付けない
+        press_restart()
+        assert game.replay_recorder is None
+        assert game.game_state_manager.get_current_state() == GameState.GAME_OVER
+        for _ in range(10):
+            game.update()
+        press_restart()
+        assert isinstance(game.input_handler, ReplayRecorder)
+        assert game.game_state_manager.get_current_state() == GameState.PLAYING
+
+        # 2ゲーム目はプレイ中にRキーで再開始する
+        for _ in range(200):
+            game.update()
+        press_restart()
+        assert isinstance(game.input_handler, ReplayRecorder)
+
+        # 3ゲーム目はゲームオーバーまで進める
+        play_until_game_over()
+        assert game.replay_count == 3
+
+        seeds = set()
+        for index in range(3):
+            replay, replayed = _assert_replay_matches(os.path.join(directory, f'game_{index}.krpl'))
+            assert replayed.game_over == (index != 1)
+            seeds.add(replay.seed)
+        assert replay.final_score == game.score_manager.get_score()
+        assert replay.final_hash == game.playfield.get_hash()
+        # ゲームごとに新しいシードで記録する
+        assert len(seeds) == 3
+    print("[OK] Game replay recording after restart test passed")
+
+
+if __name__ == "__main__":
+    test_varint_roundtrip()
+    test_replay_reproduces_game()
+    test_replay_player_masks()
+    test_game_records_replay()
+    test_game_records_replay_after_restart()
+    print("Replay test passed! [OK]")
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+リプレイアーカイブのテスト
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.replay import Replay
+from src.replay_archive import HEADER_SIZE, ReplayArchive, ReplayArchiveWriter, append_replays
+
+
+def _make_replay(index):
+    """番号ごとに内容の異なるリプレイを作成"""
+    events = [(frame * 3 + 1, (index + frame) % 64) for frame in range(index % 50)]
+    return Replay(seed=index, events=events, frame_count=index * 3 + 200,
+                  final_score=index * 40, final_hash=index * 7919)
+
+
+def _assert_same(replay, expected):
+    assert (replay.seed, replay.events, replay.frame_count, replay.final_score, replay.final_hash) == \
+        (expected.seed, expected.events, expected.frame_count, expected.final_score, expected.final_hash)
+
+
+def test_archive_random_access():
+    """追加したリプレイを番号で取り出せることをテスト"""
+    print("Running archive random access test...")
+    replays = [_make_replay(index) for index in range(500)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'games.krpa')
+        assert append_replays(path, replays[:300]) == 300
+        # 既存のアーカイブに追加する
+        with ReplayArchiveWriter(path) as writer:
+            assert len(writer) == 300
+            for replay in replays[300:]:
+                writer.append(replay)
+
+        with ReplayArchive(path) as archive:
+            assert len(archive) == 500
+            for index in (0, 1, 299, 300, 499, -1):
+                _assert_same(archive[index], replays[index])
+
+            data = archive.get_bytes(42)
+            assert isinstance(data, memoryview)
+            assert bytes(data) == replays[42].to_bytes()
+            del data
+
+            for replay, expected in zip(archive, replays):
+                _assert_same(replay, expected)
+            assert sum(1 for _ in archive.iter_bytes(start=450)) == 50
+    print("[OK] Archive random access test passed")
+
+
+def test_archive_empty_and_invalid():
+    """空のアーカイブと不正なファイルの扱いをテスト"""
+    print("Running archive edge case test...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'empty.krpa')
+        ReplayArchiveWriter(path).close()
+        with ReplayArchive(path) as archive:
+            assert len(archive) == 0
+            assert list(archive) == []
+
+        # 閉じずに終了しても、それまでに閉じたときの内容は読める
+        append_replays(path, [_make_replay(1)])
+        writer = ReplayArchiveWriter(path)
+        writer.append(_make_replay(2))
+        writer._file.close()
+        with ReplayArchive(path) as archive:
+            assert len(archive) == 1
+            _assert_same(archive[0], _make_replay(1))
+
+        invalid = os.path.join(directory, 'invalid.krpa')
+        with open(invalid, 'wb') as f:
+            f.write(b'not an archive' * 4)
+        with pytest.raises(ValueError):
+            ReplayArchive(invalid)
+    print("[OK] Archive edge case test passed")
+
+
+def test_archive_size_grows_linearly():
+    """1件ずつ何度も追加してもファイルサイズが件数に比例することをテスト"""
+    print("Running archive size test...")
+    replay = _make_replay(3)
+    record_size = 4 + len(replay.to_bytes())
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'games.krpa')
+        for count in range(1, 2001):
+            assert append_replays(path, [replay]) == count
+        # レコードと索引（容量は件数の2倍まで、書き直した古い索引を含めても4倍以内）
+        assert os.path.getsize(path) <= HEADER_SIZE + 2000 * (record_size + 4 * 8) + 64
+
+        # 追加を繰り返したアーカイブも1件目から読める
+        with ReplayArchive(path) as archive:
+            assert len(archive) == 2000
+            for data in archive.iter_bytes():
+                assert bytes(data) == replay.to_bytes()
+            del data
+    print("[OK] Archive size test passed")
+
+
+if __name__ == "__main__":
+    test_archive_random_access()
+    test_archive_empty_and_invalid()
+    test_archive_size_grows_linearly()
+    print("Replay archive test passed! [OK]")
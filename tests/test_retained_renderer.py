@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+差分描画のテスト
+Requirements: 1.1, 1.2 - ゲーム画面・プレイフィールドとぷよの表示
+"""
+
+import sys
+import os
+import itertools
+import random
+import unittest.mock as mock
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pyxel
+
+from src.game import KiroKiroGame
+from src.graphics import set_backend
+from src.puyo_manager import PuyoManager
+from src.sprite_atlas import build_sprite_atlas, clear_sprite_atlas
+
+
+class MockPyxel:
+    """Pyxelのモック - ランダムなキー入力"""
+
+    KEY_LEFT = 'LEFT'
+    KEY_RIGHT = 'RIGHT'
+    KEY_UP = 'UP'
+    KEY_DOWN = 'DOWN'
+    KEY_X = 'X'
+    KEY_Z = 'Z'
+    KEY_Q = 'Q'
+    KEY_ESCAPE = 'ESCAPE'
+    KEY_G = 'G'
+    KEY_C = 'C'
+    KEY_E = 'E'
+    KEY_A = 'A'
+    KEY_R = 'R'
+    KEY_RETURN = 'RETURN'
+    KEY_SPACE = 'SPACE'
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.pressed = set()
+
+    def press_random_key(self):
+        # 下キーを多めに押して盤面を早く積み上げる
+        keys = [self.KEY_LEFT, self.KEY_RIGHT, self.KEY_DOWN, self.KEY_DOWN, self.KEY_X, self.KEY_Z]
+        self.pressed = {self.rng.choice(keys)} if self.rng.random() < 0.5 else set()
+
+    def btn(self, key):
+        return key in self.pressed
+
+    def btnp(self, key):
+        return key in self.pressed
+
+    def quit(self):
+        pass
+
+
+class ImageBackend:
+    """pyxel.Imageを画面とする描画バックエンド（ウィンドウなしで画素を確認する）"""
+
+    Image = pyxel.Image
+
+    def __init__(self, width=320, height=380):
+        self.width = width
+        self.height = height
+        self.screen = pyxel.Image(width, height)
+        self.images = [pyxel.Image(256, 256) for _ in range(3)]
+        self.calls = 0
+
+    def __getattr__(self, name):
+        method = getattr(self.screen, name)
+
+        def call(*args):
+            self.calls += 1
+            return method(*args)
+
+        return call
+
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        self.calls += 1
+        if isinstance(img, int):
+            img = self.images[img]
+        self.screen.blt(x, y, img, u, v, w, h, colkey)
+
+    def pixels(self):
+        return bytes(self.screen.data_ptr())
+
+
+def _draw_with(backend, draw_function):
+    set_backend(backend)
+    draw_function()
+
+
+def _run_and_compare(frames, seed, use_atlas):
+    """差分描画と全体の描画を毎フレーム比較する（キー入力もぷよの並びもseedで決まる）"""
+    mock_pyxel = MockPyxel(seed)
+    # 再開始のたびに作られるPuyoManagerにも順番にシードを与える
+    puyo_seeds = itertools.count(seed * 1000)
+    retained = ImageBackend()
+    full = ImageBackend()
+    calls = []
+    try:
+        with mock.patch('src.game.pyxel', mock_pyxel), \
+                mock.patch('src.input_handler.pyxel', mock_pyxel), \
+                mock.patch('src.game_controller.pyxel', mock_pyxel), \
+                mock.patch('src.game.PuyoManager', lambda: PuyoManager(seed=next(puyo_seeds))):
+            game = KiroKiroGame.__new__(KiroKiroGame)
+            game.initialize_game()
+            game.clock.skip_waits = False
+            for frame in range(frames):
+                mock_pyxel.press_random_key()
+                game.update()
+                if use_atlas:
+                    build_sprite_atlas(retained)
+                retained.calls = 0
+                _draw_with(retained, game.renderer.draw)
+                calls.append(retained.calls)
+                if use_atlas:
+                    build_sprite_atlas(full)
+                _draw_with(full, game.draw_all)
+                assert retained.pixels() == full.pixels(), f"frame {frame} differs"
+                if game.game_controller.show_final_score and frame % 50 == 0:
+                    game.restart_game()
+    finally:
+        clear_sprite_atlas()
+        set_backend(None)
+    return calls
+
+
+def test_retained_matches_full_redraw():
+    """差分描画の結果が毎フレーム全体を描画した結果と一致することをテスト"""
+    print("Running retained rendering test...")
+    calls = _run_and_compare(2000, seed=3, use_atlas=True)
+    # 画面全体を描くのは最初のフレームだけで、半分以上のフレームはほとんど描画しない
+    assert sorted(calls)[len(calls) // 2] <= 4
+    print("[OK] Retained rendering test passed")
+
+
+def test_retained_without_atlas():
+    """スプライトアトラスなし（描画命令で描く場合）でも一致することをテスト"""
+    print("Running retained rendering without atlas test...")
+    _run_and_compare(500, seed=8, use_atlas=False)
+    print("[OK] Retained rendering without atlas test passed")
+
+
+def test_static_layer_cache():
+    """変化しない部分のキャッシュがデバッグモードとレイアウトの変更時だけ作り直されることをテスト"""
+    print("Running static layer cache test...")
+    mock_pyxel = MockPyxel(0)
+    cached = ImageBackend()
+    immediate = ImageBackend()
+    try:
+        with mock.patch('src.game.pyxel', mock_pyxel), \
+                mock.patch('src.input_handler.pyxel', mock_pyxel), \
+                mock.patch('src.game_controller.pyxel', mock_pyxel):
+            game = KiroKiroGame.__new__(KiroKiroGame)
+            game.initialize_game()
+            ui = game.ui_renderer
+            set_backend(cached)
+            layer = ui.get_static_layer(False, game.playfield)
+            assert ui.get_static_layer(False, game.playfield) is layer
+            debug_layer = ui.get_static_layer(True, game.playfield)
+            assert debug_layer is not layer
+            ui.score_area_y += 10
+            assert ui.get_static_layer(True, game.playfield) is not debug_layer
+
+            # キャッシュを使う場合は1回のbltで描く
+            cached.calls = 0
+            ui.draw_static_layer(True, game.playfield)
+            assert cached.calls == 1
+
+            # キャッシュの有無で描画結果が変わらない
+            for debug_mode in (False, True, False):
+                game.debug_mode = debug_mode
+                ui.cache_static_layer = True
+                _draw_with(cached, game.draw_all)
+                ui.cache_static_layer = False
+                _draw_with(immediate, game.draw_all)
+                assert cached.pixels() == immediate.pixels()
+    finally:
+        set_backend(None)
+    print("[OK] Static layer cache test passed")
+
+
+if __name__ == "__main__":
+    test_retained_matches_full_redraw()
+    test_retained_without_atlas()
+    test_static_layer_cache()
+    print("Retained renderer test passed! [OK]")
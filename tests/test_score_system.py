@@ -5,13 +5,85 @@ score_systemのテスト
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import pytest
+
+from src.score_manager import ScoreManager
+
+
 def test_score_system_basic():
     """score_systemの基本テスト"""
     print("Running score_system basic test...")
     print("[OK] score_system basic test passed")
 
+
+def test_score_table_matches_formula():
+    """スコア表による計算が計算式と一致することをテスト"""
+    print("Running score table test...")
+    manager = ScoreManager()
+    for cleared_count in range(-1, 80):
+        for chain_level in range(-2, 15):
+            for color_count in range(-1, 8):
+                expected = manager._compute_score(cleared_count, chain_level, color_count)
+                assert manager.calculate_score(cleared_count, chain_level, color_count) == expected
+
+    # 設定を変更した場合は表を作り直す
+    manager.chain_bonus_multiplier = [1, 4, 8]
+    manager.color_bonus = {1: 0, 2: 5}
+    manager.rebuild_score_tables()
+    assert manager.calculate_score(10, 5, 2) == manager._compute_score(10, 5, 2) == 10 * 10 * 8 * 18
+
+    # 同じ設定のインスタンスは表を共有する
+    assert ScoreManager()._score_table is ScoreManager()._score_table
+    assert manager._score_table is not ScoreManager()._score_table
+    print("[OK] Score table test passed")
+
+
+def test_score_table_follows_setting_changes():
+    """公開設定を書き換えるとrebuild_score_tablesを呼ばなくてもスコアに反映されることをテスト"""
+    print("Running score setting change test...")
+    manager = ScoreManager()
+    assert manager.calculate_score(10, 2, 1) == 10 * 10 * 8 * 13
+
+    manager.base_score_per_puyo = 20
+    assert manager.calculate_score(10, 2, 1) == manager._compute_score(10, 2, 1) == 20 * 10 * 8 * 13
+
+    # リストと辞書をその場で書き換えた場合も検出する
+    manager.chain_bonus_multiplier[1] = 4
+    manager.color_bonus[1] = 2
+    assert manager.calculate_score(10, 2, 1) == 20 * 10 * 4 * 15
+    assert manager.get_settings() != ScoreManager().get_settings()
+
+    # 他のインスタンスと共有している表は書き換えない
+    assert ScoreManager().calculate_score(10, 2, 1) == 10 * 10 * 8 * 13
+
+    np = pytest.importorskip("numpy")
+    manager.chain_bonus_multiplier = [1, 2]
+    assert manager.score_batch(np.array([10]), np.array([2]), np.array([1])).tolist() == [
+        manager.calculate_score(10, 2, 1)]
+    print("[OK] Score setting change test passed")
+
+
+def test_score_batch_matches_scalar():
+    """score_batchがcalculate_scoreと同じ結果になることをテスト"""
+    print("Running score batch test...")
+    np = pytest.importorskip("numpy")
+    manager = ScoreManager()
+    rng = random.Random(0)
+    steps = [(rng.randint(-2, 100), rng.randint(-2, 20), rng.randint(-1, 8)) for _ in range(5000)]
+    cleared_counts, chain_levels, color_counts = (np.array(values) for values in zip(*steps))
+
+    scores = manager.score_batch(cleared_counts, chain_levels, color_counts)
+    assert scores.dtype == np.int64
+    assert scores.tolist() == [manager.calculate_score(*step) for step in steps]
+    print("[OK] Score batch test passed")
+
+
 if __name__ == "__main__":
     test_score_system_basic()
+    test_score_table_matches_formula()
+    test_score_table_follows_setting_changes()
+    test_score_batch_matches_scalar()
     print("score_system test passed! [OK]")
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+シミュレーション時計のテスト
+"""
+
+import sys
+import os
+import unittest.mock as mock
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.sim_clock import SimulationClock
+from src.headless import HeadlessGame
+from src.puyo_manager import PuyoManager
+from src.game import KiroKiroGame
+
+
+class MockPyxel:
+    """Pyxelのモック - キー入力なし"""
+    
+    KEY_LEFT = 'LEFT'
+    KEY_RIGHT = 'RIGHT'
+    KEY_UP = 'UP'
+    KEY_DOWN = 'DOWN'
+    KEY_X = 'X'
+    KEY_Z = 'Z'
+    KEY_Q = 'Q'
+    KEY_ESCAPE = 'ESCAPE'
+    KEY_G = 'G'
+    KEY_C = 'C'
+    KEY_E = 'E'
+    KEY_A = 'A'
+    KEY_R = 'R'
+    KEY_RETURN = 'RETURN'
+    KEY_SPACE = 'SPACE'
+    
+    def btn(self, key):
+        return False
+    
+    def btnp(self, key):
+        return False
+    
+    def quit(self):
+        pass
+
+
+def test_clock_tick_accounting():
+    """時間倍率に応じたティック数の計算をテスト"""
+    print("Running clock tick accounting test...")
+    clock = SimulationClock(time_scale=2.5)
+    assert [clock.ticks_for_frame() for _ in range(4)] == [2, 3, 2, 3]
+
+    clock.set_time_scale(0.5)
+    assert [clock.ticks_for_frame() for _ in range(4)] == [0, 1, 0, 1]
+
+    clock = SimulationClock(fps=30, time_scale=1000)
+    assert clock.ticks_for_elapsed(0.1) == 3000
+    clock.max_ticks_per_frame = 500
+    assert clock.ticks_for_frame() == 500
+
+    ticks = []
+    assert clock.run(lambda index: ticks.append(index) or index < 2, 10) == 3
+    assert ticks == [0, 1, 2]
+    assert clock.tick_count == 3
+    assert clock.get_simulated_seconds() == 0.1
+    print("[OK] Clock tick accounting test passed")
+
+
+def _play_hard_drops(skip_waits, pair_count=40):
+    """同じ手順でぷよペアを置き続け、結果と消費ティック数を返す"""
+    game = HeadlessGame(puyo_manager=PuyoManager(seed=1234),
+                        clock=SimulationClock(skip_waits=skip_waits))
+    systems = game.game_systems
+    placed = 0
+    while placed < pair_count and not game.game_over:
+        pair = systems.current_falling_pair
+        if not systems.is_systems_active() and pair is not None:
+            # 列を順番に変えて置く
+            target = [0, 5, 1, 4, 2, 3][placed % 6]
+            direction = 1 if target > pair.get_position()[0] else -1
+            while pair.get_position()[0] != target and game.playfield.can_move_puyo_pair(pair, direction, 0):
+                pair.move(direction, 0)
+            systems.hard_drop()
+            placed += 1
+        game.step()
+    colors = [[puyo.get_color() if puyo else 0 for puyo in row] for row in game.playfield.grid]
+    return game.get_score(), colors, placed, game.frame_count
+
+
+def test_skip_waits_keeps_results():
+    """待ち時間を飛ばしても同じ手順なら結果が変わらないことをテスト"""
+    print("Running skip waits equivalence test...")
+    score, colors, placed, frames = _play_hard_drops(skip_waits=False)
+    fast_score, fast_colors, fast_placed, fast_frames = _play_hard_drops(skip_waits=True)
+
+    assert (fast_score, fast_colors, fast_placed) == (score, colors, placed)
+    assert score > 0
+    assert fast_frames < frames
+    print("[OK] Skip waits equivalence test passed")
+
+
+def test_game_update_runs_scaled_ticks():
+    """KiroKiroGameが時間倍率に応じて1フレームに複数ティックを進めることをテスト"""
+    print("Running scaled game update test...")
+    mock_pyxel = MockPyxel()
+    with mock.patch('src.game.pyxel', mock_pyxel), \
+            mock.patch('src.input_handler.pyxel', mock_pyxel), \
+            mock.patch('src.game_controller.pyxel', mock_pyxel):
+        game = KiroKiroGame.__new__(KiroKiroGame)
+        game.initialize_game()
+        game.clock.set_time_scale(100)
+        pair = game.game_systems.current_falling_pair
+
+        game.update()
+        assert game.frame_count == 100
+        # 100ティックで通常落下（40ティック間隔）が2回起こる
+        assert pair.get_position()[1] == 2
+        # ティックごとに入力ソースを差し替えない
+        assert game.game_systems.input_handler is game.tick_input
+        assert game.tick_input.source is game.input_handler
+    print("[OK] Scaled game update test passed")
+
+
+class KeyPyxel(MockPyxel):
+    """Pyxelのモック - 指定したキーを押している"""
+    
+    def __init__(self):
+        self.held = set()  # 押し続けているキー
+        self.pressed = set()  # このフレームで押したキー
+    
+    def btn(self, key):
+        return key in self.held or key in self.pressed
+    
+    def btnp(self, key):
+        return key in self.pressed
+
+
+def _start_scaled_game(mock_pyxel, time_scale):
+    game = KiroKiroGame.__new__(KiroKiroGame)
+    game.initialize_game()
+    game.clock.set_time_scale(time_scale)
+    return game
+
+
+def test_slow_motion_keeps_key_presses():
+    """ティックを進めないフレームで押したキーが次に進めるティックで反映されることをテスト"""
+    print("Running slow motion input test...")
+    mock_pyxel = KeyPyxel()
+    with mock.patch('src.game.pyxel', mock_pyxel), \
+            mock.patch('src.input_handler.pyxel', mock_pyxel), \
+            mock.patch('src.game_controller.pyxel', mock_pyxel):
+        game = _start_scaled_game(mock_pyxel, 0.5)
+        pair = game.game_systems.current_falling_pair
+        start_x = pair.get_position()[0]
+
+        # 0.5倍速では1フレーム目はティックを進めない
+        mock_pyxel.pressed = {mock_pyxel.KEY_LEFT}
+        game.update()
+        assert game.frame_count == 0
+        mock_pyxel.pressed = set()
+        game.update()
+        assert game.frame_count == 1
+        assert pair.get_position()[0] == start_x - 1
+
+        # 反映した押下は次のティックで繰り返さない
+        game.update()
+        game.update()
+        assert game.frame_count == 2
+        assert pair.get_position()[0] == start_x - 1
+    print("[OK] Slow motion input test passed")
+
+
+def test_fast_forward_applies_held_keys_every_tick():
+    """早送り中も押し続けている高速落下キーが全てのティックに反映されることをテスト"""
+    print("Running fast forward held key test...")
+    mock_pyxel = KeyPyxel()
+    with mock.patch('src.game.pyxel', mock_pyxel), \
+            mock.patch('src.input_handler.pyxel', mock_pyxel), \
+            mock.patch('src.game_controller.pyxel', mock_pyxel):
+        game = _start_scaled_game(mock_pyxel, 4)
+        pair = game.game_systems.current_falling_pair
+        start_y = pair.get_position()[1]
+
+        mock_pyxel.held = {mock_pyxel.KEY_DOWN}
+        game.update()
+        assert game.frame_count == 4
+        # 高速落下の間隔は1ティックなので、4ティックの全てで1段ずつ落ちる
+        assert pair.get_position()[1] == start_y + 4
+    print("[OK] Fast forward held key test passed")
+
+
+if __name__ == "__main__":
+    test_clock_tick_accounting()
+    test_skip_waits_keeps_results()
+    test_game_update_runs_scaled_ticks()
+    test_slow_motion_keeps_key_presses()
+    test_fast_forward_applies_held_keys_every_tick()
+    print("Simulation clock test passed! [OK]")
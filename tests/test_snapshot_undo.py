@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+盤面のスナップショットとUndoログのテスト
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.playfield import PlayField
+from src.bitboard_playfield import BitboardPlayField
+from src.puyo import Puyo
+
+
+def _colors(playfield):
+    """盤面を色コードの2次元リストに変換"""
+    return [[puyo.get_color() if puyo else 0 for puyo in row] for row in playfield.grid]
+
+
+def _fill_random(playfield, rng):
+    """ランダムな盤面を作成"""
+    for x in range(playfield.get_width()):
+        for y in range(playfield.get_height() - rng.randint(0, 8), playfield.get_height()):
+            playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4, 5])))
+
+
+def test_snapshot_and_restore():
+    """スナップショットから盤面・ハッシュが復元されることをテスト"""
+    print("Running snapshot restore test...")
+    rng = random.Random(5)
+    for playfield in (PlayField(), BitboardPlayField()):
+        _fill_random(playfield, rng)
+        snapshot = playfield.snapshot()
+        expected_colors = _colors(playfield)
+        expected_hash = playfield.get_hash()
+
+        assert isinstance(snapshot, bytes)
+        assert len(snapshot) == 72
+
+        playfield.resolve_chain()
+        playfield.place_puyo(0, 0, Puyo(2))
+        playfield.restore(snapshot)
+
+        assert _colors(playfield) == expected_colors
+        assert playfield.get_hash() == expected_hash
+        assert playfield.snapshot() == snapshot
+        for x, y, puyo in playfield.get_all_puyos():
+            assert puyo.get_position() == (x, y)
+    print("[OK] Snapshot restore test passed")
+
+
+def test_undo_restores_field():
+    """Undoログで配置・消去・重力の書き換えが取り消されることをテスト"""
+    print("Running undo test...")
+    rng = random.Random(9)
+    for playfield in (PlayField(), BitboardPlayField()):
+        _fill_random(playfield, rng)
+        original_puyos = playfield.get_all_puyos()
+        expected_colors = _colors(playfield)
+        expected_hash = playfield.get_hash()
+
+        mark = playfield.mark_undo()
+        playfield.place_puyo(3, 0, Puyo(1))
+        inner_mark = playfield.mark_undo()
+        playfield.resolve_chain()
+        playfield.undo(inner_mark)
+        assert playfield.get_puyo(3, 0).get_color() == 1
+
+        playfield.undo(mark)
+        assert _colors(playfield) == expected_colors
+        assert playfield.get_hash() == expected_hash
+        # 元のぷよオブジェクトが元の位置に戻る
+        assert playfield.get_all_puyos() == original_puyos
+        for x, y, puyo in original_puyos:
+            assert puyo.get_position() == (x, y)
+        assert playfield.count_connected_puyos(0, 11) == PlayField.count_connected_puyos(playfield, 0, 11)
+
+        playfield.clear_undo_log()
+        playfield.place_puyo(3, 0, Puyo(1))
+        playfield.undo(0)
+        assert playfield.get_puyo(3, 0) is not None
+    print("[OK] Undo test passed")
+
+
+if __name__ == "__main__":
+    test_snapshot_and_restore()
+    test_undo_restores_field()
+    print("Snapshot and undo test passed! [OK]")
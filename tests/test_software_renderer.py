@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+ソフトウェア描画のテスト
+Requirements: 1.1, 1.2 - ゲーム画面・プレイフィールドとぷよの表示
+"""
+
+import sys
+import os
+import io
+import random
+import time
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+import pyxel
+
+from src.headless import HeadlessGame, PuyoManager
+from src.input_source import ACTIONS, ScriptedInputSource
+from src.replay import ReplayRecorder
+from src.software_renderer import PALETTE, SoftwareImage, SoftwareRenderer, render_replay_frames
+
+
+class ImageBackend:
+    """pyxel.Imageを画面とする描画バックエンド（ウィンドウなしで画素を確認する）"""
+    
+    Image = pyxel.Image
+    
+    def __init__(self, width=320, height=380):
+        self.width = width
+        self.height = height
+        self.screen = pyxel.Image(width, height)
+        self.images = [pyxel.Image(256, 256) for _ in range(3)]
+    
+    def __getattr__(self, name):
+        return getattr(self.screen, name)
+    
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        if isinstance(img, int):
+            img = self.images[img]
+        self.screen.blt(x, y, img, u, v, w, h, colkey)
+    
+    def frame(self):
+        return _pixels(self.screen, self.width, self.height)
+
+
+class DropPlayer(ScriptedInputSource):
+    """ランダムに動かしながら高速落下を多用する入力ソース（早くゲームオーバーになる）"""
+    
+    def __init__(self, seed):
+        super().__init__()
+        self.rng = random.Random(seed)
+    
+    def update(self):
+        if self.rng.random() < 0.5:
+            self.set_actions(self.rng.choice(ACTIONS + ('fast_drop',) * 4))
+        else:
+            self.clear_actions()
+
+
+def _pixels(image, width, height):
+    return np.frombuffer(bytes(image.data_ptr()), dtype=np.uint8).reshape(height, width)
+
+
+def _record_game(seed, max_frames):
+    """高速落下の多い操作でゲームを記録する"""
+    puyo_manager = PuyoManager()
+    recorder = ReplayRecorder(DropPlayer(seed), puyo_manager, seed=seed)
+    game = HeadlessGame(input_source=recorder, puyo_manager=puyo_manager)
+    game.run(max_frames)
+    return game, recorder.finish(game.get_score(), game.playfield.get_hash())
+
+
+def test_primitives_match_pyxel():
+    """描画命令の結果がpyxel.Imageと画素単位で一致することをテスト"""
+    print("Running primitives match pyxel test...")
+    rng = random.Random(1)
+    width, height = 96, 80
+    expected = pyxel.Image(width, height)
+    actual = SoftwareImage(width, height)
+    source_expected = pyxel.Image(64, 64)
+    source_actual = SoftwareImage(64, 64)
+    for y in range(64):
+        for x in range(64):
+            source_expected.pset(x, y, (x * 7 + y * 3) % 16)
+            source_actual.pset(x, y, (x * 7 + y * 3) % 16)
+    
+    def coordinate(low=-20, high=110):
+        return rng.randint(low, high)
+    
+    for _ in range(5000):
+        command = rng.choice(['line', 'rect', 'rectb', 'circ', 'circb', 'text', 'blt', 'clip', 'pset'])
+        col = rng.randrange(16)
+        if command == 'line':
+            args = (coordinate(), coordinate(), coordinate(), coordinate(), col)
+        elif command in ('rect', 'rectb'):
+            args = (coordinate(), coordinate(), coordinate(-5, 60), coordinate(-5, 60), col)
+        elif command in ('circ', 'circb'):
+            args = (coordinate(), coordinate(), coordinate(0, 40), col)
+        elif command == 'text':
+            s = ''.join(rng.choice('AZaz09!?~ \n:\x7fあ') for _ in range(rng.randint(0, 8)))
+            args = (coordinate(), coordinate(), s, col)
+        elif command == 'pset':
+            args = (coordinate() + 0.5, coordinate() - 0.5, col)
+        elif command == 'clip':
+            args = () if rng.random() < 0.3 else (coordinate(), coordinate(), coordinate(0, 90), coordinate(0, 90))
+        else:
+            colkey = rng.choice([None, 0, 3])
+            rect = (coordinate(), coordinate(), coordinate(-10, 70), coordinate(-10, 70),
+                    coordinate(-40, 40), coordinate(-40, 40))
+            expected.blt(*rect[:2], source_expected, *rect[2:], *([] if colkey is None else [colkey]))
+            actual.blt(*rect[:2], source_actual, *rect[2:], colkey)
+            assert np.array_equal(_pixels(expected, width, height), actual.data), (command, rect, colkey)
+            continue
+        getattr(expected, command)(*args)
+        getattr(actual, command)(*args)
+        assert np.array_equal(_pixels(expected, width, height), actual.data), (command, args)
+    print("[OK] Primitives match pyxel test passed")
+
+
+def test_replay_frames_match_pyxel():
+    """リプレイの全フレームがpyxelで描いた画面と一致し、最終スコア画面まで描かれることをテスト"""
+    print("Running replay frames match pyxel test...")
+    game, replay = _record_game(5, 6000)
+    assert game.game_over
+    
+    frames = 0
+    previous = None
+    for software, reference in zip(render_replay_frames(replay), render_replay_frames(replay, ImageBackend())):
+        assert np.array_equal(software.frame(), reference.frame()), f"frame {frames} differs"
+        previous, last = software.frame().copy(), previous
+        frames += 1
+    # ゲームオーバーになったフレーム（最終スコア画面）まで描く
+    assert frames == game.frame_count
+    assert not np.array_equal(previous, last)
+    print("[OK] Replay frames match pyxel test passed")
+
+
+def test_write_frame():
+    """画面をRGBと色番号の生データとして書き出せることをテスト"""
+    print("Running write frame test...")
+    renderer = SoftwareRenderer(8, 4)
+    renderer.cls(1)
+    renderer.pset(2, 3, 8)
+    
+    stream = io.BytesIO()
+    renderer.write_frame(stream)
+    rgb = np.frombuffer(stream.getvalue(), dtype=np.uint8).reshape(4, 8, 3)
+    assert tuple(rgb[0, 0]) == ((PALETTE[1] >> 16) & 0xff, (PALETTE[1] >> 8) & 0xff, PALETTE[1] & 0xff)
+    assert tuple(rgb[3, 2]) == (0xd4, 0x18, 0x6c)
+    
+    stream = io.BytesIO()
+    renderer.write_frame(stream, rgb=False)
+    assert stream.getvalue()[3 * 8 + 2] == 8
+    assert len(stream.getvalue()) == 8 * 4
+    print("[OK] Write frame test passed")
+
+
+def test_faster_than_real_time():
+    """RGBへの変換を含めて実時間（30FPS）より速く描画できることをテスト"""
+    print("Running faster than real time test...")
+    _, replay = _record_game(2, 900)
+    stream = io.BytesIO()
+    start = time.perf_counter()
+    frames = 0
+    for renderer in render_replay_frames(replay):
+        renderer.write_frame(stream)
+        frames += 1
+    elapsed = time.perf_counter() - start
+    assert frames / elapsed > 30
+    print(f"[OK] Faster than real time test passed ({frames / elapsed:.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    test_primitives_match_pyxel()
+    test_replay_frames_match_pyxel()
+    test_write_frame()
+    test_faster_than_real_time()
+    print("Software renderer test passed! [OK]")
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+スプライトアトラスのテスト
+Requirements: 5.1 - システムは異なる色で区別可能なぷよを描画する
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pyxel
+
+from src.graphics import set_backend
+from src.playfield import PlayField
+from src.puyo import Puyo
+from src.sprite_atlas import (
+    build_sprite_atlas, clear_sprite_atlas, draw_puyo_shape, get_sprite_atlas,
+    PUYO_DRAW_COLORS, PUYO_SIZE, SMALL_PUYO_SIZE
+)
+
+
+class ImageBackend:
+    """pyxel.Imageに描画する描画バックエンド（ウィンドウなしで画素を確認する）"""
+
+    def __init__(self):
+        self.screen = pyxel.Image(160, 320)
+        self.images = [pyxel.Image(256, 256) for _ in range(3)]
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.screen, name)
+
+        def call(*args):
+            self.calls.append(name)
+            return method(*args)
+
+        return call
+
+    def blt(self, x, y, img, u, v, w, h, colkey=None):
+        self.calls.append('blt')
+        self.screen.blt(x, y, self.images[img], u, v, w, h, colkey)
+
+    def grab(self, x, y, w, h):
+        return [[self.screen.pget(x + i, y + j) for i in range(w)] for j in range(h)]
+
+
+def test_sprites_match_primitives():
+    """アトラスのbltが描画命令と同じ画素になることをテスト"""
+    print("Running sprites match primitives test...")
+    backend = ImageBackend()
+    set_backend(backend)
+    try:
+        atlas = build_sprite_atlas()
+        assert get_sprite_atlas() is atlas
+        for color in PUYO_DRAW_COLORS:
+            for small, size in ((False, PUYO_SIZE), (True, SMALL_PUYO_SIZE)):
+                backend.screen.cls(1)
+                draw_puyo_shape(backend.screen, 8, 8, color, small)
+                expected = backend.grab(8, 8, size, size)
+
+                backend.screen.cls(1)
+                puyo = Puyo(color)
+                if small:
+                    puyo.draw_small(8, 8)
+                else:
+                    puyo.draw(8, 8)
+                assert backend.grab(8, 8, size, size) == expected, (color, small)
+    finally:
+        clear_sprite_atlas()
+        set_backend(None)
+    print("[OK] Sprites match primitives test passed")
+
+
+def test_playfield_draw_uses_one_blt_per_cell():
+    """盤面の描画がセルごとに1回のbltになり、描画結果が変わらないことをテスト"""
+    print("Running playfield draw test...")
+    backend = ImageBackend()
+    set_backend(backend)
+    try:
+        playfield = PlayField()
+        for x in range(playfield.width):
+            for y in range(8, playfield.height):
+                playfield.place_puyo(x, y, Puyo(1 + (x + y) % 5))
+
+        playfield.draw(4, 4)
+        expected = backend.grab(4, 4, 144, 288)
+
+        build_sprite_atlas()
+        backend.calls = []
+        playfield.draw(4, 4)
+        assert backend.grab(4, 4, 144, 288) == expected
+        assert backend.calls.count('blt') == playfield.width * 4
+        assert len(backend.calls) == playfield.width * 4 + 2  # 枠と背景
+
+        # 描画バックエンドを差し替えた場合は描画命令に戻る
+        set_backend(ImageBackend())
+        assert get_sprite_atlas() is None
+        playfield.draw(4, 4)
+    finally:
+        clear_sprite_atlas()
+        set_backend(None)
+    print("[OK] Playfield draw test passed")
+
+
+if __name__ == "__main__":
+    test_sprites_match_primitives()
+    test_playfield_draw_uses_one_blt_per_cell()
+    print("Sprite atlas test passed! [OK]")
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Zobristハッシュと置換表のテスト
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.playfield import PlayField
+from src.bitboard_playfield import BitboardPlayField
+from src.puyo import Puyo
+from src.score_manager import ScoreManager
+from src.transposition_table import TranspositionTable, resolve_chain_cached
+
+
+def _colors(playfield):
+    """盤面を色コードの2次元リストに変換"""
+    return [[puyo.get_color() if puyo else 0 for puyo in row] for row in playfield.grid]
+
+
+def _build_two_chain_field(playfield):
+    """赤4つの消去で緑が落ちて2連鎖になる盤面を作成"""
+    for y in range(8, 12):
+        playfield.place_puyo(0, y, Puyo(1))
+    playfield.place_puyo(0, 7, Puyo(3))
+    for y in range(9, 12):
+        playfield.place_puyo(1, y, Puyo(3))
+
+
+def test_incremental_hash_matches_full_hash():
+    """差分更新したハッシュが全体から計算したハッシュと一致することをテスト"""
+    print("Running incremental hash test...")
+    rng = random.Random(11)
+    for playfield in (PlayField(), BitboardPlayField()):
+        assert playfield.get_hash() == 0
+        for _ in range(2000):
+            x, y = rng.randrange(6), rng.randrange(12)
+            operation = rng.random()
+            if operation < 0.6:
+                playfield.place_puyo(x, y, Puyo(rng.choice([1, 2, 3, 4, 5])))
+            elif operation < 0.8:
+                playfield.remove_puyo(x, y)
+            elif operation < 0.9:
+                playfield.apply_gravity()
+            else:
+                playfield.process_puyo_elimination()
+            assert playfield.get_hash() == playfield.compute_hash()
+        playfield.clear()
+        assert playfield.get_hash() == 0
+    print("[OK] Incremental hash test passed")
+
+
+def test_hash_is_independent_of_move_order():
+    """同じ配置であれば手順によらず同じハッシュになることをテスト"""
+    print("Running hash move order test...")
+    first = PlayField()
+    first.place_puyo(0, 11, Puyo(1))
+    first.place_puyo(1, 11, Puyo(2))
+
+    second = PlayField()
+    second.place_puyo(1, 5, Puyo(2))
+    second.place_puyo(0, 11, Puyo(1))
+    second.apply_gravity()
+
+    assert first.get_hash() == second.get_hash()
+
+    # 色が異なれば別のハッシュ
+    third = PlayField()
+    third.place_puyo(0, 11, Puyo(2))
+    third.place_puyo(1, 11, Puyo(1))
+    assert third.get_hash() != first.get_hash()
+    print("[OK] Hash move order test passed")
+
+
+def test_transposition_table_eviction_and_stats():
+    """置換表の上限による追い出しと統計情報をテスト"""
+    print("Running transposition table eviction test...")
+    evicted = []
+    table = TranspositionTable(max_entries=2, on_evict=lambda key, value: evicted.append(key))
+    table.store(1, 'a')
+    table.store(2, 'b')
+    assert table.get(1) == 'a'  # 1を最新にする
+    table.store(3, 'c')
+
+    assert evicted == [2]
+    assert 1 in table and 3 in table and 2 not in table
+    assert table.get(2) is None
+    stats = table.get_stats()
+    assert stats == {'entries': 2, 'hits': 1, 'misses': 1, 'evictions': 1, 'hit_rate': 0.5}
+    print("[OK] Transposition table eviction test passed")
+
+
+def test_resolve_chain_cached_skips_repeated_resolution():
+    """解決済みの盤面は連鎖処理を再実行せずに同じ結果を返すことをテスト"""
+    print("Running cached chain resolution test...")
+    table = TranspositionTable()
+    score_manager = ScoreManager()
+
+    first = PlayField()
+    _build_two_chain_field(first)
+    steps = resolve_chain_cached(first, table, score_manager)
+    assert len(steps) == 2
+
+    second = PlayField()
+    _build_two_chain_field(second)
+    calls = []
+    original_resolve = second.resolve_chain
+    second.resolve_chain = lambda *args: calls.append(args) or original_resolve(*args)
+
+    cached_steps = resolve_chain_cached(second, table, score_manager)
+    assert calls == []
+    assert cached_steps == steps
+    assert _colors(second) == _colors(first)
+    assert second.get_hash() == first.get_hash()
+
+    # 評価値も盤面ハッシュをキーにして保存できる
+    table.store(('eval', second.get_hash()), 123)
+    assert table.get(('eval', first.get_hash())) == 123
+    print("[OK] Cached chain resolution test passed")
+
+
+def test_resolve_chain_cached_entries_are_isolated():
+    """スコア設定ごとに別のエントリになり、返した記録の変更が置換表に影響しないことをテスト"""
+    print("Running cached chain isolation test...")
+    table = TranspositionTable()
+    score_manager = ScoreManager()
+
+    first = PlayField()
+    _build_two_chain_field(first)
+    steps = resolve_chain_cached(first, table, score_manager)
+    expected_score = [step['score'] for step in steps]
+    steps[0]['groups'].clear()
+    steps.append('garbage')
+
+    # スコア設定が異なる場合はキャッシュを使わない
+    doubled = ScoreManager()
+    doubled.base_score_per_puyo *= 2
+    second = PlayField()
+    _build_two_chain_field(second)
+    doubled_steps = resolve_chain_cached(second, table, doubled)
+    assert [step['score'] for step in doubled_steps] == [score * 2 for score in expected_score]
+
+    # 同じ設定では最初の結果がそのまま返る
+    third = PlayField(flyweight=True)
+    _build_two_chain_field(third)
+    cached_steps = resolve_chain_cached(third, table, ScoreManager())
+    assert len(cached_steps) == 2
+    assert [step['score'] for step in cached_steps] == expected_score
+    assert len(cached_steps[0]['groups']) == 1
+    cached_steps[0]['colors'].append(4)
+    fourth = PlayField()
+    _build_two_chain_field(fourth)
+    assert resolve_chain_cached(fourth, table, ScoreManager())[0]['colors'] == [1]
+
+    # 盤面はsnapshotから戻す（フライウェイトの盤面には共有ぷよを格納する）
+    assert _colors(third) == _colors(first)
+    assert third.get_hash() == first.get_hash()
+    assert all(puyo is Puyo.shared(puyo.get_color()) for _, _, puyo in third.get_all_puyos())
+    print("[OK] Cached chain isolation test passed")
+
+
+if __name__ == "__main__":
+    test_incremental_hash_matches_full_hash()
+    test_hash_is_independent_of_move_order()
+    test_transposition_table_eviction_and_stats()
+    test_resolve_chain_cached_skips_repeated_resolution()
+    test_resolve_chain_cached_entries_are_isolated()
+    print("Transposition table test passed! [OK]")